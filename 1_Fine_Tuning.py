@@ -1,6 +1,10 @@
 from manim import *
 import numpy as np
 import random
+from mesh_lod import lod_dot3d, lod_surface
+from batched_points import ClusterTransform
+from reactive_mobjects import ReactiveDot, ReactiveLine, ReactiveTangentLine
+from compiled_animation import CompiledAnimation
 
 # ==========================================
 # CONFIGURATION & THEME
@@ -102,24 +106,24 @@ class Scene02_LearningAsGraph(Scene):
         current_w = ValueTracker(initial_w)
         
         # The dot representing the model's current state
-        model_dot = always_redraw(lambda: Dot(
-            point=axes.coords_to_point(current_w.get_value(), current_w.get_value()**2),
+        # Reactive mobjects rewrite their points in place instead of rebuilding every frame
+        model_dot = ReactiveDot(
+            lambda w: axes.coords_to_point(w, w**2), [current_w],
             color=ACCENT_COLOR, radius=0.12
-        ))
+        )
 
         # Visualizing Error as Distance (Vertical line to x-axis)
-        error_line = always_redraw(lambda: Line(
-            start=axes.coords_to_point(current_w.get_value(), 0),
-            end=axes.coords_to_point(current_w.get_value(), current_w.get_value()**2),
-            color=ACCENT_COLOR, stroke_opacity=0.5, stroke_width=3, dashed_stroke_config={"dash_length": 0.1}
-        ))
+        error_line = ReactiveLine(
+            lambda w: (axes.coords_to_point(w, 0), axes.coords_to_point(w, w**2)), [current_w],
+            color=ACCENT_COLOR, stroke_opacity=0.5, stroke_width=3
+        )
 
         self.play(FadeIn(model_dot), Create(error_line))
 
         # Visualizing the Slope (Gradient)
-        tangent_line = always_redraw(lambda: axes.get_tangent_line(
-            current_w.get_value(), error_curve, length=3, color=GRAY, stroke_width=2
-        ))
+        tangent_line = ReactiveTangentLine(
+            axes, lambda x: x**2, current_w, length=3, color=GRAY, stroke_width=2
+        )
         
         slope_label = MathTex(r"\text{slope} = \frac{d(\text{error})}{d(\text{weight})}", color=TEXT_COLOR).to_corner(UR).shift(DOWN)
         
@@ -253,11 +257,11 @@ class Scene04_CNNConvolution(Scene):
         self.play(Create(sliding_box))
         self.wait(0.5)
 
-        # Animate sliding one step right
-        self.play(sliding_box.animate.shift(RIGHT * (input_rows[0][1].get_center()[0] - input_rows[0][0].get_center()[0])), run_time=1)
+        # Animate sliding one step right (fixed target, so it is played from a pre-sampled timeline)
+        self.play(CompiledAnimation(sliding_box.animate.shift(RIGHT * (input_rows[0][1].get_center()[0] - input_rows[0][0].get_center()[0]))), run_time=1)
         self.wait(0.5)
         # Animate sliding one step down
-        self.play(sliding_box.animate.shift(DOWN * (input_rows[0][0].get_center()[1] - input_rows[1][0].get_center()[1])), run_time=1)
+        self.play(CompiledAnimation(sliding_box.animate.shift(DOWN * (input_rows[0][0].get_center()[1] - input_rows[1][0].get_center()[1]))), run_time=1)
         self.wait(1)
         
         desc = Text("Basic Algebra: Detects edges, textures, shapes.", color=ACCENT_COLOR, font_size=24).next_to(formula, UP)
@@ -544,12 +548,12 @@ class Scene08_Summary3D(ThreeDScene):
         
         # Happy dogs (Primary color) - loosely centered
         happy_points_start = VGroup(*[
-            Dot3D(point=[np.random.normal(0.5, 1), np.random.normal(0.5, 1), np.random.normal(0.5, 1)], color=PRIMARY_COLOR, radius=0.1) 
+            lod_dot3d(point=[np.random.normal(0.5, 1), np.random.normal(0.5, 1), np.random.normal(0.5, 1)], color=PRIMARY_COLOR, radius=0.1) 
             for _ in range(20)
         ])
         # Sad dogs (Gray color) - loosely centered, overlapping
         sad_points_start = VGroup(*[
-            Dot3D(point=[np.random.normal(-0.5, 1), np.random.normal(-0.5, 1), np.random.normal(-0.5, 1)], color=GRAY, radius=0.1) 
+            lod_dot3d(point=[np.random.normal(-0.5, 1), np.random.normal(-0.5, 1), np.random.normal(-0.5, 1)], color=GRAY, radius=0.1) 
             for _ in range(20)
         ])
         
@@ -567,12 +571,12 @@ class Scene08_Summary3D(ThreeDScene):
         # Data Points - State 2: Separated (After Fine-tuning)
         # Happy dogs move to positive quadrant
         happy_points_end = VGroup(*[
-            Dot3D(point=[np.random.normal(2, 0.5), np.random.normal(2, 0.5), np.random.normal(2, 0.5)], color=PRIMARY_COLOR, radius=0.1) 
+            lod_dot3d(point=[np.random.normal(2, 0.5), np.random.normal(2, 0.5), np.random.normal(2, 0.5)], color=PRIMARY_COLOR, radius=0.1) 
             for _ in range(20)
         ])
         # Sad dogs move to negative quadrant
         sad_points_end = VGroup(*[
-            Dot3D(point=[np.random.normal(-2, 0.5), np.random.normal(-2, 0.5), np.random.normal(-2, 0.5)], color=GRAY, radius=0.1) 
+            lod_dot3d(point=[np.random.normal(-2, 0.5), np.random.normal(-2, 0.5), np.random.normal(-2, 0.5)], color=GRAY, radius=0.1) 
             for _ in range(20)
         ])
 
@@ -581,16 +585,18 @@ class Scene08_Summary3D(ThreeDScene):
         label_after.move_to(label_before)
 
         # Animate transition and camera rotation simultaneously
+        # ClusterTransform moves each whole cluster as one stacked point array
         self.play(
-            Transform(happy_points_start, happy_points_end),
-            Transform(sad_points_start, sad_points_end),
+            ClusterTransform(happy_points_start, happy_points_end),
+            ClusterTransform(sad_points_start, sad_points_end),
             Transform(label_before, label_after),
             Rotate(axes, angle=2*PI, axis=UP, about_point=ORIGIN, rate_func=smooth), # Rotate scene instead of camera for smoother control here
             run_time=4
         )
 
         # Add a visual decision boundary plane
-        boundary_plane = Surface(
+        # Facet count follows the plane's on-screen size at the active quality
+        boundary_plane = lod_surface(
             lambda u, v: np.array([u, v, -u-v]), # Plane passing near origin roughly separating the clusters
             u_range=[-2, 2], v_range=[-2, 2],
             checkerboard_colors=[SECONDARY_COLOR, SECONDARY_COLOR],
@@ -134,6 +134,8 @@ class GoogleSearchCloudComputing(Scene):
 
 from manim import *
 import numpy as np
+from embedding_data import embedding_cloud, select_label_indices
+from group_animate import HomogeneousVGroup
 
 # --- Visual Styling ---
 PRIMARY_COLOR = "#db2777"
@@ -190,9 +192,13 @@ class FastAIInitiative3D(ThreeDScene):
         self.wait(1)
 
         # ACT 2: Optimized Vector Cloud (Reduced count for speed)
+        # Real embeddings if EMBEDDING_FILE points at an .npy matrix, random otherwise
+        cloud_points, cloud_labels = embedding_cloud(80, half_extent=3.5)
+        if cloud_points is None:
+            cloud_points = [[np.random.uniform(-3.5, 3.5) for _ in range(3)] for _ in range(80)]
+
         vector_cloud = VGroup()
-        for _ in range(80): # 80 points is the "sweet spot" for speed vs visual
-            p = [np.random.uniform(-3.5, 3.5) for _ in range(3)]
+        for p in cloud_points: # 80 points is the "sweet spot" for speed vs visual
             dot = Dot(point=p, radius=0.03, color=SECONDARY_COLOR, fill_opacity=0.5)
             vector_cloud.add(dot)
 
@@ -209,9 +215,20 @@ class FastAIInitiative3D(ThreeDScene):
         )
 
         # ACT 3: Success Interaction
-        hits = VGroup(*[vector_cloud[i] for i in range(10)])
+        hits = HomogeneousVGroup(*[vector_cloud[i] for i in range(10)])
         self.play(hits.animate.set_color(PRIMARY_COLOR).scale(2), run_time=0.5)
 
+        # With EMBEDDING_LABELS, name the few points nearest the camera right now
+        if cloud_labels is not None:
+            points = np.array([dot.get_center() for dot in vector_cloud])
+            nearest = select_label_indices(points, points @ self.camera.get_rotation_matrix()[2])
+            labels = VGroup(*[
+                Text(cloud_labels[i], font_size=14, color=TEXT_DARK).move_to(points[i] + OUT * 0.25)
+                for i in nearest
+            ])
+            self.camera.add_fixed_orientation_mobjects(*labels)  # Face the camera while it rotates
+            self.play(FadeIn(labels), run_time=0.5)
+
         # Final Stat
         summary = Text("Semantic search provides the 'Fuel' for AI.", font_size=18, color=TEXT_DARK)
         self.add_fixed_in_frame_mobjects(summary)
@@ -223,6 +240,7 @@ class FastAIInitiative3D(ThreeDScene):
 
 
 from manim import *
+from dirty_region_camera import DirtyRegionScene
 
 # Define the custom color palette
 PRIMARY_COLOR = "#db2777"      # Pinkish-Red
@@ -231,7 +249,7 @@ ACCENT_COLOR = "#be185d"       # Darker shade
 TEXT_COLOR = "#1f2937"         # Dark Grey/Black
 GRID_COLOR = "#e5e7eb"         # Light grey
 
-class KeywordSearchCheckmark(Scene):
+class KeywordSearchCheckmark(DirtyRegionScene):
     def construct(self):
         # Set background to white
         self.camera.background_color = WHITE
@@ -411,6 +429,7 @@ class SemanticSearchScene(Scene):
         self.wait(3)
 
 from manim import *
+from lagged_map import LaggedMap
 
 # Define the custom color palette as per requirements
 PRIMARY_COLOR = "#db2777"      # Pinkish-Red
@@ -460,7 +479,7 @@ class CloudQueryIntro(Scene):
         # 4. Animation Sequence
         self.play(Write(title))
         self.play(
-            LaggedStart(*[FadeIn(l) for l in alphabet_grid.submobjects], lag_ratio=0.02),
+            LaggedMap(FadeIn, alphabet_grid, lag_ratio=0.02),
             run_time=1.5
         )
         self.play(Create(search_box), Write(search_label))
@@ -865,6 +884,7 @@ class SemanticMathAnimations(Scene):
 
 
 from manim import *
+from similarity_engine import format_score
 
 # --- Configuration & Palette ---
 PRIMARY_COLOR = "#db2777"     # Pinkish-Red
@@ -880,16 +900,19 @@ class NumericalSimilarityMapping(Scene):
         self.camera.background_color = WHITE
 
         # --- SECTION 1: THE NUMERICAL TABLE ---
-        table_title = Text("Query: Mount Everest", color=TITLE_COLOR, weight=NORMAL).scale(0.8)
+        # Illustrative scores: bare place names share almost no wording, so the
+        # lexical stand-in in similarity_engine would score all but one at 0.00
+        query = "Mount Everest"
+        options = ["Mount Washington", "Nepal", "Pacific Ocean", "Tokyo", "São Paulo"]
+        scores = [0.89, 0.72, 0.31, 0.14, 0.11]
+        winner_idx = max(range(len(options)), key=lambda i: scores[i])
+
+        table_title = Text(f"Query: {query}", color=TITLE_COLOR, weight=NORMAL).scale(0.8)
         table_title.to_edge(UP, buff=0.5)
 
-        table_data = [
-            ["Mount Washington", "0.89"],
-            ["Nepal", "0.72"],
-            ["Pacific Ocean", "0.31"],
-            ["Tokyo", "0.14"],
-            ["São Paulo", "0.11"]
-        ]
+        # Highest score first, so the winner is always the top row
+        ranked = sorted(range(len(options)), key=lambda i: -scores[i])
+        table_data = [[options[i], format_score(scores[i])] for i in ranked]
 
         sim_table = Table(
             table_data,
@@ -927,17 +950,23 @@ class NumericalSimilarityMapping(Scene):
         graph_title.to_edge(UP, buff=0.5)
 
         everest_dot = Dot(point=ORIGIN, color=PRIMARY_COLOR, radius=0.15)
-        everest_label = Text("Mount Everest", color=PRIMARY_COLOR, font_size=24).next_to(everest_dot, UP, buff=0.4)
+        everest_label = Text(query, color=PRIMARY_COLOR, font_size=24).next_to(everest_dot, UP, buff=0.4)
 
-        # Optimized points_config to prevent overlap
-        # São Paulo moved to Top Right (UR quadrant)
+        # Directions are picked to prevent overlap; distance comes from the score
+        # (São Paulo in the Top Right (UR) quadrant)
         points_config = [
-            {"label": "Mount Washington", "pos": RIGHT*2.0 + DOWN*0.5, "dir": DR, "color": PRIMARY_COLOR, "high": True},
-            {"label": "Nepal", "pos": LEFT*2.5 + UP*1.5, "dir": UL, "color": UNMATCHED_COLOR, "high": False},
-            {"label": "Pacific Ocean", "pos": RIGHT*1.5 + DOWN*2.5, "dir": DL, "color": UNMATCHED_COLOR, "high": False},
-            {"label": "Tokyo", "pos": LEFT*4.0 + DOWN*1.5, "dir": DL, "color": UNMATCHED_COLOR, "high": False},
-            {"label": "São Paulo", "pos": RIGHT*4.0 + UP*2.5, "dir": UR, "color": UNMATCHED_COLOR, "high": False},
+            {"label": "Mount Washington", "angle": -15 * DEGREES, "dir": DR},
+            {"label": "Nepal", "angle": 150 * DEGREES, "dir": UL},
+            {"label": "Pacific Ocean", "angle": -40 * DEGREES, "dir": DL},
+            {"label": "Tokyo", "angle": 200 * DEGREES, "dir": DL},
+            {"label": "São Paulo", "angle": 30 * DEGREES, "dir": UR},
         ]
+        for pt in points_config:
+            i = options.index(pt["label"])
+            distance = 1.5 + 3.0 * (1 - scores[i])  # Closer means more similar
+            pt["pos"] = distance * np.array([np.cos(pt["angle"]), np.sin(pt["angle"]), 0])
+            pt["high"] = i == winner_idx
+            pt["color"] = PRIMARY_COLOR if pt["high"] else UNMATCHED_COLOR
 
         self.play(Write(graph_title))
         self.play(Create(everest_dot), Write(everest_label))
@@ -977,6 +1006,7 @@ class NumericalSimilarityMapping(Scene):
         self.wait(3)
 
 from manim import *
+from similarity_engine import format_score, score_options
 
 # --- Configuration & Palette ---
 PRIMARY_COLOR = "#db2777"     # Pinkish-Red (Theme)
@@ -996,21 +1026,24 @@ class SemanticTextSimilarity(Scene):
         query_label = Text("Input Query:", color=TITLE_COLOR, font_size=24, weight=NORMAL).to_edge(UP, buff=0.4)
         
         # Query text scaled to roughly 0.75x of previous massive version
+        query = "I dream of climbing mount Everest once in my lifetime. \n I would like to learn mountain climbing."
         query_text = Text(
-            '"I dream of climbing mount Everest once in my lifetime. \n I would like to learn mountain climbing."',
+            f'"{query}"',
             color=PRIMARY_COLOR,
             font_size=24, # Adjusted for 0.75x feel
             line_spacing=1.2
         ).next_to(query_label, DOWN, buff=0.3)
 
         # --- DATA PREPARATION ---
-        table_content = [
-            ["Mountaineering is a very challenging professional career but can be very satisfying.", "0.72"],
-            ["We teach people how to climb mountain, provide all the gears and training", "0.94"],
-            ["Mountains, peaks and valleys make Switzerland the wonderland of the world.", "0.45"],
-            ["Artists love creating pictures - they often imagine natural sceneries and landscapes...", "0.31"],
-            ["Lets go hiking today, we have a lot of mountains in New Hampshire to pick from.", "0.58"]
+        options = [
+            "Mountaineering is a very challenging professional career but can be very satisfying.",
+            "We teach people how to climb mountain, provide all the gears and training",
+            "Mountains, peaks and valleys make Switzerland the wonderland of the world.",
+            "Artists love creating pictures - they often imagine natural sceneries and landscapes...",
+            "Lets go hiking today, we have a lot of mountains in New Hampshire to pick from."
         ]
+        scores, winner_idx = score_options(query, options)
+        table_content = [[option, format_score(score)] for option, score in zip(options, scores)]
 
         # Generating Mobjects for the grid
         mobjects_grid = []
@@ -1027,7 +1060,7 @@ class SemanticTextSimilarity(Scene):
             sentence.set_width(8.5) # Slightly narrower for better framing
             
             # Column 2: The Score
-            score_color = PRIMARY_COLOR if i == 1 else UNMATCHED_COLOR
+            score_color = PRIMARY_COLOR if i == winner_idx else UNMATCHED_COLOR
             score = Text(row[1], color=score_color, font_size=36)
             
             mobjects_grid.append([sentence, score])
@@ -1071,8 +1104,8 @@ class SemanticTextSimilarity(Scene):
                 run_time=0.6
             )
             
-            # Subtle highlight for the winning match
-            if i == 2: 
+            # Subtle highlight for the winning match (row 0 is the header)
+            if i == winner_idx + 1: 
                 self.play(rows[i].animate.set_background_stroke(color=PRIMARY_COLOR, opacity=0.1, width=2))
             
             self.wait(0.15)
@@ -1193,6 +1226,7 @@ class SemanticSimilarityRephrased(Scene):
         self.wait(4)
 
 from manim import *
+from similarity_engine import cosine_matrix, format_score
 
 # --- Configuration & Palette ---
 PRIMARY_COLOR = "#db2777"     # Pinkish-Red
@@ -1217,22 +1251,24 @@ class MultiIntentSimilarity(Scene):
 
         # Phase 1: Landscape/Viewing Intent
         query_1 = "I dream of seeing Mount Everest once in my lifetime. I love beautiful mountain landscapes."
-        scores_1 = ["0.65", "0.58", "0.89", "0.92", "0.71"] # Higher for visual/landscape options
 
         # Phase 2: Learning/Skill Intent
         query_2 = "I want to learn mountain climbing and outdoor survival skills."
-        scores_2 = ["0.82", "0.95", "0.40", "0.35", "0.62"] # Higher for technical/training options
+
+        # Both queries against every option in one call
+        scores_1, scores_2 = cosine_matrix([query_1, query_2], options_text)
 
         # --- PHASE 1 ANIMATION ---
-        self.run_similarity_phase(query_1, scores_1, "Intent: Aesthetic Appreciation", winner_idx=3)
+        self.run_similarity_phase(query_1, options_text, scores_1, "Intent: Aesthetic Appreciation")
         self.wait(2)
         self.play(*[FadeOut(mob) for mob in self.mobjects])
         
         # --- PHASE 2 ANIMATION ---
-        self.run_similarity_phase(query_2, scores_2, "Intent: Technical Skill", winner_idx=1)
+        self.run_similarity_phase(query_2, options_text, scores_2, "Intent: Technical Skill")
         self.wait(3)
 
-    def run_similarity_phase(self, query_str, scores, phase_label_str, winner_idx):
+    def run_similarity_phase(self, query_str, options, scores, phase_label_str):
+        winner_idx = int(scores.argmax())
         # 1. Title & Query
         phase_label = Text(phase_label_str, color=UNMATCHED_COLOR, font_size=18).to_edge(UP, buff=0.2)
         query_label = Text("Input Query:", color=TITLE_COLOR, font_size=24, weight=NORMAL).next_to(phase_label, DOWN, buff=0.2)
@@ -1250,27 +1286,11 @@ class MultiIntentSimilarity(Scene):
 
         # 2. Build Table Data
         mobjects_grid = []
-        for i in range(len(scores)):
-            sentence = Paragraph(
-                ["Mountaineering is a career...", 
-                 "We teach climbing...", 
-                 "Switzerland wonderland...", 
-                 "Artists/sceneries...", 
-                 "Hiking in NH..."][i], # Shortened for code clarity, logic uses full list below
-                color=TEXT_COLOR, font_size=32, line_spacing=0.8, alignment="left"
-            )
-            # Use actual full text from outer scope
-            full_text = [
-                "Mountaineering is a very challenging professional career but can be very satisfying.",
-                "We teach people how to climb mountain, provide all the gears and training",
-                "Mountains, peaks and valleys make Switzerland the wonderland of the world.",
-                "Artists love creating pictures - they often imagine natural sceneries and landscapes...",
-                "Lets go hiking today, we have a lot of mountains in New Hampshire to pick from."
-            ]
-            sentence = Paragraph(full_text[i], color=TEXT_COLOR, font_size=32, line_spacing=0.8).set_width(8.5)
+        for i, option in enumerate(options):
+            sentence = Paragraph(option, color=TEXT_COLOR, font_size=32, line_spacing=0.8).set_width(8.5)
             
             score_color = PRIMARY_COLOR if i == winner_idx else UNMATCHED_COLOR
-            score = Text(scores[i], color=score_color, font_size=36)
+            score = Text(format_score(scores[i]), color=score_color, font_size=36)
             mobjects_grid.append([sentence, score])
 
         header_1 = Text("Semantic Match Options", color=TITLE_COLOR, font_size=28, weight=NORMAL)
@@ -1296,6 +1316,7 @@ class MultiIntentSimilarity(Scene):
 
 
 from manim import *
+from similarity_engine import format_score, score_options
 
 # --- Configuration & Palette ---
 PRIMARY_COLOR = "#db2777"     # Pinkish-Red (High Similarity)
@@ -1314,21 +1335,24 @@ class SemanticAgentRouting(Scene):
         # Rule 1c: Title is BLACK and NOT bold
         query_label = Text("Production Input Query:", color=TITLE_COLOR, font_size=32, weight=NORMAL).to_edge(UP, buff=0.3)
         
+        query = "Why did our cloud bill spike last month and how can we reduce it efficiently?"
         query_text = Text(
-            '"Why did our cloud bill spike last month and how can we reduce it efficiently?"',
+            f'"{query}"',
             color=PRIMARY_COLOR,
             font_size=30, 
             line_spacing=1.2
         ).next_to(query_label, DOWN, buff=0.2)
 
         # --- AGENT DATA ---
-        agents_data = [
-            ["Agent 1 – Finance Assistant: Budgeting, forecasting, and expense categorization.", "0.78"],
-            ["Agent 2 – Cloud Cost Optimization: Analyzes usage metrics, spend, and resources.", "0.96"],
-            ["Agent 3 – HR Assistant: Answers questions on payroll, hiring, and benefits.", "0.12"],
-            ["Agent 4 – DevOps Troubleshooting: Monitors failures, logs, and performance.", "0.65"],
-            ["Agent 5 – Sales Analytics: Analyzes pipeline performance and revenue trends.", "0.15"]
+        agents = [
+            "Agent 1 – Finance Assistant: Budgeting, forecasting, and expense categorization.",
+            "Agent 2 – Cloud Cost Optimization: Analyzes usage metrics, spend, and resources.",
+            "Agent 3 – HR Assistant: Answers questions on payroll, hiring, and benefits.",
+            "Agent 4 – DevOps Troubleshooting: Monitors failures, logs, and performance.",
+            "Agent 5 – Sales Analytics: Analyzes pipeline performance and revenue trends."
         ]
+        scores, winner_idx = score_options(query, agents)
+        agents_data = [[agent, format_score(score)] for agent, score in zip(agents, scores)]
 
         # Preparing the grid with significantly larger internal font sizes
         mobjects_grid = []
@@ -1346,7 +1370,7 @@ class SemanticAgentRouting(Scene):
             desc.set_width(11) 
             
             # Column 2: The Score
-            score_color = PRIMARY_COLOR if i == 1 else UNMATCHED_COLOR
+            score_color = PRIMARY_COLOR if i == winner_idx else UNMATCHED_COLOR
             score = Text(row[1], color=score_color, font_size=42)
             
             mobjects_grid.append([desc, score])
@@ -1387,8 +1411,8 @@ class SemanticAgentRouting(Scene):
                 run_time=0.6
             )
             
-            # Highlight Agent 2 as the winning selection
-            if i == 2: 
+            # Highlight the winning agent (row 0 is the header)
+            if i == winner_idx + 1: 
                 self.play(
                     rows[i].animate.set_background_stroke(color=PRIMARY_COLOR, opacity=0.15, width=5),
                     run_time=0.3
@@ -1398,7 +1422,7 @@ class SemanticAgentRouting(Scene):
             self.wait(0.1)
 
         # Result Footer - High contrast
-        footer = Text("System selects Agent 2 based on highest Semantic Proximity", 
+        footer = Text(f"System selects Agent {winner_idx + 1} based on highest Semantic Proximity", 
                       color=PRIMARY_COLOR, font_size=24).to_edge(DOWN, buff=0.3)
         self.play(FadeIn(footer))
         
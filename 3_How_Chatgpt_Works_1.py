@@ -114,6 +114,7 @@ class MathematicalMapping(Scene):
 
 from manim import *
 import random
+from shared_frame_ring import SharedRingWriterMixin
 
 # Define the custom color palette
 PRIMARY_COLOR = "#db2777"   # Pinkish-Red
@@ -122,7 +123,7 @@ ACCENT_COLOR = "#be185d"    # Darker Pink
 TEXT_COLOR = "#1f2937"      # Dark Grey/Black
 GRID_COLOR = "#e5e7eb"      # Light grey
 
-class MultiColumnVocabularyScroll(Scene):
+class MultiColumnVocabularyScroll(SharedRingWriterMixin, Scene):
     def construct(self):
         # Set background to white
         self.camera.background_color = WHITE
@@ -336,6 +337,9 @@ class TokenizationFinalFixed(Scene):
 
 from manim import *
 import random
+from decimated_updater import add_decimated_updater, drift_updater
+from layered_compositor import LayeredScene
+from assets import asset_image
 
 # --- Color Palette ---
 PRIMARY_COLOR = "#db2777"      # Pinkish-Red (Phone outline & highlight)
@@ -344,13 +348,14 @@ SCREEN_BG_COLOR = WHITE
 TEXT_COLOR = "#1f2937"         
 KEY_COLOR = "#e5e7eb"          
 
-class MobileTypingRefined(Scene):
+class MobileTypingRefined(LayeredScene):
     def construct(self):
         # Ensure the camera background is strictly white
         self.camera.background_color = WHITE
 
         # --- 0. AMBIENT BACKGROUND PARTICLES ---
         particles = VGroup()
+        velocities = []
         for _ in range(25):
             radius = random.uniform(0.05, 0.15)
             particle = Circle(
@@ -361,9 +366,11 @@ class MobileTypingRefined(Scene):
             )
             particle.move_to([random.uniform(-7, 7), random.uniform(-4, 4), 0])
             velocity = np.array([random.uniform(-0.1, 0.1), random.uniform(-0.1, 0.1), 0])
-            particle.add_updater(lambda m, dt, v=velocity: m.shift(v * dt))
+            velocities.append(velocity)
             particles.add(particle)
         
+        # One drift updater for the whole group, run at 15 Hz and interpolated per frame
+        add_decimated_updater(particles, drift_updater(velocities))
         self.add(particles)
 
         # --- 1. PHONE STRUCTURE ---
@@ -380,8 +387,7 @@ class MobileTypingRefined(Scene):
 
         # --- 2. SCREEN CONTENT (CAT IMAGE) ---
         try:
-            cat_photo = ImageMobject("cat.png") 
-            cat_photo.width = 3.3
+            cat_photo = asset_image("cat.png", width=3.3)
             cat_photo.move_to(screen.get_top() + DOWN * 1.6)
         except:
             cat_photo = RoundedRectangle(height=2.2, width=3.3, color=GRAY, fill_opacity=0.1)
@@ -473,6 +479,7 @@ class MobileTypingRefined(Scene):
         self.wait(3)
 
 from manim import *
+from dirty_region_camera import DirtyRegionScene
 
 # --- Color Palette ---
 PRIMARY_COLOR = "#db2777"      # Pinkish-Red
@@ -480,7 +487,7 @@ TEXT_COLOR = "#1f2937"         # Dark Grey
 GRID_COLOR = "#e5e7eb"         # Light Grey
 BG_COLOR = WHITE
 
-class EmbeddingLookupClean(Scene):
+class EmbeddingLookupClean(DirtyRegionScene):
     def construct(self):
         # Setting a clean, pure white background
         self.camera.background_color = BG_COLOR
@@ -585,6 +592,7 @@ class EmbeddingLookupClean(Scene):
 
 from manim import *
 import numpy as np
+from mesh_lod import lod_arrow3d
 
 # --- Color Palette ---
 PRIMARY_COLOR = "#f40b74"      # Pinkish-Red (Cat)
@@ -636,7 +644,7 @@ class ThreeDWordEmbeddings(ThreeDScene):
 
         for data in concept_data:
             # Create 3D Arrow
-            vec = Arrow3D(
+            vec = lod_arrow3d(
                 start=ORIGIN, 
                 end=np.array(data["pos"]), 
                 color=data["color"],
@@ -1,5 +1,8 @@
 from manim import *
 import numpy as np
+from lagged_map import LaggedMap
+from dirty_region_camera import DirtyRegionScene
+from attention_engine import SENTENCE, sentence_attention
 
 # --- Configuration & Color Palette ---
 PRIMARY_COLOR = "#db2777"   # Pinkish-Red
@@ -53,7 +56,7 @@ class AttentionCell(VGroup):
         """Returns animation to change text color; z-index ensures visibility."""
         return self.label.animate.set_color(color)
 
-class Scene12AttentionMatrix(Scene):
+class Scene12AttentionMatrix(DirtyRegionScene):
     def construct(self):
         # --- Stage 1: Initialization ---
         self.camera.background_color = WHITE_BG
@@ -69,17 +72,13 @@ class Scene12AttentionMatrix(Scene):
         self.add(title)
 
         # 1.2 Data Definitions
-        words = ["The", "cat", "sat", "on", "the"]
+        words = SENTENCE
         n = len(words)
         
-        # Matrix values representing attention scores
-        scores = [
-            [12.1, 4.2, 1.1, 5.5, 9.8],
-            [3.2, 28.5, 14.2, 2.1, 3.8],
-            [1.5, 42.0, 22.1, 11.2, 1.9],  # The 'sat' row
-            [4.1, 2.5, 15.6, 18.2, 5.3],
-            [8.9, 3.8, 1.2, 6.7, 10.5]
-        ]
+        # Attention scores Q K^T / sqrt(d), computed by attention_engine
+        scores, weights, _ = sentence_attention()
+        focus_row = words.index("sat")
+        focus_col = int(weights[focus_row].argmax())  # 'cat'
 
         # --- Stage 2: Building the UI ---
         
@@ -130,8 +129,8 @@ class Scene12AttentionMatrix(Scene):
         )
         
         self.play(
-            LaggedStart(*[FadeIn(q, shift=RIGHT * 0.2) for q in query_labels], lag_ratio=0.1),
-            LaggedStart(*[FadeIn(k, shift=DOWN * 0.2) for k in key_labels], lag_ratio=0.1),
+            LaggedMap(FadeIn, query_labels, shift=RIGHT * 0.2, lag_ratio=0.1),
+            LaggedMap(FadeIn, key_labels, shift=DOWN * 0.2, lag_ratio=0.1),
             run_time=1.5
         )
 
@@ -148,10 +147,10 @@ class Scene12AttentionMatrix(Scene):
         self.wait(1)
 
         # 3.3 The Intersection Highlight
-        # target: "sat" (Query index 2) x "cat" (Key index 1)
-        target_cell = matrix_cells[2][1]
-        target_query = query_labels[2]
-        target_key = key_labels[1]
+        # target: "sat" (query) x its highest-scoring key, "cat"
+        target_cell = matrix_cells[focus_row][focus_col]
+        target_query = query_labels[focus_row]
+        target_key = key_labels[focus_col]
 
         # Visual Guides
         h_line = Line(target_query.get_right(), target_cell.get_left(), color=PRIMARY_COLOR, stroke_width=2)
@@ -165,7 +164,7 @@ class Scene12AttentionMatrix(Scene):
             run_time=1
         )
 
-        # FIX: Explicit z_index in AttentionCell class ensures '42.0' turns WHITE and stays visible
+        # FIX: Explicit z_index in AttentionCell class ensures the score turns WHITE and stays visible
         self.play(
             target_cell.get_highlight_animation(opacity=0.9, color=PRIMARY_COLOR),
             target_cell.get_text_highlight(color=WHITE),
@@ -178,6 +177,8 @@ class Scene12AttentionMatrix(Scene):
 
 from manim import *
 import numpy as np
+from layered_compositor import LayeredScene
+from attention_engine import SENTENCE, highlight_opacity, sentence_attention
 
 # --- Configuration & Color Palette ---
 PRIMARY_COLOR = "#db2777"   # Pinkish-Red
@@ -187,10 +188,11 @@ WHITE_BG = "#ffffff"        # Background
 GRID_COLOR = "#e5e7eb"      # Light grey
 
 class SoftmaxCell(VGroup):
-    def __init__(self, raw_val, softmax_val, size=1.1, **kwargs):
+    def __init__(self, raw_val, softmax_val, size=1.1, intensity=0.2, **kwargs):
         super().__init__(**kwargs)
         self.raw_val = raw_val
         self.softmax_val = softmax_val
+        self.intensity = intensity
         
         # 1. Base Layer
         self.bg = Square(
@@ -227,12 +229,12 @@ class SoftmaxCell(VGroup):
         if is_focus:
             anims.append(self.highlight.animate.set_fill(opacity=0.9))
         elif self.softmax_val > 0.1:
-            # Subtle highlight for secondary attention
-            anims.append(self.highlight.animate.set_fill(color=PRIMARY_COLOR, opacity=0.2))
+            # Subtle highlight for secondary attention, scaled by its weight
+            anims.append(self.highlight.animate.set_fill(color=PRIMARY_COLOR, opacity=self.intensity))
         
         return AnimationGroup(*anims)
 
-class Scene13SoftmaxUpdated(Scene):
+class Scene13SoftmaxUpdated(LayeredScene):
     def construct(self):
         self.camera.background_color = WHITE_BG
         
@@ -240,23 +242,13 @@ class Scene13SoftmaxUpdated(Scene):
         title = Text("", color=BLACK, weight=NORMAL, font_size=32).to_edge(UP, buff=0.4)
         self.add(title)
 
-        # 2. Data Preparation - Using smaller numbers for visual distribution
-        words = ["The", "cat", "sat", "on", "the"]
+        # 2. Data Preparation - the same scores as Scene12, softmaxed per row
+        words = SENTENCE
         n = len(words)
-        
-        # Adjusted scores so 'sat' (index 2) likes 'cat' (index 1) but also sees 'on' (index 3)
-        raw_data = np.array([
-            [2.1, 1.2, 0.5, 0.8, 1.9],
-            [0.8, 3.5, 2.1, 0.4, 0.6],
-            [1.1, 4.2, 2.8, 1.5, 0.9], # 'sat' row: 4.2 is high, but 2.8 is also relevant
-            [0.6, 0.5, 2.4, 3.1, 1.2],
-            [1.8, 1.1, 0.4, 0.9, 2.0]
-        ])
-
-        def sm(row):
-            e = np.exp(row - np.max(row))
-            return e / e.sum()
-        softmax_data = np.apply_along_axis(sm, 1, raw_data)
+        raw_data, softmax_data, _ = sentence_attention()
+        intensities = highlight_opacity(softmax_data, max_opacity=0.3)
+        focus_row = words.index("sat")
+        focus_col = int(softmax_data[focus_row].argmax())  # 'cat'
 
         # 3. Grid Construction
         cell_size = 1.1
@@ -266,7 +258,7 @@ class Scene13SoftmaxUpdated(Scene):
         for i in range(n):
             row = []
             for j in range(n):
-                c = SoftmaxCell(raw_data[i][j], softmax_data[i][j], size=cell_size)
+                c = SoftmaxCell(raw_data[i][j], softmax_data[i][j], size=cell_size, intensity=intensities[i][j])
                 # Spacing to ensure no overlap
                 c.move_to(DOWN * 0.8 + RIGHT * (j-2) * cell_size + DOWN * (i-1.5) * cell_size)
                 row.append(c)
@@ -287,7 +279,7 @@ class Scene13SoftmaxUpdated(Scene):
         self.wait(1)
 
         # 1. Highlight 'sat' row
-        sat_row = VGroup(*grid_cells[2])
+        sat_row = VGroup(*grid_cells[focus_row])
         focus_box = SurroundingRectangle(sat_row, color=PRIMARY_COLOR, buff=0.1)
         self.play(Create(focus_box))
 
@@ -298,7 +290,7 @@ class Scene13SoftmaxUpdated(Scene):
         # 3. Transition Scores
         self.play(
             AnimationGroup(
-                *[grid_cells[2][j].update_to_softmax(is_focus=(j==1)) for j in range(n)],
+                *[grid_cells[focus_row][j].update_to_softmax(is_focus=(j==focus_col)) for j in range(n)],
                 lag_ratio=0.1
             ),
             run_time=2
@@ -310,7 +302,7 @@ class Scene13SoftmaxUpdated(Scene):
         self.wait(1)
 
         # 5. Rest of the table
-        rest = [grid_cells[i][j] for i in range(n) for j in range(n) if i != 2]
+        rest = [grid_cells[i][j] for i in range(n) for j in range(n) if i != focus_row]
         self.play(
             AnimationGroup(*[c.update_to_softmax() for c in rest], lag_ratio=0.01),
             FadeOut(focus_box),
@@ -319,6 +311,7 @@ class Scene13SoftmaxUpdated(Scene):
         self.wait(2)
 
 from manim import *
+from attention_engine import SENTENCE, sentence_attention
 
 # --- Configuration & Color Palette ---
 PRIMARY_COLOR = "#db2777"      # Pinkish-Red (Theme color)
@@ -339,6 +332,10 @@ class Scene14WeightedSum(Scene):
         ).to_edge(UP, buff=0.5)
         self.add(title)
 
+        # Weight of 'sat' on 'cat' from the Scene13 softmax (~80%)
+        _, weights, _ = sentence_attention()
+        cat_weight = weights[SENTENCE.index("sat"), SENTENCE.index("cat")]
+
         # 2. Define Vector Objects
         # Left side: The Query word "sat"
         sat_rect = Rectangle(
@@ -357,12 +354,12 @@ class Scene14WeightedSum(Scene):
         cat_label = Text("Value ('feline')", color=TEXT_COLOR, font_size=20).next_to(cat_rect, DOWN, buff=0.5)
         cat_desc = Text("[Contextual Info]", color=ACCENT_COLOR, font_size=16).next_to(cat_label, DOWN, buff=0.2)
 
-        # 3. The 80% Weight Badge
+        # 3. The Attention Weight Badge
         weight_box = RoundedRectangle(
             corner_radius=0.1, height=0.7, width=2.4, 
             color=PRIMARY_COLOR, fill_color=SECONDARY_COLOR, fill_opacity=1
         ).next_to(cat_rect, UP, buff=0.5)
-        weight_text = Text("80% Attention", color=PRIMARY_COLOR, font_size=20, weight=BOLD).move_to(weight_box)
+        weight_text = Text(f"{round(cat_weight * 100)}% Attention", color=PRIMARY_COLOR, font_size=20, weight=BOLD).move_to(weight_box)
 
         # --- Animation ---
         self.play(Create(sat_rect), Write(sat_label))
@@ -371,11 +368,11 @@ class Scene14WeightedSum(Scene):
         self.wait(1)
 
         # 4. Action: The Information Blending
-        # We create a copy that represents the 80% of "Cat" information being used
+        # We create a copy that represents the weighted share of "Cat" information being used
         blend_rect = cat_rect.copy().set_z_index(5)
         
         self.play(
-            blend_rect.animate.stretch_to_fit_height(3.5 * 0.8).move_to(sat_rect.get_bottom(), aligned_edge=DOWN),
+            blend_rect.animate.stretch_to_fit_height(3.5 * cat_weight).move_to(sat_rect.get_bottom(), aligned_edge=DOWN),
             run_time=2,
             rate_func=bezier([0, 0, 1, 1])
         )
@@ -1514,6 +1511,7 @@ class Scene23Unembedding(Scene):
         self.wait(3)
 
 from manim import *
+from background_layer import bake_background
 
 # --- Visual Styling Constants ---
 PRIMARY_COLOR = "#db2777"   # Pinkish-Red
@@ -1535,7 +1533,8 @@ class Scene24LogitsFixed(Scene):
                 "stroke_opacity": 0.5
             }
         )
-        self.add(grid)
+        # Never changes: rasterized once into the background instead of redrawn per play
+        bake_background(self, grid)
 
         # --- Scene Elements ---
         
@@ -1581,6 +1580,7 @@ class Scene24LogitsFixed(Scene):
             Create(underline),
             run_time=1.2
         )
+        bake_background(self, title, underline)
         self.wait(0.5)
 
         # Step 2: Reveal Logits (Row by Row)
@@ -1819,6 +1819,9 @@ class Scene26Selection(Scene):
 
 from manim import *
 import random
+from decimated_updater import add_decimated_updater, drift_updater
+from layered_compositor import LayeredScene
+from assets import asset_image
 
 # --- Visual Styling Constants ---
 PRIMARY_COLOR = "#db2777"      # Pinkish-Red
@@ -1827,12 +1830,13 @@ TEXT_COLOR = "#1f2937"         # Dark Grey/Black
 KEY_COLOR = "#e5e7eb"          # Light grey for keys
 SCREEN_BG_COLOR = WHITE
 
-class Scene27RealisticLoopFinal(Scene):
+class Scene27RealisticLoopFinal(LayeredScene):
     def construct(self):
         self.camera.background_color = WHITE
 
         # --- 1. AMBIENT BACKGROUND PARTICLES ---
         particles = VGroup()
+        velocities = []
         for _ in range(30):
             p = Circle(
                 radius=random.uniform(0.05, 0.2), 
@@ -1842,8 +1846,10 @@ class Scene27RealisticLoopFinal(Scene):
             ).move_to([random.uniform(-7, 7), random.uniform(-4, 4), 0])
             
             velocity = np.array([random.uniform(-0.15, 0.15), random.uniform(-0.15, 0.15), 0])
-            p.add_updater(lambda m, dt, v=velocity: m.shift(v * dt))
+            velocities.append(velocity)
             particles.add(p)
+        # One drift updater for the whole group, run at 15 Hz and interpolated per frame
+        add_decimated_updater(particles, drift_updater(velocities))
         self.add(particles)
 
         # --- 2. PHONE STRUCTURE ---
@@ -1859,8 +1865,7 @@ class Scene27RealisticLoopFinal(Scene):
 
         # Content (Cat Image)
         try:
-            cat_photo = ImageMobject(r"D:\manim\cat.png") 
-            cat_photo.width = 3.3
+            cat_photo = asset_image("cat.png", width=3.3)
             cat_photo.move_to(screen.get_top() + DOWN * 1.6).set_z_index(3)
         except:
             cat_photo = RoundedRectangle(corner_radius=0.1, height=2.2, width=3.3, color=GRAY, fill_opacity=0.1)
@@ -1972,6 +1977,9 @@ class Scene27RealisticLoopFinal(Scene):
 from manim import *
 import random
 import numpy as np
+from group_animate import HomogeneousVGroup
+from lagged_map import LaggedMap
+from pipelined_writer import PipelinedWriterMixin
 
 # --- Visual Styling Constants ---
 PRIMARY_COLOR = "#db2777"      # Pinkish-Red
@@ -1980,7 +1988,7 @@ ACCENT_COLOR = "#be185d"       # Darker Pink
 TEXT_COLOR = "#1f2937"         # Dark Grey/Black
 MATRIX_COLOR = "#9ca3af"       # Grey for grid lines
 
-class Scene28and29FinalSummary(Scene):
+class Scene28and29FinalSummary(PipelinedWriterMixin, Scene):
     def construct(self):
         # 1. Setup Environment
         self.camera.background_color = SECONDARY_COLOR
@@ -2058,7 +2066,8 @@ class Scene28and29FinalSummary(Scene):
         miracle_title.to_edge(UP, buff=0.8)
 
         # Create a massive "cloud" of parameters (dots)
-        dots = VGroup(*[
+        # HomogeneousVGroup: identical dots, so .animate runs on stacked arrays
+        dots = HomogeneousVGroup(*[
             Dot(radius=0.03, color=PRIMARY_COLOR, fill_opacity=random.uniform(0.2, 0.6))
             for _ in range(800)
         ])
@@ -2076,7 +2085,7 @@ class Scene28and29FinalSummary(Scene):
         # --- Animation Sequence 29 ---
         self.play(Write(miracle_title))
         self.play(
-            LaggedStart(*[FadeIn(d) for d in dots], lag_ratio=0.005),
+            LaggedMap(FadeIn, dots, lag_ratio=0.005),
             Write(scale_text),
             run_time=3
         )
@@ -2097,6 +2106,9 @@ class Scene28and29FinalSummary(Scene):
 from manim import *
 import random
 import numpy as np
+from decimated_updater import add_decimated_updater, drift_updater
+from multi_resolution import MultiResolutionMixin
+from assets import asset_image
 
 # --- Visual Styling Constants ---
 PRIMARY_COLOR = "#db2777"      # Pinkish-Red
@@ -2104,13 +2116,14 @@ BG_COLOR = WHITE               # Professional White
 TEXT_COLOR = "#1f2937"         # Dark Grey
 FRAME_COLOR = "#fbcfe8"        # Light Pink
 
-class Scene30ConclusionFixed(Scene):
+class Scene30ConclusionFixed(MultiResolutionMixin, Scene):
     def construct(self):
         self.camera.background_color = BG_COLOR
 
         # --- 1. AMBIENT BACKGROUND PARTICLES ---
         # Adds "appeal" and depth to the white background
         particles = VGroup()
+        velocities = []
         for _ in range(25):
             p = Circle(
                 radius=random.uniform(0.05, 0.15), 
@@ -2121,8 +2134,10 @@ class Scene30ConclusionFixed(Scene):
             
             # Slow drifting movement
             velocity = np.array([random.uniform(-0.08, 0.08), random.uniform(-0.08, 0.08), 0])
-            p.add_updater(lambda m, dt, v=velocity: m.shift(v * dt))
+            velocities.append(velocity)
             particles.add(p)
+        # One drift updater for the whole group, run at 15 Hz and interpolated per frame
+        add_decimated_updater(particles, drift_updater(velocities))
         self.add(particles)
 
         # --- 2. THE TEXT ("Math is the bridge.") ---
@@ -2135,9 +2150,7 @@ class Scene30ConclusionFixed(Scene):
 
         # --- 3. THE FINAL IMAGE & FRAMING ---
         try:
-            # Using raw string for Windows path
-            cat_image = ImageMobject(r"D:\manim\cat_sleeping.png")
-            cat_image.height = 4.5
+            cat_image = asset_image("cat_sleeping.png", height=4.5)
         except:
             # Fallback if image isn't found
             cat_image = RoundedRectangle(
@@ -240,6 +240,7 @@ class RAGArchitectureScene(Scene):
 
 from manim import *
 import numpy as np
+from assets import asset_image
 
 # --- Global Color Palette ---
 PRIMARY_COLOR = "#db2777"      # Pinkish-Red
@@ -404,7 +405,7 @@ class RAGZoomScene(MovingCameraScene):
 
         # --- ZOOM 1: LLM ---
         try:
-            llm_img = ImageMobject(r"D:\manim\images\llm.jpg").set_height(1.875)  # 0.75x of 2.5
+            llm_img = asset_image("images/llm.jpg", height=1.875, zoom=2)  # 0.75x of 2.5
         except:
             rect = Rectangle(color=RED, fill_opacity=0.5, height=1.875, width=3)
             t = Text("LLM.jpg", color=WHITE, font_size=18).move_to(rect)
@@ -436,7 +437,7 @@ class RAGZoomScene(MovingCameraScene):
 
         # --- ZOOM 2: Semantic Search ---
         try:
-            sem_img = ImageMobject(r"D:\manim\images\semantic.jpg").set_height(1.875)  # 0.75x of 2.5
+            sem_img = asset_image("images/semantic.jpg", height=1.875, zoom=2)  # 0.75x of 2.5
         except:
             rect = Rectangle(color=GREEN, fill_opacity=0.5, height=1.875, width=3)
             t = Text("semantic.jpg", color=WHITE, font_size=18).move_to(rect)
@@ -468,7 +469,7 @@ class RAGZoomScene(MovingCameraScene):
 
         # --- ZOOM 3: Fine Tuning ---
         try:
-            ft_img = ImageMobject(r"D:\manim\images\finetuning.jpg").set_height(1.875)  # 0.75x of 2.5
+            ft_img = asset_image("images/finetuning.jpg", height=1.875, zoom=2)  # 0.75x of 2.5
         except:
             rect = Rectangle(color=BLUE, fill_opacity=0.5, height=1.875, width=3)
             t = Text("finetuning.jpg", color=WHITE, font_size=18).move_to(rect)
@@ -1,5 +1,6 @@
 from manim import *
 import numpy as np
+from frame_hash_cache import FrameHashMixin
 
 # --- Global Color Palette ---
 PRIMARY_COLOR = "#db2777"      # Pinkish-Red (Highlights, Numbers)
@@ -9,7 +10,7 @@ ICON_BASE_COLOR = "#ec5599"    # Dark Grey (Change this to update all icons!)
 BACKGROUND_COLOR = WHITE       # White background
 LIGHT_PINK = "#fbcfe8"         # Solid Light Pink for Client
 
-class RAGArchitectureScene(Scene):
+class RAGArchitectureScene(FrameHashMixin, Scene):
     def construct(self):
         # 1. Setup Background
         self.camera.background_color = BACKGROUND_COLOR
@@ -214,6 +215,7 @@ class RAGArchitectureScene(Scene):
 from manim import *
 import numpy as np
 import random
+from frame_hash_cache import FrameHashMixin
 
 # --- Global Color Palette ---
 PRIMARY_COLOR = "#db2777"      # Pinkish-Red
@@ -224,7 +226,7 @@ BACKGROUND_COLOR = WHITE
 LIGHT_PINK = "#fbcfe8"         # For Client/User icons
 BUTTON_FILL = "#fce7f3"        # Very light pink for text backgrounds
 
-class RAGTargetAudience(Scene):
+class RAGTargetAudience(FrameHashMixin, Scene):
     def construct(self):
         self.camera.background_color = BACKGROUND_COLOR
 
@@ -462,6 +464,8 @@ class RAGTargetAudience(Scene):
 
 from manim import *
 import numpy as np
+from assets import asset_image
+from frame_hash_cache import FrameHashMixin
 
 # --- Global Color Palette ---
 PRIMARY_COLOR = "#db2777"      # Pinkish-Red
@@ -471,7 +475,7 @@ ICON_BASE_COLOR = "#ec5599"    # Lighter Grey (was #4b5563)
 BACKGROUND_COLOR = WHITE       
 LIGHT_PINK = "#fbcfe8"         
 
-class RAGZoomScene(MovingCameraScene):
+class RAGZoomScene(FrameHashMixin, MovingCameraScene):
     def construct(self):
         self.camera.background_color = BACKGROUND_COLOR
 
@@ -591,7 +595,7 @@ class RAGZoomScene(MovingCameraScene):
 
         # --- ZOOM 1: LLM ---
         try:
-            llm_img = ImageMobject(r"D:\manim\images\llm.jpg").set_height(2.5)
+            llm_img = asset_image("images/llm.jpg", height=2.5, zoom=1.5)
         except:
             rect = Rectangle(color=RED, fill_opacity=0.5, height=2.5, width=4)
             t = Text("LLM.jpg", color=WHITE, font_size=24).move_to(rect)
@@ -618,7 +622,7 @@ class RAGZoomScene(MovingCameraScene):
 
         # --- ZOOM 2: Semantic Search ---
         try:
-            sem_img = ImageMobject(r"D:\manim\images\semantic.jpg").set_height(2.5)
+            sem_img = asset_image("images/semantic.jpg", height=2.5, zoom=1.5)
         except:
             rect = Rectangle(color=GREEN, fill_opacity=0.5, height=2.5, width=4)
             t = Text("semantic.jpg", color=WHITE, font_size=24).move_to(rect)
@@ -645,7 +649,7 @@ class RAGZoomScene(MovingCameraScene):
 
         # --- ZOOM 3: Fine Tuning ---
         try:
-            ft_img = ImageMobject(r"D:\manim\images\finetuning.jpg").set_height(2.5)
+            ft_img = asset_image("images/finetuning.jpg", height=2.5, zoom=1.5)
         except:
             rect = Rectangle(color=BLUE, fill_opacity=0.5, height=2.5, width=4)
             t = Text("finetuning.jpg", color=WHITE, font_size=24).move_to(rect)
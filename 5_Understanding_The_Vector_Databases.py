@@ -452,6 +452,7 @@ class RAGArchitectureSceneGood(Scene):
 
 from manim import *
 import numpy as np
+from pipelined_writer import PipelinedWriterMixin
 
 # --- Global Color Palette ---
 PRIMARY_COLOR = "#db2777"      # Pinkish-Red
@@ -463,7 +464,7 @@ GRID_COLOR = "#d3d4d6"         # Light grey for 3D axes
 VECTOR_GREEN = "#10b981"       # Emerald for numerical data
 DOC_COLOR = "#3b82f6"          # Blue color for the survivor document
 
-class VectorDatabaseMorphScene(ThreeDScene):
+class VectorDatabaseMorphScene(PipelinedWriterMixin, ThreeDScene):
     def construct(self):
         # 1. Setup Background
         self.camera.background_color = BACKGROUND_COLOR
@@ -1148,6 +1149,8 @@ class ComponentResponsibilityTable(Scene):
         self.wait(5)
 
 from manim import *
+from render_profiler import ProfilerMixin
+from memory_census import MemoryCensusMixin
 
 # --- Global Color Palette ---
 PRIMARY_COLOR = "#db2777"      # Pinkish-Red
@@ -1156,7 +1159,7 @@ TEXT_COLOR = "#1f2937"         # Dark Grey
 MEMORY_GLOW = "#f472b6"        # Soft Pink for the "Memory" effect
 BACKGROUND_COLOR = WHITE
 
-class OrganizationalMemoryScene(Scene):
+class OrganizationalMemoryScene(MemoryCensusMixin, ProfilerMixin, Scene):
     def construct(self):
         self.camera.background_color = BACKGROUND_COLOR
 
@@ -1359,6 +1362,7 @@ class PDFToVectorTable(Scene):
         self.wait(5)
 
 from manim import *
+from background_layer import bake_background
 
 # --- Global Color Palette ---
 PRIMARY_COLOR = "#db2777"      
@@ -1384,6 +1388,8 @@ class DataSynchronizationScene(Scene):
         db_label = Text("Vector Database", font_size=24, color=PRIMARY_COLOR, weight=BOLD).to_edge(UP, buff=0.4).shift(RIGHT*2.2)
 
         self.play(Create(div_line), Write(source_label), Write(db_label))
+        # Divider and headings stay put for the rest of the scene
+        bake_background(self, div_line, source_label, db_label)
 
         # --- 2. Source Document ---
         doc_rect = Rectangle(width=2.4, height=3.8, color=BORDER_COLOR, fill_opacity=0.05).move_to([PDF_X, -0.5, 0])
@@ -2064,6 +2070,8 @@ class VectorDatabaseDeepDive(ThreeDScene):
 
 from manim import *
 import numpy as np
+from render_profiler import ProfilerMixin
+from memory_census import MemoryCensusMixin
 
 # ==============================================================================
 # GLOBAL COLOR PALETTE & TECHNICAL CONSTANTS
@@ -2118,7 +2126,7 @@ class Chunk(VGroup):
 # MAIN SCENE
 # ==============================================================================
 
-class OrganizationalMemoryScene(ThreeDScene):
+class OrganizationalMemoryScene(MemoryCensusMixin, ProfilerMixin, ThreeDScene):
     """
     Expert AI Explainer: Vector Store Lifecycle.
     
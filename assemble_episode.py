@@ -0,0 +1,218 @@
+from manim.constants import QUALITIES
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import av
+from lossless_partials import LOSSLESS_CODEC, LOSSLESS_EXTENSION
+
+# ==========================================
+# EPISODE ASSEMBLY WITHOUT RE-ENCODING
+# ==========================================
+# An episode is many scene movies played back to back. episodes.json lists
+# each episode's script and its scenes in order; this script renders them
+# with one set of encoder settings and joins the results by stream copy
+# (the concat demuxer, packets copied as-is), the same way manim joins the
+# partial movies of a single scene. Nothing is decoded or re-encoded, so a
+# 20-scene episode assembles in seconds.
+#
+# Stream copy is only valid when every input has identical codec parameters,
+# so all scenes are rendered through --render with the same quality flag and
+# container, and the inputs are checked before anything is written.
+#
+#   python assemble_episode.py how_chatgpt_works_2 -q h --render
+#   python assemble_episode.py how_chatgpt_works_2 -q h
+#
+# Scenes from another script can be listed as "other_script.py:SceneName".
+#
+# With --lossless the scenes are rendered to lossless FFV1 movies (manim run
+# through lossless_partials.py, which makes every scene lossless)
+# and joined into a lossless episode master for trimming; the delivery MP4 is
+# then encoded once, one scene per worker process, and the encoded chunks are
+# joined by stream copy. Every input has to be FFV1, or nothing is written.
+
+MANIFEST = Path(__file__).resolve().parent / "episodes.json"
+QUALITY_FLAGS = {quality["flag"]: quality for quality in QUALITIES.values() if quality["flag"]}
+DELIVERY_CODEC = "libx264"
+DELIVERY_PIX_FMT = "yuv420p"
+DELIVERY_OPTIONS = {"crf": "18", "preset": "slow"}  # One encode per episode, so spend the time
+
+
+def load_manifest(path=MANIFEST):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def scene_entries(episode):
+    """(script, scene) pairs in playback order."""
+    entries = []
+    for scene in episode["scenes"]:
+        script, _, name = scene.rpartition(":")
+        entries.append((script or episode["script"], name))
+    return entries
+
+
+def movie_path(media_dir, script, scene, quality):
+    """Where `manim render` writes a scene's final movie."""
+    resolution = f"{quality['pixel_height']}p{quality['frame_rate']}"
+    return Path(media_dir) / "videos" / Path(script).stem / resolution / f"{scene}.mp4"
+
+
+def render_scenes(entries, flag, media_dir, lossless=False):
+    """Render every scene with the same quality and container, one manim run per script."""
+    # lossless_partials.py runs the manim CLI with the lossless writer installed in every scene
+    runner = [str(Path(__file__).resolve().parent / "lossless_partials.py")] if lossless else ["-m", "manim"]
+    by_script = {}
+    for script, scene in entries:
+        by_script.setdefault(script, []).append(scene)
+    for script, scenes in by_script.items():
+        command = [sys.executable, *runner, "render", f"-q{flag}", "--format", "mp4",
+                   "--media_dir", str(media_dir), script, *scenes]
+        print(" ".join(command))
+        subprocess.run(command, check=True)
+
+
+def newest_movie(path):
+    """The newer of <Scene>.mp4 and <Scene>.mkv, so a stale movie of the other kind is never picked."""
+    candidates = [p for p in (path, path.with_suffix(LOSSLESS_EXTENSION)) if p.exists()]
+    return max(candidates, key=lambda p: p.stat().st_mtime, default=path)
+
+
+def stream_settings(path):
+    """Codec parameters that have to match for a stream copy to play back correctly."""
+    with av.open(str(path)) as container:
+        streams = [(stream.type, stream.codec_context.name) for stream in container.streams]
+        video = container.streams.video[0]
+        return {
+            "streams": streams,
+            "codec": video.codec_context.name,
+            "profile": video.profile,
+            "pix_fmt": video.format.name,
+            "size": (video.width, video.height),
+            "frame_rate": video.average_rate,
+            "time_base": video.time_base,
+        }
+
+
+def check_settings(paths):
+    """Raise ValueError naming every input whose settings differ from the first."""
+    reference = stream_settings(paths[0])
+    mismatches = []
+    for path in paths[1:]:
+        settings = stream_settings(path)
+        diff = {key: value for key, value in settings.items() if value != reference[key]}
+        if diff:
+            mismatches.append(f"  {path}: {diff}")
+    if mismatches:
+        raise ValueError(
+            f"Scenes were rendered with different encoder settings than {paths[0]} ({reference}):\n"
+            + "\n".join(mismatches)
+            + "\nRe-render them with --render so the episode can be stream-copied."
+        )
+
+
+def concat_copy(paths, output_file):
+    """Join movies with the concat demuxer, copying packets without re-encoding."""
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    file_list = output_file.with_suffix(".txt")
+    with file_list.open("w", encoding="utf-8") as fp:
+        for path in paths:
+            fp.write(f"file 'file:{Path(path).resolve().as_posix()}'\n")
+    concat_input = av.open(str(file_list), options={"safe": "0", "an": "1"}, format="concat")
+    input_stream = concat_input.streams.video[0]
+    output_container = av.open(str(output_file), mode="w")
+    output_stream = output_container.add_stream(template=input_stream)
+    for packet in concat_input.demux(input_stream):
+        if packet.dts is None:
+            continue  # Flushing packets
+        packet.dts = None  # Let libav recompute dts across file boundaries
+        packet.stream = output_stream
+        output_container.mux(packet)
+    concat_input.close()
+    output_container.close()
+    file_list.unlink()
+
+
+def encode_chunk(source, chunk_file):
+    """Delivery-encode one lossless scene movie; run in a worker process."""
+    with av.open(str(source)) as source_container:
+        source_stream = source_container.streams.video[0]
+        with av.open(str(chunk_file), mode="w") as chunk_container:
+            stream = chunk_container.add_stream(DELIVERY_CODEC, rate=source_stream.average_rate, options=DELIVERY_OPTIONS)
+            stream.pix_fmt = DELIVERY_PIX_FMT
+            stream.width = source_stream.width
+            stream.height = source_stream.height
+            for frame in source_container.decode(source_stream):
+                frame.pts = None  # Renumber in the output's time base
+                for packet in stream.encode(frame):
+                    chunk_container.mux(packet)
+            for packet in stream.encode():
+                chunk_container.mux(packet)
+    return chunk_file
+
+
+def deliver(sources, output_file, jobs):
+    """Encode every scene in parallel with identical settings, then join the chunks by stream copy."""
+    chunk_dir = output_file.with_suffix("")
+    chunk_dir.mkdir(parents=True, exist_ok=True)
+    chunk_files = [chunk_dir / f"{i:03}.mp4" for i in range(len(sources))]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        list(pool.map(encode_chunk, sources, chunk_files))
+    concat_copy(chunk_files, output_file)
+    for chunk_file in chunk_files:
+        chunk_file.unlink()
+    chunk_dir.rmdir()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Assemble an episode from its scene movies by stream copy.")
+    parser.add_argument("episode", help="Episode name in episodes.json")
+    parser.add_argument("-q", "--quality", default="h", choices=sorted(QUALITY_FLAGS), help="manim quality flag")
+    parser.add_argument("--render", action="store_true", help="Render the scenes first with matching settings")
+    parser.add_argument("--lossless", action="store_true", help="Use lossless scene movies and encode the episode once")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="Parallel encodes with --lossless")
+    parser.add_argument("--media_dir", default="media")
+    parser.add_argument("--manifest", default=MANIFEST)
+    args = parser.parse_args()
+
+    episode = load_manifest(args.manifest)[args.episode]
+    quality = QUALITY_FLAGS[args.quality]
+    entries = scene_entries(episode)
+    if args.render:
+        render_scenes(entries, args.quality, args.media_dir, args.lossless)
+
+    paths = [movie_path(args.media_dir, script, scene, quality) for script, scene in entries]
+    if args.lossless:
+        paths = [newest_movie(path) for path in paths]
+    missing = [str(path) for path in paths if not path.exists()]
+    if missing:
+        sys.exit("Missing scene movies (render them with --render):\n  " + "\n  ".join(missing))
+    if args.lossless:
+        codecs = {path: stream_settings(path)["codec"] for path in paths}
+        lossy = [f"{path} ({codec})" for path, codec in codecs.items() if codec != LOSSLESS_CODEC]
+        if lossy:
+            sys.exit("--lossless needs FFV1 scene movies; these are lossy (re-render with --render --lossless):\n  "
+                     + "\n  ".join(lossy))
+
+    resolution = f"{quality['pixel_height']}p{quality['frame_rate']}"
+    output_file = Path(args.media_dir) / "episodes" / f"{args.episode}_{resolution}.mp4"
+    start = time.perf_counter()
+    if args.lossless:
+        check_settings(paths)
+        master_file = output_file.with_name(f"{output_file.stem}_master{LOSSLESS_EXTENSION}")
+        concat_copy(paths, master_file)
+        print(f"{master_file}: lossless master of {len(paths)} scenes")
+        deliver(paths, output_file, args.jobs)
+        print(f"{output_file}: {len(paths)} scenes encoded in {time.perf_counter() - start:.1f}s")
+    else:
+        check_settings(paths)
+        concat_copy(paths, output_file)
+        print(f"{output_file}: {len(paths)} scenes joined in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
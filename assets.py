@@ -0,0 +1,104 @@
+from manim import *
+from pathlib import Path, PureWindowsPath
+from PIL import Image
+import numpy as np
+import hashlib
+import os
+
+# ==========================================
+# RELOCATABLE ASSETS AND DECODED IMAGE CACHE
+# ==========================================
+# Scenes used to load images from hard-coded Windows paths (D:\manim\...),
+# so every render elsewhere fell into the placeholder branch, and the ones
+# that did find the file decoded a full-size JPEG only to set_height(1.875).
+#
+# asset_image() looks names up under ASSET_ROOT (set MANIM_ASSET_ROOT, default
+# ./assets next to these scripts) and builds the ImageMobject from pixels that
+# are already decoded and resized to the size the image will cover at the
+# active quality. Those pixels are cached as raw .npy arrays under
+# media/asset_cache, keyed by a hash of the file contents and the target size,
+# and memory-mapped copy-on-write so parallel renders share one copy.
+#
+#   MANIM_ASSET_ROOT=/mnt/assets manim -qh 4_RAG_pipeline.py RAGPipeline
+
+ASSET_ROOT = Path(os.environ.get("MANIM_ASSET_ROOT", Path(__file__).resolve().parent / "assets"))
+RESIZE_FILTER = Image.LANCZOS   # Downscaling only; sources are never upscaled
+
+_CONTENT_HASHES = {}  # (path, mtime, size) -> content hash, so files are hashed once per process
+
+
+def asset_cache_dir():
+    return Path(config.media_dir) / "asset_cache"
+
+
+def asset_path(name):
+    """
+    Path of asset `name` under ASSET_ROOT. Legacy absolute paths such as
+    r"D:\\manim\\images\\llm.jpg" resolve by file name, trying images/ too.
+    """
+    path = Path(name)
+    if not PureWindowsPath(name).is_absolute() and not path.is_absolute():
+        return ASSET_ROOT / path
+    file_name = PureWindowsPath(name).name
+    for candidate in (ASSET_ROOT / file_name, ASSET_ROOT / "images" / file_name):
+        if candidate.exists():
+            return candidate
+    return ASSET_ROOT / file_name
+
+
+def content_hash(path):
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    if key not in _CONTENT_HASHES:
+        _CONTENT_HASHES[key] = hashlib.sha256(path.read_bytes()).hexdigest()[:32]
+    return _CONTENT_HASHES[key]
+
+
+def target_pixel_size(source_size, height=None, width=None, zoom=1):
+    """Pixel size the image covers on screen at the active quality, capped at the source size."""
+    source_width, source_height = source_size
+    pixels_per_unit = zoom * config.pixel_height / config.frame_height
+    if height is not None:
+        scale = height * pixels_per_unit / source_height
+    else:
+        scale = width * pixels_per_unit / source_width
+    scale = min(scale, 1.0)
+    return max(1, round(source_width * scale)), max(1, round(source_height * scale))
+
+
+def decoded_pixels(path, height=None, width=None, zoom=1):
+    """RGBA uint8 pixels of `path` resized for the active quality, read through the disk cache."""
+    with Image.open(path) as image:
+        size = target_pixel_size(image.size, height, width, zoom)
+        cache_path = asset_cache_dir() / f"{content_hash(path)}_{size[0]}x{size[1]}.npy"
+        if not cache_path.exists():
+            pixels = np.asarray(image.convert("RGBA").resize(size, RESIZE_FILTER), dtype=np.uint8)
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so a parallel render never maps a half-written file
+            partial_path = cache_path.with_suffix(f".{os.getpid()}.partial")
+            with open(partial_path, "wb") as f:
+                np.save(f, pixels)
+            os.replace(partial_path, cache_path)
+    # Copy-on-write: pages are shared between renders until a scene recolors the image
+    return np.load(cache_path, mmap_mode="c")
+
+
+def asset_image(name, height=None, width=None, zoom=1, **kwargs):
+    """
+    ImageMobject of asset `name` sized to `height` (or `width`) scene units.
+    Pass `zoom` when a moving camera shows it magnified, so it stays sharp.
+    Raises FileNotFoundError if the asset is missing, like ImageMobject does.
+    """
+    if height is None and width is None:
+        raise ValueError("asset_image needs a height or a width to pick the cached pixel size")
+    path = asset_path(name)
+    if not path.exists():
+        raise FileNotFoundError(f"Asset {name!r} not found under {ASSET_ROOT}")
+    pixels = decoded_pixels(path, height, width, zoom)
+    image = ImageMobject(pixels, **kwargs)
+    image.pixel_array = pixels  # Keep the mapping instead of ImageMobject's private copy
+    if height is not None:
+        image.height = height
+    else:
+        image.width = width
+    return image
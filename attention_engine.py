@@ -0,0 +1,133 @@
+import numpy as np
+
+# ==========================================
+# ATTENTION ENGINE: BATCHED QK^T, SOFTMAX, WEIGHTED SUM
+# ==========================================
+# The transformer scenes (Scene12AttentionMatrix, Scene13SoftmaxUpdated,
+# Scene14WeightedSum) all show one attention computation at different steps.
+# Their numbers come from here instead of being typed into each scene:
+#
+#   scores  = Q K^T / sqrt(d)        scaled_scores
+#   weights = row softmax(scores)    softmax (optionally causal)
+#   output  = weights V              attention
+#
+# Everything works on stacked arrays: (..., n, d) inputs with any number of
+# leading batch / head axes, so multi-head attention is split_heads, one
+# attention call and merge_heads. Long sequences (thousands of tokens) are
+# processed in blocks of query rows, so only one block of n x n temporaries
+# exists at a time, and float32 keeps a 4096-token weight matrix at 64 MB.
+
+BLOCK_ROWS = 1024   # Query rows per block for long sequences
+DTYPE = np.float32
+
+# --- The example sentence used across the attention scenes ---
+# Hand-set 4-d vectors on interpretable axes (noun, action, function word,
+# position) rather than trained weights, so every number on screen can be
+# explained: the query of "sat" asks for the thing doing the sitting, which
+# the key of "cat" offers.
+SENTENCE = ["The", "cat", "sat", "on", "the"]
+SENTENCE_QUERIES = np.array([
+    #  noun  action  func   pos
+    [2.0,   0.0,   0.4,   0.0],   # The -> looks for its noun
+    [0.2,   2.0,   0.0,   0.6],   # cat -> looks for what it does
+    [3.6,   0.8,   0.2,   0.0],   # sat -> looks for who sits
+    [0.6,   1.4,   0.0,   1.6],   # on  -> looks for the verb and what follows
+    [0.8,   0.0,   2.0,   0.8],   # the -> looks for other function words
+])
+SENTENCE_KEYS = np.array([
+    [0.2,   0.0,   1.2,   0.0],   # The
+    [2.0,   0.2,   0.0,   0.2],   # cat
+    [0.6,   1.6,   0.0,   0.4],   # sat
+    [0.0,   0.8,   0.8,   1.0],   # on
+    [0.2,   0.0,   1.2,   1.2],   # the
+])
+SENTENCE_VALUES = np.eye(len(SENTENCE))  # One-hot: the output row is the mix itself
+
+
+def scaled_scores(queries, keys):
+    """Q K^T / sqrt(d) for (..., n, d) queries and (..., m, d) keys -> (..., n, m)."""
+    queries = np.asarray(queries, dtype=DTYPE)
+    keys = np.asarray(keys, dtype=DTYPE)
+    return queries @ np.swapaxes(keys, -1, -2) / np.sqrt(DTYPE(queries.shape[-1]))
+
+
+def causal_mask(num_queries, num_keys=None, offset=0):
+    """True where query i may not see key j (j > i + offset)."""
+    num_keys = num_queries if num_keys is None else num_keys
+    return np.arange(num_keys)[None, :] > np.arange(num_queries)[:, None] + offset
+
+
+def softmax(scores, mask=None, out=None):
+    """Numerically stable softmax over the last axis; masked entries get weight 0."""
+    out = np.subtract(scores, 0, out=out, dtype=DTYPE)
+    if mask is not None:
+        out[..., mask] = -np.inf
+    out -= out.max(axis=-1, keepdims=True)
+    np.exp(out, out=out)
+    out /= out.sum(axis=-1, keepdims=True)
+    return out
+
+
+def attention(queries, keys, values, causal=False, block_rows=BLOCK_ROWS):
+    """
+    Scaled dot-product attention for (..., n, d) inputs.
+    Returns (output (..., n, d_v), weights (..., n, m)), computed in blocks of query rows.
+    """
+    queries = np.asarray(queries, dtype=DTYPE)
+    keys = np.asarray(keys, dtype=DTYPE)
+    values = np.asarray(values, dtype=DTYPE)
+    num_queries, num_keys = queries.shape[-2], keys.shape[-2]
+    batch = np.broadcast_shapes(queries.shape[:-2], keys.shape[:-2], values.shape[:-2])
+    weights = np.empty(batch + (num_queries, num_keys), dtype=DTYPE)
+    output = np.empty(batch + (num_queries, values.shape[-1]), dtype=DTYPE)
+    for start in range(0, num_queries, block_rows):
+        rows = slice(start, start + block_rows)
+        block = weights[..., rows, :]
+        block[...] = scaled_scores(queries[..., rows, :], keys)
+        mask = causal_mask(block.shape[-2], num_keys, offset=start) if causal else None
+        softmax(block, mask, out=block)
+        np.matmul(block, values, out=output[..., rows, :])
+    return output, weights
+
+
+def split_heads(x, num_heads):
+    """(..., n, d) -> (..., heads, n, d / heads)."""
+    x = np.asarray(x)
+    *batch, n, d = x.shape
+    if d % num_heads:
+        raise ValueError(f"Model width {d} is not divisible by {num_heads} heads")
+    return np.swapaxes(x.reshape(*batch, n, num_heads, d // num_heads), -3, -2)
+
+
+def merge_heads(x):
+    """(..., heads, n, d_head) -> (..., n, heads * d_head)."""
+    x = np.swapaxes(np.asarray(x), -3, -2)
+    return x.reshape(*x.shape[:-2], -1)
+
+
+def multi_head_attention(x, w_q, w_k, w_v, num_heads, causal=False):
+    """
+    Project (..., n, d_model) embeddings, attend per head and merge.
+    Returns (output (..., n, d_model), weights (..., heads, n, n)).
+    """
+    x = np.asarray(x, dtype=DTYPE)
+    queries, keys, values = (split_heads(x @ np.asarray(w, dtype=DTYPE), num_heads) for w in (w_q, w_k, w_v))
+    output, weights = attention(queries, keys, values, causal=causal)
+    return merge_heads(output), weights
+
+
+def random_embeddings(num_tokens, dim, seed=0):
+    """Reproducible unit-variance token embeddings for long-context demos."""
+    rng = np.random.default_rng(seed)
+    return rng.standard_normal((num_tokens, dim), dtype=DTYPE)
+
+
+def highlight_opacity(weights, max_opacity=0.9):
+    """Cell highlight intensity: each row's weights relative to its largest."""
+    return max_opacity * weights / weights.max(axis=-1, keepdims=True)
+
+
+def sentence_attention():
+    """(scores, weights, output) for SENTENCE, shared by the attention scenes."""
+    output, weights = attention(SENTENCE_QUERIES, SENTENCE_KEYS, SENTENCE_VALUES)
+    return scaled_scores(SENTENCE_QUERIES, SENTENCE_KEYS), weights, output
@@ -0,0 +1,81 @@
+from manim import *
+from manim.utils.family import extract_mobject_family_members
+import numpy as np
+import hashlib
+from pathlib import Path
+
+# ==========================================
+# RASTERIZE-ONCE BACKGROUND LAYERS
+# ==========================================
+# A full-frame NumberPlane, a title that stays put, a divider line: once they
+# are on screen they never change, yet the Cairo renderer redraws them at the
+# start of every play (static image) and on every frame of a wait with
+# updaters. bake_background() draws them once into the camera's background
+# array and removes them from the scene, so every later clear starts from a
+# frame that already contains them.
+#
+# Layers are cached per quality (pixel size and frame) and per content under
+# media/background_layers, so re-renders skip the rasterization entirely.
+#
+# Manim's partial-movie hash skips camera.background, and the baked mobjects
+# are no longer in the scene, so the layer keys are kept in
+# camera.background_layers, which is hashed: editing a baked mobject changes
+# the hash of every later animation instead of reusing stale partial movies.
+
+_LAYERS = {}  # In-process cache, keyed like the files on disk
+
+
+def background_cache_dir():
+    return Path(config.media_dir) / "background_layers"
+
+
+def layer_key(camera, mobjects):
+    """Content hash of the mobjects' geometry and style plus the camera's output format."""
+    digest = hashlib.sha256()
+    digest.update(repr((camera.pixel_width, camera.pixel_height, camera.frame_width,
+                        camera.frame_height, tuple(camera.frame_center))).encode())
+    digest.update(np.ascontiguousarray(camera.background).tobytes())
+    for leaf in extract_mobject_family_members(mobjects, only_those_with_points=True):
+        digest.update(type(leaf).__name__.encode())
+        for attr in ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"):
+            if hasattr(leaf, attr):
+                digest.update(np.ascontiguousarray(getattr(leaf, attr), dtype=np.float64).tobytes())
+        digest.update(repr((getattr(leaf, "stroke_width", None), leaf.z_index)).encode())
+    return digest.hexdigest()[:32]
+
+
+def rasterize_layer(camera, mobjects):
+    """The camera's background with `mobjects` drawn on top, as a pixel array."""
+    saved = np.array(camera.pixel_array)
+    # set_pixel_array rather than reset(): some cameras defer the clear to the next capture
+    camera.set_pixel_array(camera.background)
+    camera.capture_mobjects(mobjects)
+    layer = np.array(camera.pixel_array)
+    camera.set_pixel_array(saved)
+    return layer
+
+
+def bake_background(scene, *mobjects, use_disk_cache=True):
+    """
+    Move `mobjects` into the scene's background raster. They are removed from
+    the scene and must not be animated afterwards; setting
+    camera.background_color rebuilds the background and drops baked layers.
+    """
+    camera = scene.camera
+    key = layer_key(camera, mobjects)
+    path = background_cache_dir() / f"{key}.npy"
+    caching = use_disk_cache and not config["disable_caching"]
+    if key in _LAYERS:
+        layer = _LAYERS[key]
+    elif caching and path.exists():
+        layer = np.load(path)
+    else:
+        layer = rasterize_layer(camera, mobjects)
+        if caching:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            np.save(path, layer)
+    _LAYERS[key] = layer
+    camera.background = layer
+    camera.background_layers = getattr(camera, "background_layers", ()) + (key,)
+    scene.remove(*mobjects)
+    return layer
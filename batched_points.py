@@ -0,0 +1,142 @@
+from manim import *
+import numpy as np
+
+# ==========================================
+# BATCHED POINT ARRAYS FOR GROUP ANIMATIONS
+# ==========================================
+# Manim animates a VGroup by walking every family member and interpolating
+# each one in Python. For groups of identical pieces that only move, we pack
+# all their points into one contiguous array, point every leaf's `.points`
+# at its slice of that array, and update the whole cluster with a single
+# NumPy expression per frame.
+
+
+def apply_rate_func(rate_func, alphas):
+    """Evaluate a rate function over an array, falling back to a loop for scalar-only ones."""
+    alphas = np.asarray(alphas, dtype=np.float64)
+    try:
+        values = np.asarray(rate_func(alphas), dtype=np.float64)
+        if values.shape == alphas.shape:
+            return values
+    except (TypeError, ValueError):
+        pass
+    return np.array([rate_func(a) for a in alphas.ravel()]).reshape(alphas.shape)
+
+
+def lagged_alphas(alpha, count, lag_ratio):
+    """Vectorized Animation.get_sub_alpha: local progress of every member at once."""
+    full_length = (count - 1) * lag_ratio + 1
+    lower = np.arange(count) * lag_ratio
+    return np.clip(alpha * full_length - lower, 0, 1)
+
+
+class PointBuffer:
+    """
+    One (M, 3) array holding the points of every leaf under `members`.
+    While attached, each leaf's `.points` is a view into `data`, so writing
+    to `data` moves the whole group without touching the leaves one by one.
+    """
+    def __init__(self, members):
+        self.members = list(members)
+        self.leaves = []
+        member_sizes = []
+        for member in self.members:
+            leaves = member.family_members_with_points()
+            self.leaves.extend(leaves)
+            member_sizes.append(sum(len(leaf.points) for leaf in leaves))
+
+        self.member_sizes = np.array(member_sizes, dtype=int)
+        self.member_starts = np.concatenate([[0], np.cumsum(self.member_sizes)[:-1]]).astype(int)
+        # owner[k] = index of the member that point k belongs to
+        self.owner = np.repeat(np.arange(len(self.members)), self.member_sizes)
+
+        if self.leaves:
+            self.data = np.concatenate([np.asarray(leaf.points, dtype=np.float64) for leaf in self.leaves])
+        else:
+            self.data = np.zeros((0, 3))
+        start = 0
+        for leaf in self.leaves:
+            stop = start + len(leaf.points)
+            leaf.points = self.data[start:stop]
+            start = stop
+
+    def member_centers(self):
+        """Bounding-box centers of every member, like get_center(), without a Python loop."""
+        centers = np.zeros((len(self.members), 3))
+        filled = self.member_sizes > 0
+        if np.any(filled):
+            starts = self.member_starts[filled]
+            lows = np.minimum.reduceat(self.data, starts, axis=0)
+            highs = np.maximum.reduceat(self.data, starts, axis=0)
+            centers[filled] = (lows + highs) / 2
+        return centers
+
+    def detach(self):
+        """Give every leaf its own array again so later edits can't alias the buffer."""
+        for leaf in self.leaves:
+            leaf.points = np.array(leaf.points)
+
+
+class AttributeBuffer:
+    """
+    Same idea as PointBuffer for any per-leaf array attribute (points,
+    fill_rgbas, stroke_rgbas, ...): one contiguous `data` array, with each
+    leaf's attribute set to a view of its slice.
+    """
+    def __init__(self, leaves, attr):
+        self.leaves = list(leaves)
+        self.attr = attr
+        arrays = [np.asarray(getattr(leaf, attr), dtype=np.float64) for leaf in self.leaves]
+        self.data = np.concatenate(arrays) if arrays else np.zeros((0, 3))
+        start = 0
+        for leaf, array in zip(self.leaves, arrays):
+            setattr(leaf, attr, self.data[start:start + len(array)])
+            start += len(array)
+
+    def detach(self):
+        for leaf in self.leaves:
+            setattr(leaf, self.attr, np.array(getattr(leaf, self.attr)))
+
+
+class ClusterTransform(Animation):
+    """
+    Moves every member of `cluster` to the matching position in `target`
+    (a group with the same number of members, or an (N, 3) array of centers).
+
+    Unlike Transform(cluster, target_group) it never aligns or interpolates
+    the members' shapes: members keep their own geometry and style and only
+    translate, which is exactly what a point-cloud regrouping needs.
+    """
+    def __init__(self, cluster, target, **kwargs):
+        if isinstance(target, Mobject):
+            target = [member.get_center() for member in target.submobjects]
+        self.target_centers = np.array(target, dtype=np.float64).reshape(-1, 3)
+        if len(self.target_centers) != len(cluster.submobjects):
+            raise ValueError(
+                f"ClusterTransform needs one target per member: "
+                f"{len(cluster.submobjects)} members, {len(self.target_centers)} targets"
+            )
+        super().__init__(cluster, **kwargs)
+
+    def create_starting_mobject(self):
+        # The start state lives in self.start_points; no deep copy of the cluster
+        return Mobject()
+
+    def begin(self):
+        self.buffer = PointBuffer(self.mobject.submobjects)
+        self.start_points = self.buffer.data.copy()
+        self.offsets = self.target_centers - self.buffer.member_centers()
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        count = len(self.buffer.members)
+        if self.lag_ratio == 0:
+            alphas = np.full(count, self.rate_func(alpha))
+        else:
+            alphas = apply_rate_func(self.rate_func, lagged_alphas(alpha, count, self.lag_ratio))
+        displacement = alphas[:, None] * self.offsets
+        np.add(self.start_points, displacement[self.buffer.owner], out=self.buffer.data)
+
+    def finish(self):
+        super().finish()
+        self.buffer.detach()
@@ -0,0 +1,205 @@
+from manim import *
+from manim.animation.animation import prepare_animation
+from manim.utils.hashing import _Memoizer, get_json
+from collections import OrderedDict
+import numpy as np
+import hashlib
+from pathlib import Path
+from batched_points import AttributeBuffer
+
+# ==========================================
+# PRE-COMPILED ANIMATION TIMELINES
+# ==========================================
+# FadeIn(row, shift=RIGHT), GrowArrow(...) or box.animate.shift(...) have
+# fixed targets: every frame they produce depends only on alpha. We sample
+# the wrapped animation once into dense per-frame arrays (points and colors
+# for every leaf) and play it back by copying one slice per frame into
+# buffers the leaves already point at.
+#
+# Scene units do not depend on resolution, so timelines are sampled once per
+# frame at the render's frame rate and stored on disk: -qh and -qk (both
+# 60 fps) renders of the same animation index into the same file.
+
+MAX_TIMELINE_BYTES = 256 * 1024 ** 2
+MAX_CACHED_BYTES = 512 * 1024 ** 2   # In-process cache size; least recently used timelines go first
+ARRAY_ATTRS = ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+SCALAR_ATTRS = ("stroke_width", "background_stroke_width")
+
+_TIMELINES = OrderedDict()  # In-process LRU cache, keyed like the files on disk
+
+
+def timeline_bytes(timeline):
+    return sum(array.nbytes for array in timeline.values())
+
+
+def cache_timeline(key, timeline):
+    _TIMELINES[key] = timeline
+    _TIMELINES.move_to_end(key)
+    total = sum(timeline_bytes(t) for t in _TIMELINES.values())
+    while total > MAX_CACHED_BYTES and len(_TIMELINES) > 1:
+        _, evicted = _TIMELINES.popitem(last=False)
+        total -= timeline_bytes(evicted)
+
+
+def timeline_cache_dir():
+    return Path(config.media_dir) / "compiled_timelines"
+
+
+class CompiledAnimation(Animation):
+    """
+    Plays `animation` from a pre-sampled timeline.
+
+    Falls back to the wrapped animation's own interpolation whenever the
+    timeline can't represent it: updaters on the mobject, non-vector leaves,
+    or a family whose structure changes mid-animation.
+    """
+    def __init__(self, animation, use_disk_cache=True, **kwargs):
+        animation = prepare_animation(animation)
+        self.animation = animation
+        self.use_disk_cache = use_disk_cache
+        self.compiled = False
+        super().__init__(
+            animation.mobject,
+            run_time=animation.run_time,
+            rate_func=linear,
+            introducer=animation.is_introducer(),
+            remover=animation.is_remover(),
+            suspend_mobject_updating=animation.suspend_mobject_updating,
+            **kwargs,
+        )
+
+    # --- Setup ---
+    def begin(self):
+        inner = self.animation
+        # play(..., run_time=2, rate_func=...) lands on the wrapper; hand it down
+        inner.run_time = self.run_time
+        if self.rate_func is not linear:
+            inner.rate_func = self.rate_func
+
+        key = self.get_timeline_key() if self.can_compile() else None
+        inner.begin()
+        self.starting_mobject = getattr(inner, "starting_mobject", None)
+        if key is not None:
+            self.leaves = self.mobject.family_members_with_points()
+            timeline = self.load_timeline(key) or self.compile_timeline(key)
+            if timeline is not None and self.matches_layout(timeline):
+                self.bind_timeline(timeline)
+        self.interpolate(0)
+
+    def can_compile(self):
+        if self.mobject is None or self.mobject.get_family_updaters():
+            return False
+        leaves = self.mobject.family_members_with_points()
+        return bool(leaves) and all(isinstance(leaf, VMobject) for leaf in leaves)
+
+    def get_timeline_key(self):
+        samples = self.get_num_samples()
+        # get_json memoizes every object it visits; without the resets that state
+        # would leak into (and change) the next play-call hash
+        _Memoizer.reset_already_processed()
+        try:
+            state = get_json(self.animation.__dict__)
+        except (TypeError, ValueError):
+            return None
+        finally:
+            _Memoizer.reset_already_processed()
+        description = f"{type(self.animation).__name__}|{samples}|{state}"
+        return hashlib.sha256(description.encode()).hexdigest()[:32]
+
+    def get_num_samples(self):
+        return max(2, int(round(self.run_time * config.frame_rate)) + 1)
+
+    # --- Compilation ---
+    def snapshot(self):
+        arrays = {attr: [np.array(getattr(leaf, attr), dtype=np.float64) for leaf in self.leaves] for attr in ARRAY_ATTRS}
+        scalars = {attr: [float(getattr(leaf, attr)) for leaf in self.leaves] for attr in SCALAR_ATTRS}
+        return arrays, scalars
+
+    def compile_timeline(self, key):
+        samples = self.get_num_samples()
+        frames = {attr: [] for attr in ARRAY_ATTRS + SCALAR_ATTRS}
+        shapes = None
+        for k in range(samples):
+            self.animation.interpolate(k / (samples - 1))
+            if self.mobject.family_members_with_points() != self.leaves:
+                return None
+            arrays, scalars = self.snapshot()
+            current = [[a.shape for a in arrays[attr]] for attr in ARRAY_ATTRS]
+            if shapes is None:
+                shapes = current
+                size = sum(a.nbytes for attr in ARRAY_ATTRS for a in arrays[attr])
+                if size * samples > MAX_TIMELINE_BYTES:
+                    return None
+            elif current != shapes:
+                return None
+            for attr in ARRAY_ATTRS:
+                frames[attr].append(np.concatenate(arrays[attr]) if arrays[attr] else np.zeros((0, 3)))
+            for attr in SCALAR_ATTRS:
+                frames[attr].append(scalars[attr])
+
+        timeline = {attr: np.array(frames[attr]) for attr in frames}
+        cache_timeline(key, timeline)
+        if self.use_disk_cache and not config["disable_caching"]:
+            path = timeline_cache_dir() / f"{key}.npz"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            np.savez(path, **timeline)
+        return timeline
+
+    def load_timeline(self, key):
+        if key in _TIMELINES:
+            _TIMELINES.move_to_end(key)
+            return _TIMELINES[key]
+        path = timeline_cache_dir() / f"{key}.npz"
+        if not self.use_disk_cache or config["disable_caching"] or not path.exists():
+            return None
+        with np.load(path) as stored:
+            timeline = {attr: stored[attr] for attr in stored.files}
+        cache_timeline(key, timeline)
+        return timeline
+
+    def matches_layout(self, timeline):
+        return all(
+            timeline[attr].shape[1:] == np.concatenate(
+                [np.asarray(getattr(leaf, attr)) for leaf in self.leaves]
+            ).shape
+            for attr in ARRAY_ATTRS
+        )
+
+    def bind_timeline(self, timeline):
+        self.timeline = timeline
+        self.packs = {attr: AttributeBuffer(self.leaves, attr) for attr in ARRAY_ATTRS}
+        # Only replay stroke widths that actually change over the animation
+        self.varying_scalars = [
+            attr for attr in SCALAR_ATTRS
+            if not np.all(timeline[attr] == timeline[attr][0])
+        ]
+        self.compiled = True
+
+    # --- Playback ---
+    def interpolate(self, alpha):
+        if not self.compiled:
+            self.animation.interpolate(alpha)
+            return
+        samples = len(self.timeline["points"])
+        k = int(round(np.clip(alpha, 0, 1) * (samples - 1)))
+        for attr, pack in self.packs.items():
+            np.copyto(pack.data, self.timeline[attr][k])
+        for attr in self.varying_scalars:
+            for leaf, value in zip(self.leaves, self.timeline[attr][k]):
+                setattr(leaf, attr, value)
+
+    def update_mobjects(self, dt):
+        self.animation.update_mobjects(dt)
+
+    def finish(self):
+        # The wrapped animation sets the exact final state and owns its cleanup
+        self.compiled = False
+        self.animation.finish()
+
+    def clean_up_from_scene(self, scene):
+        self.animation.clean_up_from_scene(scene)
+
+
+def compiled(*animations, **kwargs):
+    """Wrap several animations at once: self.play(*compiled(FadeIn(a), GrowArrow(b)))."""
+    return [CompiledAnimation(animation, **kwargs) for animation in animations]
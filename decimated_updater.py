@@ -0,0 +1,132 @@
+from manim import *
+import numpy as np
+from batched_points import AttributeBuffer
+
+# ==========================================
+# DECIMATED UPDATERS
+# ==========================================
+# Background drift doesn't need a Python updater call per output frame: at
+# 60 fps each particle moves a fraction of a pixel per frame.
+# A DecimatedUpdater runs the real updater at `tick_rate` Hz and fills the
+# frames in between by blending the last two tick states with one NumPy
+# expression. Display trails the simulation by one tick (1/15 s by default),
+# which is invisible for ambient motion.
+#
+# Updaters that know the buffer (drift_updater) write it in place with one
+# vectorized add per tick. Any other updater still works, but the points are
+# gathered into the buffer again after each of its ticks, since shift, scale
+# and friends replace the leaves' arrays.
+#
+# Ambient camera rotation is left to ThreeDScene.begin_ambient_camera_rotation:
+# its updater is a single increment, and what a rotating 3D scene pays for
+# is rasterizing every frame, which decimating the tracker doesn't change.
+
+DEFAULT_TICK_RATE = 15   # Real updater calls per second of scene time
+
+
+class DecimatedUpdater:
+    """
+    Wraps a time-based updater `func(mobject, dt)` so it only runs every
+    1 / tick_rate seconds. Pass it to add_updater like any dt-updater.
+    Only the family's points are interpolated; style changes made by `func`
+    show up on the next tick.
+
+    The family is gathered again when members are added or removed. An
+    animation that replaces the members' point arrays detaches them from the
+    buffer: call bind(mobject) after it.
+    """
+    def __init__(self, func, tick_rate=DEFAULT_TICK_RATE):
+        self.func = func
+        self.tick = 1.0 / tick_rate
+        self.elapsed = 0.0
+        self.family = None
+        self.buffer = None
+        self.ticks = 0
+        self.calls = 0
+
+    def __call__(self, mobject, dt):
+        self.calls += 1
+        # Per frame only the submobject list is compared, not the whole family
+        if family_key(mobject) != self.family:
+            self.bind(mobject)
+        self.elapsed += dt
+        while self.elapsed >= self.tick:
+            self.step(mobject)
+            self.elapsed -= self.tick
+        # Blend prev -> curr straight into the leaves' point views
+        np.multiply(self.delta, self.elapsed / self.tick, out=self.buffer.data)
+        self.buffer.data += self.previous
+
+    def bind(self, mobject):
+        self.family = family_key(mobject)
+        self.buffer = AttributeBuffer(mobject.family_members_with_points(), "points")
+        self.previous = self.buffer.data.copy()
+        self.current = self.buffer.data.copy()
+        self.delta = np.zeros_like(self.current)
+        if hasattr(self.func, "bind"):
+            self.func.bind(mobject, self.buffer)
+
+    def step(self, mobject):
+        # Advance the real state from the last tick, not from the blended frame
+        np.copyto(self.buffer.data, self.current)
+        self.func(mobject, self.tick)
+        self.ticks += 1
+        if not hasattr(self.func, "bind"):
+            # A plain updater may have replaced the arrays or the family; re-gather them
+            leaves = mobject.family_members_with_points()
+            if leaves != self.buffer.leaves or sum(len(leaf.points) for leaf in leaves) != len(self.current):
+                self.bind(mobject)
+                return
+            self.buffer = AttributeBuffer(leaves, "points")
+        self.previous, self.current = self.current, self.previous
+        np.copyto(self.current, self.buffer.data)
+        np.subtract(self.current, self.previous, out=self.delta)
+
+
+def family_key(mobject):
+    """Changes when members are added to or removed from the mobject."""
+    return id(mobject.submobjects), len(mobject.submobjects)
+
+
+def add_decimated_updater(mobject, func, tick_rate=DEFAULT_TICK_RATE):
+    """mobject.add_updater(func) with func run at `tick_rate` Hz and interpolated in between."""
+    updater = DecimatedUpdater(func, tick_rate)
+    mobject.add_updater(updater)
+    return updater
+
+
+class Drift:
+    """
+    Moves member i of a group by velocities[i] * dt (ambient particles).
+    Bound to a DecimatedUpdater's buffer it is one vectorized add on the
+    buffer; as a plain updater it shifts each member.
+    """
+    def __init__(self, velocities):
+        self.velocities = np.asarray(velocities, dtype=np.float64)
+        self.buffer = None
+        self.point_velocities = None
+
+    def bind(self, group, buffer):
+        by_leaf = {
+            id(leaf): velocity
+            for member, velocity in zip(group.submobjects, self.velocities)
+            for leaf in member.family_members_with_points()
+        }
+        still = np.zeros(3)
+        self.buffer = buffer
+        self.point_velocities = np.repeat(
+            np.array([by_leaf.get(id(leaf), still) for leaf in buffer.leaves]).reshape(-1, 3),
+            [len(leaf.points) for leaf in buffer.leaves], axis=0,
+        )
+
+    def __call__(self, group, dt):
+        if self.buffer is not None:
+            self.buffer.data += self.point_velocities * dt
+            return
+        for member, velocity in zip(group.submobjects, self.velocities):
+            member.shift(velocity * dt)
+
+
+def drift_updater(velocities):
+    """One updater moving member i of a group by velocities[i] * dt (ambient particles)."""
+    return Drift(velocities)
@@ -0,0 +1,84 @@
+from manim import *
+import numpy as np
+
+# ==========================================
+# CACHED DEPTH REFERENCE POINTS FOR 3D SCENES
+# ==========================================
+# ThreeDCamera sorts every mobject (and every Surface/Cube face) by depth on
+# each frame, and the expensive part is not the sort: it is the key function,
+# which calls get_z_index_reference_point() (a Python get_center walk over the
+# mobject's anchors) for every face, every frame. During a camera rotation
+# nothing moves, so those reference points never change.
+#
+# This camera caches them. Each frame it gathers the points of every face
+# into one array and compares it with last frame's in one vectorized check;
+# only faces whose points changed get a new reference point. Depths are then
+# one `refs @ rot[2]` and the order one stable argsort.
+#
+# Not yet used by a production scene: it needs a before/after timing from a
+# rotating scene first (e.g. VectorDatabaseMorphScene).
+
+
+def is_own_reference(mob):
+    """True if the mobject's z-index reference point depends only on its own points."""
+    return not mob.submobjects and getattr(mob, "z_index_group", mob) is mob and len(mob.points) > 0
+
+
+class DepthSortCacheCamera(ThreeDCamera):
+    """
+    ThreeDCamera that caches each mobject's z-index reference point until its
+    points change. The order is the same stable sort ThreeDCamera produces.
+    """
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.depth_sort_stats = {"reused": 0, "recomputed": 0}
+        self._cached_key = None
+        self._cached_points = None
+        self._cached_refs = None
+
+    def get_mobjects_to_display(self, *args, **kwargs):
+        # Skip ThreeDCamera's own sort; we do it below
+        mobjects = Camera.get_mobjects_to_display(self, *args, **kwargs)
+        if len(mobjects) < 2:
+            return mobjects
+        shaded = np.array([getattr(mob, "shade_in_3d", False) for mob in mobjects], dtype=bool)
+        depths = self.get_reference_points(mobjects, shaded) @ self.get_rotation_matrix()[2]
+        depths[~shaded] = np.inf  # Flat mobjects go last, in z-index order
+        return [mobjects[i] for i in np.argsort(depths, kind="stable")]
+
+    def get_reference_points(self, mobjects, shaded):
+        """(n, 3) reference points; rows of unshaded mobjects are unused."""
+        cacheable = shaded & np.array([is_own_reference(mob) for mob in mobjects], dtype=bool)
+        indices = np.flatnonzero(cacheable)
+        points = [mobjects[i].points for i in indices]
+        lengths = [len(p) for p in points]
+        flat = np.concatenate(points) if points else np.zeros((0, 3))
+        key = (tuple(map(id, mobjects)), cacheable.tobytes(), tuple(lengths))
+
+        if key == self._cached_key:
+            refs = self._cached_refs
+            # One row per point; a face needs a new reference point if any of its rows moved
+            moved = np.any(flat != self._cached_points, axis=1)
+            starts = np.cumsum([0] + lengths[:-1])
+            changed = indices[np.logical_or.reduceat(moved, starts)] if len(indices) else indices
+        else:
+            refs = np.zeros((len(mobjects), 3))
+            changed = indices
+        for i in changed:
+            refs[i] = mobjects[i].get_z_index_reference_point()
+        # Groups and mobjects with a z_index_group read other mobjects' points: never cached
+        for i in np.flatnonzero(shaded & ~cacheable):
+            refs[i] = mobjects[i].get_z_index_reference_point()
+
+        self.depth_sort_stats["recomputed"] += len(changed)
+        self.depth_sort_stats["reused"] += len(indices) - len(changed)
+        self._cached_key = key
+        self._cached_points = flat
+        self._cached_refs = refs
+        return refs
+
+
+class DepthCachedThreeDScene(ThreeDScene):
+    """Drop-in ThreeDScene base class that renders with DepthSortCacheCamera."""
+    def __init__(self, camera_class=DepthSortCacheCamera, **kwargs):
+        super().__init__(camera_class=camera_class, **kwargs)
@@ -0,0 +1,227 @@
+from manim import *
+import numpy as np
+import itertools as it
+import zlib
+
+# ==========================================
+# DIRTY-REGION RASTERIZATION FOR THE CAIRO CAMERA
+# ==========================================
+# The Cairo renderer clears the frame to the background (or the static image
+# of the current play) and redraws every moving mobject on every frame, even
+# when only one attention cell or one checkmark changed. This camera keeps the
+# last frame, fingerprints every leaf it draws, and on the next frame only
+# restores and redraws the screen tiles covered by leaves that changed,
+# appeared or disappeared, with Cairo clipped to those tiles.
+#
+# Anything it can't reason about locally (image / point-cloud mobjects,
+# gradient-backed VMobjects, a moving camera frame, z-order changes, a new
+# static image) makes it draw the whole frame exactly like Camera does.
+
+TILE_SIZE = 32               # Pixels per side of one dirty tile
+MAX_DIRTY_FRACTION = 0.5     # Above this share of tiles a full redraw is cheaper
+ANTIALIAS_PADDING = 2        # Extra pixels around every bounding box
+MITER_EXTENT = 5             # Cairo's default miter limit (10) in half line widths
+
+
+def is_cairo_drawn(camera, leaf):
+    """True for leaves the camera draws through Cairo (they respect clips and
+    can go on transparent surfaces); images and point clouds are numpy-blitted."""
+    return camera.type_or_raise(leaf) is VMobject and leaf.get_background_image() is None
+
+
+def leaf_fingerprint(leaf):
+    """Checksum of everything Cairo reads when drawing a VMobject leaf."""
+    checksum = 0
+    for array in (leaf.points, leaf.fill_rgbas, leaf.stroke_rgbas, leaf.background_stroke_rgbas, leaf.sheen_direction):
+        checksum = zlib.crc32(np.ascontiguousarray(array, dtype=np.float64).tobytes(), checksum)
+    style = (leaf.stroke_width, leaf.background_stroke_width, leaf.sheen_factor, leaf.joint_type, leaf.cap_style)
+    return checksum, hash(tuple(str(value) for value in style))
+
+
+def leaf_pixel_box(camera, leaf):
+    """(x0, y0, x1, y1) pixel bounds of a leaf including stroke, joins and antialiasing."""
+    points = leaf.points
+    if len(points) == 0:
+        return (0, 0, 0, 0)
+    scale_x = camera.pixel_width / camera.frame_width
+    scale_y = camera.pixel_height / camera.frame_height
+    width = max(leaf.stroke_width, leaf.background_stroke_width)
+    pad = MITER_EXTENT * width * camera.cairo_line_width_multiple
+    low = points[:, :2].min(axis=0) - pad
+    high = points[:, :2].max(axis=0) + pad
+    x0 = (low[0] - camera.frame_center[0]) * scale_x + camera.pixel_width / 2
+    x1 = (high[0] - camera.frame_center[0]) * scale_x + camera.pixel_width / 2
+    y0 = (camera.frame_center[1] - high[1]) * scale_y + camera.pixel_height / 2
+    y1 = (camera.frame_center[1] - low[1]) * scale_y + camera.pixel_height / 2
+    return (
+        int(np.floor(x0)) - ANTIALIAS_PADDING,
+        int(np.floor(y0)) - ANTIALIAS_PADDING,
+        int(np.ceil(x1)) + ANTIALIAS_PADDING,
+        int(np.ceil(y1)) + ANTIALIAS_PADDING,
+    )
+
+
+class DirtyRegionCamera(Camera):
+    """
+    Camera that re-rasterizes only the tiles that changed since the last frame.
+    `dirty_stats` counts full, partial and unchanged frames and redrawn pixels.
+    """
+    def __init__(self, **kwargs):
+        self.pending_base = None
+        self.retained = None
+        self.dirty_stats = {"full": 0, "partial": 0, "unchanged": 0, "redrawn_pixels": 0, "total_pixels": 0}
+        super().__init__(**kwargs)
+
+    # --- Deferred clears ---
+    def reset(self):
+        if not hasattr(self, "pixel_array") or self.pixel_array.shape != self.background.shape:
+            self.retained = None
+            return super().reset()
+        self.pending_base = self.background
+        return self
+
+    def set_frame_to_background(self, background):
+        # Don't wipe the retained frame yet: capture_mobjects decides what to restore
+        self.pending_base = background
+
+    # --- Capture ---
+    def capture_mobjects(self, mobjects, **kwargs):
+        base, self.pending_base = self.pending_base, None
+        if base is None:
+            # Drawing on top of whatever is there (no clear requested): plain behavior
+            self.retained = None
+            return super().capture_mobjects(mobjects, **kwargs)
+
+        leaves = self.get_mobjects_to_display(mobjects, **kwargs)
+        state = self.describe_frame(base, leaves)
+        rects = self.find_dirty_rects(state)
+        self.retained = state
+        self.dirty_stats["total_pixels"] += self.pixel_width * self.pixel_height
+        if rects is None:
+            self.dirty_stats["full"] += 1
+            self.dirty_stats["redrawn_pixels"] += self.pixel_width * self.pixel_height
+            self.set_pixel_array(base)
+            self.display_leaves(leaves)
+        elif not rects:
+            self.dirty_stats["unchanged"] += 1
+        else:
+            self.dirty_stats["partial"] += 1
+            self.redraw_rects(base, leaves, state, rects)
+
+    def display_leaves(self, leaves):
+        for group_type, group in it.groupby(leaves, self.type_or_raise):
+            self.display_funcs[group_type](list(group), self.pixel_array)
+
+    def describe_frame(self, base, leaves):
+        frame = (tuple(self.frame_center), self.frame_width, self.frame_height)
+        drawable = all(self.is_locally_drawable(leaf) for leaf in leaves)
+        return {
+            "base": base,
+            "frame": frame,
+            "drawable": drawable,
+            "ids": [id(leaf) for leaf in leaves],
+            "fingerprints": [self.fingerprint(leaf) for leaf in leaves] if drawable else None,
+            "boxes": np.array([self.pixel_box(leaf) for leaf in leaves]).reshape(-1, 4) if drawable else None,
+        }
+
+    def is_locally_drawable(self, leaf):
+        return is_cairo_drawn(self, leaf)
+
+    def fingerprint(self, leaf):
+        return leaf_fingerprint(leaf)
+
+    def pixel_box(self, leaf):
+        return leaf_pixel_box(self, leaf)
+
+    # --- Dirty tiles ---
+    def find_dirty_rects(self, state):
+        """Pixel rectangles to redraw: [] for an identical frame, None for a full redraw."""
+        previous = self.retained
+        if previous is None or not state["drawable"] or not previous["drawable"]:
+            return None
+        if state["base"] is not previous["base"] or state["frame"] != previous["frame"]:
+            return None
+
+        old_index = {leaf_id: i for i, leaf_id in enumerate(previous["ids"])}
+        new_index = {leaf_id: i for i, leaf_id in enumerate(state["ids"])}
+        common_old = [leaf_id for leaf_id in previous["ids"] if leaf_id in new_index]
+        common_new = [leaf_id for leaf_id in state["ids"] if leaf_id in old_index]
+        if common_old != common_new:
+            return None  # Z-order changed among surviving leaves
+
+        dirty_boxes = []
+        for leaf_id, i in new_index.items():
+            j = old_index.get(leaf_id)
+            if j is None:
+                dirty_boxes.append(state["boxes"][i])
+            elif state["fingerprints"][i] != previous["fingerprints"][j]:
+                dirty_boxes.append(state["boxes"][i])
+                dirty_boxes.append(previous["boxes"][j])
+        for leaf_id, j in old_index.items():
+            if leaf_id not in new_index:
+                dirty_boxes.append(previous["boxes"][j])
+        if not dirty_boxes:
+            return []
+
+        tiles = self.mark_tiles(np.array(dirty_boxes))
+        if tiles.mean() > MAX_DIRTY_FRACTION:
+            return None
+        return self.tiles_to_rects(tiles)
+
+    def mark_tiles(self, boxes):
+        rows = -(-self.pixel_height // TILE_SIZE)
+        cols = -(-self.pixel_width // TILE_SIZE)
+        tiles = np.zeros((rows, cols), dtype=bool)
+        tx0 = np.clip(boxes[:, 0] // TILE_SIZE, 0, cols)
+        ty0 = np.clip(boxes[:, 1] // TILE_SIZE, 0, rows)
+        tx1 = np.clip(-(-boxes[:, 2] // TILE_SIZE), 0, cols)
+        ty1 = np.clip(-(-boxes[:, 3] // TILE_SIZE), 0, rows)
+        for x0, y0, x1, y1 in zip(tx0, ty0, tx1, ty1):
+            tiles[y0:y1, x0:x1] = True
+        return tiles
+
+    def tiles_to_rects(self, tiles):
+        """Merge each tile row into horizontal runs: (x0, y0, x1, y1) in pixels."""
+        rects = []
+        for row, line in enumerate(tiles):
+            edges = np.flatnonzero(np.diff(np.concatenate([[0], line.astype(np.int8), [0]])))
+            for start, stop in zip(edges[::2], edges[1::2]):
+                rects.append((
+                    int(start) * TILE_SIZE,
+                    row * TILE_SIZE,
+                    min(int(stop) * TILE_SIZE, self.pixel_width),
+                    min((row + 1) * TILE_SIZE, self.pixel_height),
+                ))
+        return rects
+
+    # --- Partial redraw ---
+    def redraw_rects(self, base, leaves, state, rects):
+        for x0, y0, x1, y1 in rects:
+            self.pixel_array[y0:y1, x0:x1] = base[y0:y1, x0:x1]
+            self.dirty_stats["redrawn_pixels"] += (x1 - x0) * (y1 - y0)
+
+        rect_array = np.array(rects)
+        boxes = state["boxes"]
+        overlaps = (
+            (boxes[:, None, 0] < rect_array[None, :, 2]) & (boxes[:, None, 2] > rect_array[None, :, 0])
+            & (boxes[:, None, 1] < rect_array[None, :, 3]) & (boxes[:, None, 3] > rect_array[None, :, 1])
+        ).any(axis=1)
+
+        ctx = self.get_cairo_context(self.pixel_array)
+        ctx.save()
+        matrix = ctx.get_matrix()
+        ctx.identity_matrix()
+        for x0, y0, x1, y1 in rects:
+            ctx.rectangle(x0, y0, x1 - x0, y1 - y0)
+        ctx.clip()
+        ctx.set_matrix(matrix)
+        for leaf, overlap in zip(leaves, overlaps):
+            if overlap:
+                self.display_vectorized(leaf, ctx)
+        ctx.restore()
+
+
+class DirtyRegionScene(Scene):
+    """Drop-in Scene base class that renders with DirtyRegionCamera."""
+    def __init__(self, camera_class=DirtyRegionCamera, **kwargs):
+        super().__init__(camera_class=camera_class, **kwargs)
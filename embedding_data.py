@@ -0,0 +1,165 @@
+import numpy as np
+import os
+
+# ==========================================
+# EMBEDDING DATA: .npy LOADING & 3D PROJECTION
+# ==========================================
+# Real embedding matrices (N x D, float32) are memory-mapped and streamed in
+# row chunks, so a 1M x 768 file (~3 GB) never has to fit in RAM.
+# Only the sampled rows that are actually drawn get projected to 3D.
+#
+# Labels come from an optional text file with one label per matrix row
+# (EMBEDDING_LABELS), read line by line for the sampled rows only. Text is the
+# expensive part of a labelled cloud, so only a few labels are drawn: the
+# points nearest the camera, skipping any that would crowd one already chosen.
+
+EMBEDDING_FILE = os.environ.get("EMBEDDING_FILE")      # Optional .npy path used by the scenes
+EMBEDDING_LABELS = os.environ.get("EMBEDDING_LABELS")  # Optional labels, one line per matrix row
+CHUNK_ROWS = 8192                                   # ~25 MB per chunk for D=768 float32
+DEFAULT_MAX_POINTS = 2000                           # Cairo stays fast well past this
+DEFAULT_MAX_LABELS = 6                              # Labels are the expensive part (Text)
+
+
+def load_embedding_matrix(path):
+    """Memory-map an N x D embedding matrix stored as .npy."""
+    matrix = np.load(path, mmap_mode="r")
+    if matrix.ndim != 2:
+        raise ValueError(f"Expected an N x D matrix in {path}, got shape {matrix.shape}")
+    return matrix
+
+
+def iter_row_chunks(matrix, rows=None, chunk_rows=CHUNK_ROWS):
+    """Yield (start, chunk) pairs as float64 copies of consecutive row blocks."""
+    if rows is None:
+        for start in range(0, len(matrix), chunk_rows):
+            yield start, np.asarray(matrix[start:start + chunk_rows], dtype=np.float64)
+    else:
+        # Sorted fancy indexing keeps reads on the mmap sequential
+        for start in range(0, len(rows), chunk_rows):
+            yield start, np.asarray(matrix[rows[start:start + chunk_rows]], dtype=np.float64)
+
+
+def sample_rows(num_rows, max_points=DEFAULT_MAX_POINTS, seed=0):
+    """Sorted, reproducible subset of row indices to draw."""
+    if num_rows <= max_points:
+        return np.arange(num_rows)
+    rng = np.random.default_rng(seed)
+    return np.sort(rng.choice(num_rows, size=max_points, replace=False))
+
+
+def fit_pca_basis(matrix, fit_rows=None, chunk_rows=CHUNK_ROWS):
+    """
+    Streaming PCA: accumulates the sum and the D x D scatter matrix chunk by
+    chunk, then keeps the top three eigenvectors of the covariance.
+    Returns (mean, basis) with basis shaped D x 3.
+    """
+    dim = matrix.shape[1]
+    total = np.zeros(dim)
+    scatter = np.zeros((dim, dim))
+    count = 0
+    for _, chunk in iter_row_chunks(matrix, fit_rows, chunk_rows):
+        total += chunk.sum(axis=0)
+        scatter += chunk.T @ chunk
+        count += len(chunk)
+    if count < 2:
+        raise ValueError("PCA needs at least two rows")
+
+    mean = total / count
+    cov = (scatter - count * np.outer(mean, mean)) / (count - 1)
+    eigenvalues, eigenvectors = np.linalg.eigh(cov)
+    # eigh sorts ascending; take the three largest, strongest first
+    basis = eigenvectors[:, np.argsort(eigenvalues)[::-1][:3]]
+    return mean, basis
+
+
+def random_projection_basis(dim, seed=0):
+    """Gaussian random projection (Johnson-Lindenstrauss) to three axes."""
+    rng = np.random.default_rng(seed)
+    return rng.standard_normal((dim, 3)) / np.sqrt(3)
+
+
+def project_to_3d(matrix, rows=None, method="pca", fit_rows=None, seed=0, chunk_rows=CHUNK_ROWS):
+    """
+    Project the given rows (default: all) of an N x D matrix to N x 3.
+    method="pca" fits on `fit_rows` (default: every row, one extra pass);
+    method="random" needs no fitting pass at all.
+    """
+    if method == "pca":
+        mean, basis = fit_pca_basis(matrix, fit_rows, chunk_rows)
+    elif method == "random":
+        mean, basis = np.zeros(matrix.shape[1]), random_projection_basis(matrix.shape[1], seed)
+    else:
+        raise ValueError(f"Unknown projection method: {method}")
+
+    count = len(matrix) if rows is None else len(rows)
+    projected = np.empty((count, 3), dtype=np.float32)
+    for start, chunk in iter_row_chunks(matrix, rows, chunk_rows):
+        projected[start:start + len(chunk)] = (chunk - mean) @ basis
+    return projected
+
+
+def fit_to_cube(points, half_extent=3.0):
+    """Center the cloud and scale it uniformly into [-half_extent, half_extent]^3."""
+    points = np.asarray(points, dtype=np.float64)
+    if len(points) == 0:
+        return points.reshape(0, 3)
+    centered = points - (points.max(axis=0) + points.min(axis=0)) / 2
+    largest = np.abs(centered).max()
+    return centered * (half_extent / largest) if largest > 0 else centered
+
+
+def load_projected_points(path, max_points=DEFAULT_MAX_POINTS, half_extent=3.0, method="pca", seed=0):
+    """One-call path for scenes: mmap, sample, project and fit to the axes box."""
+    matrix = load_embedding_matrix(path)
+    rows = sample_rows(len(matrix), max_points, seed)
+    # Fit PCA on the drawn sample too: cheap, and faithful to what is on screen
+    points = project_to_3d(matrix, rows=rows, method=method, fit_rows=rows, seed=seed)
+    return rows, fit_to_cube(points, half_extent)
+
+
+def load_labels(path, rows):
+    """Labels of the given sorted rows, streamed from a file with one label per matrix row."""
+    labels = []
+    wanted = iter(np.asarray(rows).tolist())
+    target = next(wanted, None)
+    with open(path, encoding="utf-8") as handle:
+        for index, line in enumerate(handle):
+            if target is None:
+                break
+            if index == target:
+                labels.append(line.rstrip("\n"))
+                target = next(wanted, None)
+    if target is not None:
+        raise ValueError(f"{path} has no label for row {target}")
+    return labels
+
+
+def select_label_indices(points, priorities, max_labels=DEFAULT_MAX_LABELS, min_separation=0.6):
+    """
+    Label level-of-detail: greedily keep the highest-priority points whose
+    labels would not crowd an already chosen one.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    chosen = []
+    for index in np.argsort(priorities)[::-1]:
+        if len(chosen) >= max_labels:
+            break
+        if chosen and np.min(np.linalg.norm(points[chosen] - points[index], axis=1)) < min_separation:
+            continue
+        chosen.append(int(index))
+    return chosen
+
+
+def embedding_cloud(count, half_extent=3.0, path=None, labels_path=None, seed=0):
+    """
+    (points, labels) from `path` (or EMBEDDING_FILE) and `labels_path` (or
+    EMBEDDING_LABELS). Points are None if no matrix is configured, labels None
+    if no label file is.
+    """
+    path = path or EMBEDDING_FILE
+    if not path or not os.path.exists(path):
+        return None, None
+    rows, points = load_projected_points(path, max_points=count, half_extent=half_extent, seed=seed)
+    labels_path = labels_path or EMBEDDING_LABELS
+    labels = load_labels(labels_path, rows) if labels_path else None
+    return points, labels
@@ -0,0 +1,157 @@
+from manim import *
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.family import extract_mobject_family_members
+from manim.utils.iterables import list_update
+import numpy as np
+import hashlib
+
+# ==========================================
+# FRAME-CONTENT HASH CACHE
+# ==========================================
+# wait() already freezes a single frame, but inside play() mobjects often hold
+# still for many frames: a rate_func that has settled, the finished elements
+# of a LaggedStart while its tail plays out, a zoom that has arrived. The
+# Cairo renderer still clears and redraws all of them on every frame.
+#
+# FrameHashRenderer hashes everything a frame is drawn from (the background
+# or static image, every leaf's points, colors and style in draw order, and
+# the camera's frame and orientation). When the hash matches the previous
+# frame it skips the clear and the capture and hands the encoder the previous
+# frame again. Hits and misses are logged once per scene.
+
+LEAF_ARRAYS = ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "sheen_direction", "rgbas", "pixel_array")
+LEAF_STYLE = ("stroke_width", "background_stroke_width", "sheen_factor", "joint_type", "cap_style",
+              "z_index", "shade_in_3d", "background_image", "resampling_algorithm")
+CAMERA_ANGLES = ("get_phi", "get_theta", "get_gamma", "get_focal_distance", "get_zoom")  # ThreeDCamera
+
+
+def update_with_array(digest, array):
+    array = np.ascontiguousarray(array)
+    digest.update(repr((array.dtype.str, array.shape)).encode())
+    digest.update(array)
+
+
+def camera_state(camera):
+    """Everything besides the mobjects that decides where pixels land."""
+    state = [tuple(camera.frame_center), camera.frame_width, camera.frame_height, camera.pixel_array.shape]
+    for getter in CAMERA_ANGLES:
+        if hasattr(camera, getter):
+            state.append(getattr(camera, getter)())
+    for name in ("fixed_in_frame_mobjects", "fixed_orientation_mobjects"):
+        fixed = getattr(camera, name, None)
+        if fixed:
+            state.append(sorted(id(mob) for mob in fixed))
+    return repr(state).encode()
+
+
+class FrameHashRenderer(CairoRenderer):
+    """
+    CairoRenderer that reuses the previous raster when a frame's content hash
+    is unchanged. `frame_stats` counts reused and drawn frames.
+    """
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.frame_stats = {"reused": 0, "drawn": 0}
+        self.last_key = None
+        self.last_frame = None
+        self.frame_reused = False
+        self.base_digests = {}  # id(base array) -> (base, digest); a base is hashed once
+
+    # --- Hashing ---
+    def base_digest(self, base):
+        cached = self.base_digests.get(id(base))
+        if cached is None or cached[0] is not base:
+            digest = hashlib.blake2b(digest_size=16)
+            update_with_array(digest, base)
+            # Only the current static image and the camera background are ever looked up
+            self.base_digests = {
+                key: value for key, value in self.base_digests.items()
+                if value[0] is self.static_image or value[0] is self.camera.background
+            }
+            cached = self.base_digests[id(base)] = (base, digest.digest())
+        return cached[1]
+
+    def frame_key(self, mobjects, include_submobjects, excluded_mobjects=None):
+        base = self.static_image if self.static_image is not None else self.camera.background
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.base_digest(base))
+        digest.update(camera_state(self.camera))
+        if excluded_mobjects:
+            digest.update(repr(sorted(map(id, excluded_mobjects))).encode())
+        if include_submobjects:
+            leaves = extract_mobject_family_members(mobjects, only_those_with_points=True)
+        else:
+            leaves = mobjects
+        # Family order, z_index and the camera fully determine the draw order
+        for leaf in leaves:
+            digest.update(type(leaf).__name__.encode())
+            for attr in LEAF_ARRAYS:
+                array = getattr(leaf, attr, None)
+                if array is not None:
+                    update_with_array(digest, array)
+            digest.update(repr(tuple(str(getattr(leaf, attr, None)) for attr in LEAF_STYLE)).encode())
+        return digest.digest()
+
+    # --- Frames ---
+    def update_frame(self, scene, mobjects=None, include_submobjects=True, ignore_skipping=True, **kwargs):
+        self.frame_reused = False
+        if self.skip_animations and not ignore_skipping:
+            return
+        if not mobjects:
+            mobjects = list_update(scene.mobjects, scene.foreground_mobjects)
+        key = self.frame_key(mobjects, include_submobjects, kwargs.get("excluded_mobjects"))
+        if key == self.last_key:
+            # The camera still holds exactly this frame
+            self.frame_reused = True
+            self.frame_stats["reused"] += 1
+            return
+        self.frame_stats["drawn"] += 1
+        self.last_key = key
+        self.last_frame = None
+        super().update_frame(scene, mobjects, include_submobjects, ignore_skipping, **kwargs)
+
+    def render(self, scene, time, moving_mobjects):
+        self.update_frame(scene, moving_mobjects)
+        if not self.frame_reused or self.last_frame is None:
+            # Frames handed to the writer are never modified, so one copy can be queued repeatedly
+            self.last_frame = self.get_frame()
+        self.add_frame(self.last_frame)
+
+    def scene_finished(self, scene):
+        super().scene_finished(scene)
+        total = self.frame_stats["reused"] + self.frame_stats["drawn"]
+        logger.info(
+            "Frame hash cache: %(reused)d of %(total)d frames reused (%(rate).1f%%)",
+            {
+                "reused": self.frame_stats["reused"],
+                "total": total,
+                "rate": 100 * self.frame_stats["reused"] / max(total, 1),
+            },
+        )
+
+
+def install_frame_hash_renderer(scene):
+    """Swap the plain CairoRenderer Scene.__init__ built for a FrameHashRenderer."""
+    old = scene.renderer
+    if type(old) is not CairoRenderer:
+        return
+    renderer = FrameHashRenderer(
+        file_writer_class=old._file_writer_class,
+        camera_class=type(old.camera),
+        skip_animations=old._original_skipping_status,
+    )
+    # Keep the scene's camera and file writer; nothing has been drawn or written yet
+    renderer.camera = old.camera
+    renderer.file_writer = old.file_writer
+    renderer.file_writer.renderer = renderer
+    scene.renderer = renderer
+
+
+class FrameHashMixin:
+    """
+    Put first in the bases (class MyScene(FrameHashMixin, MovingCameraScene))
+    to skip rasterizing frames identical to the previous one.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        install_frame_hash_renderer(self)
@@ -0,0 +1,149 @@
+from manim import *
+import numpy as np
+from batched_points import AttributeBuffer, PointBuffer, apply_rate_func, lagged_alphas
+
+# ==========================================
+# LAGGED MAP: ONE ANIMATION FOR A WHOLE GROUP
+# ==========================================
+# LaggedStart(*[FadeIn(d) for d in dots], lag_ratio=0.005) builds one FadeIn,
+# one faded deep copy and one Transform per dot, then interpolates every one of
+# them in Python each frame. For the fade/grow templates every element's
+# frame is a straight blend between a start state and its current state, so
+# we keep both as flat arrays and blend the whole group with one vector of
+# local alphas per frame.
+
+COLOR_ATTRS = ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+SUPPORTED_TEMPLATES = (FadeIn, FadeOut, GrowFromCenter)
+
+
+class LaggedMap(Animation):
+    """
+    Same frames as LaggedStart(*[template(m, ...) for m in group], lag_ratio=...)
+    for template in FadeIn / FadeOut / GrowFromCenter, without creating an
+    animation per element. `rate_func` is the group's (linear, as in LaggedStart),
+    `element_rate_func` the one each child animation would have had.
+    """
+    def __init__(
+        self,
+        template,
+        group,
+        lag_ratio=DEFAULT_LAGGED_START_LAG_RATIO,
+        element_rate_func=smooth,
+        shift=None,
+        scale=1,
+        point_color=None,
+        **kwargs
+    ):
+        if template not in SUPPORTED_TEMPLATES:
+            raise ValueError(
+                f"LaggedMap supports {', '.join(t.__name__ for t in SUPPORTED_TEMPLATES)}; "
+                f"use lagged_map() to fall back to LaggedStart for {template.__name__}"
+            )
+        self.template = template
+        self.element_rate_func = element_rate_func
+        self.shift_vector = np.zeros(3) if shift is None else np.asarray(shift, dtype=np.float64)
+        self.scale_factor = scale
+        self.point_color = point_color
+        kwargs.setdefault("rate_func", linear)
+        kwargs.setdefault("introducer", template is not FadeOut)
+        kwargs.setdefault("remover", template is FadeOut)
+        super().__init__(group, lag_ratio=lag_ratio, **kwargs)
+
+    def create_starting_mobject(self):
+        # Both ends of the blend live in flat arrays; no per-element copies
+        return Mobject()
+
+    # --- Setup ---
+    def begin(self):
+        self.point_buffer = PointBuffer(self.mobject.submobjects)
+        leaves = self.point_buffer.leaves
+        leaf_owner = np.repeat(np.arange(len(self.point_buffer.members)), [
+            len(member.family_members_with_points()) for member in self.point_buffer.members
+        ])
+        self.color_buffers = {attr: AttributeBuffer(leaves, attr) for attr in COLOR_ATTRS}
+        # owner[attr][k] = element that row k of that attribute's buffer belongs to
+        self.owners = {"points": self.point_buffer.owner}
+        for attr in COLOR_ATTRS:
+            rows = [len(getattr(leaf, attr)) for leaf in leaves]
+            self.owners[attr] = np.repeat(leaf_owner, rows)
+
+        current = {"points": self.point_buffer.data.copy()}
+        current.update({attr: buffer.data.copy() for attr, buffer in self.color_buffers.items()})
+        hidden = self.hidden_state(current)
+        if self.template is FadeOut:
+            self.starts, self.ends = current, hidden
+        else:
+            self.starts, self.ends = hidden, current
+        self.deltas = {attr: self.ends[attr] - self.starts[attr] for attr in self.starts}
+        super().begin()
+
+    def hidden_state(self, current):
+        """Every element's state at local alpha 0 of FadeIn/GrowFromCenter (1 of FadeOut)."""
+        hidden = {attr: array.copy() for attr, array in current.items()}
+        centers = self.point_buffer.member_centers()[self.owners["points"]]
+        if self.template is GrowFromCenter:
+            # Transform from copy().scale(0): every point starts on its element's center
+            hidden["points"] = centers
+            if self.point_color is not None:
+                rgb = color_to_rgb(self.point_color)
+                hidden["fill_rgbas"][:, :3] = rgb
+                hidden["stroke_rgbas"][:, :3] = rgb
+            return hidden
+        # _Fade: fade(1), shift (inward for FadeIn), then scale about the shifted center
+        direction = -1 if self.template is FadeIn else 1
+        shift = direction * self.shift_vector
+        hidden["points"] = centers + shift + (current["points"] - centers) * self.scale_factor
+        for attr in COLOR_ATTRS:
+            hidden[attr][:, 3] = 0
+        return hidden
+
+    # --- Playback ---
+    def interpolate_mobject(self, alpha):
+        # The group's rate_func warps time before lagging, as in AnimationGroup.interpolate
+        alpha = self.rate_func(alpha)
+        count = len(self.point_buffer.members)
+        alphas = apply_rate_func(self.element_rate_func, lagged_alphas(alpha, count, self.lag_ratio))
+        self.blend("points", self.point_buffer.data, alphas)
+        for attr, buffer in self.color_buffers.items():
+            self.blend(attr, buffer.data, alphas)
+
+    def blend(self, attr, out, alphas):
+        if len(out) == 0:
+            return
+        np.multiply(self.deltas[attr], alphas[self.owners[attr]][:, None], out=out)
+        out += self.starts[attr]
+
+    def finish(self):
+        super().finish()
+        self.point_buffer.detach()
+        for buffer in self.color_buffers.values():
+            buffer.detach()
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        if self.is_remover():
+            # Like FadeOut: the removed group keeps its original look for reuse
+            for leaf, attr, array in self.iter_leaf_slices(self.starts):
+                setattr(leaf, attr, array)
+
+    def iter_leaf_slices(self, arrays):
+        leaves = self.point_buffer.leaves
+        for attr in ("points",) + COLOR_ATTRS:
+            start = 0
+            for leaf in leaves:
+                size = len(getattr(leaf, attr))
+                yield leaf, attr, arrays[attr][start:start + size].copy()
+                start += size
+
+
+def lagged_map(template, group, lag_ratio=DEFAULT_LAGGED_START_LAG_RATIO, **kwargs):
+    """
+    LaggedMap when the template is supported, otherwise the equivalent
+    LaggedStart, so call sites can switch without checking the template.
+    """
+    if template in SUPPORTED_TEMPLATES:
+        return LaggedMap(template, group, lag_ratio=lag_ratio, **kwargs)
+    group_kwargs = {k: kwargs.pop(k) for k in ("run_time", "rate_func") if k in kwargs}
+    if "element_rate_func" in kwargs:
+        kwargs["rate_func"] = kwargs.pop("element_rate_func")
+    return LaggedStart(*[template(member, **kwargs) for member in group], lag_ratio=lag_ratio, **group_kwargs)
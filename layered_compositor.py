@@ -0,0 +1,143 @@
+from manim import *
+from manim.utils.family import extract_mobject_family_members
+from manim.utils.iterables import list_difference_update
+import numpy as np
+import itertools as it
+import cairo
+from dirty_region_camera import is_cairo_drawn, leaf_fingerprint, leaf_pixel_box
+
+# ==========================================
+# LAYERED Z-INDEX COMPOSITOR
+# ==========================================
+# Camera.get_mobjects_to_display flattens the scene and re-sorts every leaf by
+# z_index on every frame, then draws them all. Phone mock-ups and attention
+# grids use a handful of z levels (frame 1, screen 2, UI 3, suggestions 50,
+# text 60) and most of those levels are static while one animates.
+#
+# LayeredCamera keeps the z order as persistent buckets, rebuilt only when the
+# family or some z_index changes, and gives every z level its own transparent
+# raster. A level whose leaves are unchanged since the previous frame is
+# painted from that raster (clipped to its bounding box) instead of being
+# re-rasterized; levels that are animating are drawn directly as usual.
+
+MIN_CACHED_LEAVES = 16       # Smaller layers redraw faster than they composite
+MAX_CACHED_LAYERS = 8        # One full-frame ARGB raster each
+
+
+class CachedLayer:
+    """Transparent full-frame raster of one z level plus the signature it was drawn from."""
+    def __init__(self, signature, shape):
+        self.signature = signature
+        self.pixels = None
+        self.surface = None
+        self.box = None
+        self.shape = shape
+
+    def allocate(self):
+        height, width = self.shape[:2]
+        self.pixels = np.zeros(self.shape, dtype=np.uint8)
+        self.surface = cairo.ImageSurface.create_for_data(self.pixels, cairo.FORMAT_ARGB32, width, height)
+
+
+class LayeredCamera(Camera):
+    """
+    Camera with persistent z buckets and per-layer raster caching.
+    `layer_stats` counts layers painted from cache vs drawn directly.
+    """
+    def __init__(self, **kwargs):
+        self.bucket_ids = None
+        self.bucket_zs = None
+        self.bucket_order = []
+        self.layers = {}
+        self.layer_stats = {"cached": 0, "direct": 0, "rebuilt": 0, "resorts": 0}
+        super().__init__(**kwargs)
+
+    # --- Persistent z buckets ---
+    def get_mobjects_to_display(self, mobjects, include_submobjects=True, excluded_mobjects=None):
+        if not include_submobjects:
+            return list(mobjects)
+        family = extract_mobject_family_members(mobjects, only_those_with_points=True)
+        if excluded_mobjects:
+            family = list_difference_update(family, extract_mobject_family_members(excluded_mobjects))
+        if not self.use_z_index:
+            return family
+        return self.order_by_layers(family)
+
+    def order_by_layers(self, family):
+        ids = [id(leaf) for leaf in family]
+        zs = [leaf.z_index for leaf in family]
+        if ids != self.bucket_ids or zs != self.bucket_zs:
+            buckets = {}
+            for leaf, z in zip(family, zs):
+                buckets.setdefault(z, []).append(leaf)
+            self.bucket_order = [leaf for z in sorted(buckets) for leaf in buckets[z]]
+            self.bucket_ids, self.bucket_zs = ids, zs
+            self.layer_stats["resorts"] += 1
+        return list(self.bucket_order)
+
+    # --- Compositing ---
+    def capture_mobjects(self, mobjects, **kwargs):
+        if not self.use_z_index:
+            # Without z ordering a z level isn't one contiguous run; nothing to cache
+            return super().capture_mobjects(mobjects, **kwargs)
+        leaves = self.get_mobjects_to_display(mobjects, **kwargs)
+        seen = set()
+        for z, group in it.groupby(leaves, key=lambda leaf: leaf.z_index):
+            group = list(group)
+            seen.add(z)
+            if not self.paint_cached_layer(z, group):
+                self.layer_stats["direct"] += 1
+                self.display_group(group, self.pixel_array)
+        for z in list(self.layers):
+            if z not in seen:
+                del self.layers[z]
+
+    def display_group(self, group, pixel_array):
+        for group_type, batch in it.groupby(group, self.type_or_raise):
+            self.display_funcs[group_type](list(batch), pixel_array)
+
+    def layer_signature(self, group):
+        if len(group) < MIN_CACHED_LEAVES or not all(is_cairo_drawn(self, leaf) for leaf in group):
+            return None
+        frame = (tuple(self.frame_center), self.frame_width, self.frame_height, self.pixel_array.shape)
+        return frame, tuple(id(leaf) for leaf in group), tuple(leaf_fingerprint(leaf) for leaf in group)
+
+    def paint_cached_layer(self, z, group):
+        """Paint layer `z` from its raster if it is unchanged since last frame; False to draw directly."""
+        signature = self.layer_signature(group)
+        layer = self.layers.get(z)
+        if signature is None or layer is None or layer.signature != signature:
+            # New or changing: remember it, cache it once it holds still for a frame
+            self.layers[z] = CachedLayer(signature, self.pixel_array.shape)
+            return False
+        if layer.pixels is None:
+            if sum(l.pixels is not None for l in self.layers.values()) >= MAX_CACHED_LAYERS:
+                return False
+            layer.allocate()
+            self.display_group(group, layer.pixels)
+            # Drop the context Camera cached for this array; the raster outlives it
+            self.pixel_array_to_cairo_context.pop(id(layer.pixels), None)
+            layer.surface.mark_dirty()
+            boxes = np.array([leaf_pixel_box(self, leaf) for leaf in group])
+            layer.box = (*boxes[:, :2].min(axis=0), *boxes[:, 2:].max(axis=0))
+            self.layer_stats["rebuilt"] += 1
+        self.composite(layer)
+        self.layer_stats["cached"] += 1
+        return True
+
+    def composite(self, layer):
+        ctx = self.get_cairo_context(self.pixel_array)
+        x0, y0, x1, y1 = (int(v) for v in layer.box)
+        ctx.save()
+        ctx.identity_matrix()
+        ctx.rectangle(x0, y0, x1 - x0, y1 - y0)
+        ctx.clip()
+        ctx.set_source_surface(layer.surface, 0, 0)
+        ctx.paint()
+        ctx.restore()
+
+
+class LayeredScene(Scene):
+    """Drop-in Scene base class that renders with LayeredCamera."""
+    def __init__(self, camera_class=LayeredCamera, **kwargs):
+        super().__init__(camera_class=camera_class, **kwargs)
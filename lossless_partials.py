@@ -0,0 +1,139 @@
+from manim import *
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter, to_av_frame_rate
+from manim.utils.file_ops import write_to_movie
+from pathlib import Path
+from queue import Queue
+from threading import Thread
+import av
+from shared_frame_ring import SharedRingFileWriter
+
+# ==========================================
+# LOSSLESS INTERMEDIATE PARTIAL MOVIES
+# ==========================================
+# Partial movies are H.264 (crf 23) and the scene movie is concatenated from
+# them, so every later trim, re-cut or episode encode starts from an already
+# lossy copy. Run through this module, manim encodes partial movies as
+# FFV1 (intra-only, lossless, fast) in Matroska, from the exact RGB the
+# camera produced, and the scene movie becomes a lossless <Scene>.mkv.
+#
+# The delivery encode then happens once, per episode, in parallel:
+#
+#   python assemble_episode.py how_chatgpt_works_2 -q h --render --lossless
+#
+# Lossless output is chosen per run, not per scene: starting manim through
+# this module installs the lossless writer in every scene it renders, whatever
+# its bases (which is what assemble_episode.py --lossless does):
+#
+#   python lossless_partials.py render -qh 1_Fine_Tuning.py Scene01
+#
+# The multi-resolution and frame-ring writers are supported: their extra
+# renditions and encoder process use the lossless codec too.
+#
+# Expect roughly 10-20x larger files than H.264 while they exist.
+
+LOSSLESS_EXTENSION = ".mkv"
+LOSSLESS_CODEC = "ffv1"
+LOSSLESS_PIX_FMT = "bgr0"    # Cairo's RGB without chroma subsampling; "bgra" when transparent
+LOSSLESS_OPTIONS = {"level": "3", "g": "1", "slices": "16", "slicecrc": "1", "threads": "auto"}
+
+
+def lossless_path(path):
+    return str(Path(path).with_suffix(LOSSLESS_EXTENSION))
+
+
+class LosslessPartials:
+    """
+    Writer mixin: FFV1 partial movies and a lossless scene movie. Goes before
+    SceneFileWriter or any writer subclass, including the multi-resolution
+    and frame-ring writers.
+    """
+    def __init__(self, renderer, scene_name, **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        if hasattr(self, "movie_file_path"):
+            self.movie_file_path = Path(lossless_path(self.movie_file_path))
+
+    def add_partial_movie_file(self, hash_animation):
+        super().add_partial_movie_file(hash_animation)
+        if hash_animation is not None and hasattr(self, "partial_movie_directory") and write_to_movie():
+            path = lossless_path(self.partial_movie_files[-1])
+            self.partial_movie_files[-1] = path
+            self.sections[-1].partial_movie_files[-1] = path
+
+    def is_already_cached(self, hash_invocation):
+        if not hasattr(self, "partial_movie_directory") or not write_to_movie():
+            return False
+        name = f"{hash_invocation}{LOSSLESS_EXTENSION}"
+        if not (self.partial_movie_directory / name).exists():
+            return False
+        # Multi-resolution writers: every rendition needs the animation too
+        return all(output.partial_path(name).exists() for output in getattr(self, "extra_outputs", ()))
+
+    def partial_codec(self):
+        return LOSSLESS_CODEC, "bgra" if config.transparent else LOSSLESS_PIX_FMT, LOSSLESS_OPTIONS
+
+    def open_partial_movie_stream(self, file_path=None):
+        if isinstance(self, SharedRingFileWriter):
+            # The encoder process opens the stream with partial_codec()
+            return super().open_partial_movie_stream(file_path)
+        # As SceneFileWriter.open_partial_movie_stream, with the lossless codec
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.partial_movie_file_path = file_path
+        codec, pix_fmt, options = self.partial_codec()
+        self.video_container = av.open(file_path, mode="w")
+        self.video_stream = self.video_container.add_stream(
+            codec, rate=to_av_frame_rate(config.frame_rate), options=options
+        )
+        self.video_stream.pix_fmt = pix_fmt
+        self.video_stream.width = config.pixel_width
+        self.video_stream.height = config.pixel_height
+        self.queue = Queue()
+        self.writer_thread = Thread(target=self.listen_and_write, args=())
+        self.writer_thread.start()
+        # As MultiResolutionFileWriter.open_partial_movie_stream, whose super() call this replaces
+        for output in getattr(self, "extra_outputs", ()):
+            output.open(self.partial_movie_file_path, self.partial_codec())
+
+
+class LosslessFileWriter(LosslessPartials, SceneFileWriter):
+    """SceneFileWriter with FFV1 partial movies."""
+
+
+def install_lossless_writer(scene):
+    """Make the scene's file writer lossless, keeping any writer a mixin already installed."""
+    renderer = scene.renderer
+    if not isinstance(renderer, CairoRenderer):
+        return
+    writer_class = type(renderer.file_writer)
+    if issubclass(writer_class, LosslessPartials):
+        return
+    if writer_class is SceneFileWriter:
+        lossless_class = LosslessFileWriter
+    else:
+        lossless_class = type(f"Lossless{writer_class.__name__}", (LosslessPartials, writer_class), {})
+    # Nothing has been written yet, so rebuilding the writer is safe
+    renderer._file_writer_class = lossless_class
+    extra_resolutions = [output.height for output in getattr(renderer.file_writer, "extra_outputs", ())]
+    renderer.init_scene(scene)
+    if extra_resolutions:
+        renderer.file_writer.set_extra_resolutions(extra_resolutions)
+
+
+def install_for_every_scene():
+    """Install the lossless writer in every scene at render time."""
+    render = Scene.render
+
+    def lossless_render(self, *args, **kwargs):
+        # After __init__, so writers installed by other mixins are kept
+        install_lossless_writer(self)
+        return render(self, *args, **kwargs)
+
+    Scene.render = lossless_render
+
+
+if __name__ == "__main__":
+    # python lossless_partials.py render <manim arguments>: the manim CLI with every scene lossless
+    from manim.__main__ import main
+    install_for_every_scene()
+    main()
@@ -0,0 +1,168 @@
+from manim import *
+from manim.utils.family import extract_mobject_family_members
+from pathlib import Path
+import numpy as np
+import gc
+import json
+import os
+from render_profiler import play_name
+
+# ==========================================
+# MEMORY CENSUS AND LEAK REPORT
+# ==========================================
+# A faded-out or replaced mobject is gone from the screen but not necessarily
+# from memory: construct() still holds it in a local, an animation or updater
+# closes over it, or it sits in self.mobjects at zero opacity. Long scenes
+# (OrganizationalMemoryScene) grow RSS steadily this way.
+#
+# With MEMORY_CENSUS=1, MemoryCensusMixin takes a census after every play and
+# wait: live Mobjects (on screen vs. off screen), the bytes of their point
+# arrays (shared buffers counted once), top-level mobjects in self.mobjects
+# that are fully transparent, and the process RSS. The timeline is written to
+# media/memory/<Scene>.json and a leak report is logged when the scene ends.
+#
+#   MEMORY_CENSUS=1 manim -ql 5_Understanding_The_Vector_Databases.py OrganizationalMemoryScene
+
+MEMORY_CENSUS = os.environ.get("MEMORY_CENSUS") == "1"
+REPORT_TOP = 8   # Rows per section of the leak report
+
+
+def memory_dir():
+    return Path(config.media_dir) / "memory"
+
+
+def current_rss_mb():
+    """Resident set size now (Linux); None where /proc isn't available."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except OSError:
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def owning_array(array):
+    """The array that owns the memory: PointBuffer / AttributeBuffer leaves are views into one."""
+    while isinstance(array.base, np.ndarray):
+        array = array.base
+    return array
+
+
+def point_bytes(mobjects):
+    arrays = {}
+    for mob in mobjects:
+        array = owning_array(mob.points)
+        arrays[id(array)] = array.nbytes
+    return sum(arrays.values())
+
+
+def is_invisible(leaf):
+    """True for a leaf that draws nothing at its current opacities."""
+    if isinstance(leaf, VMobject):
+        return not (
+            leaf.fill_rgbas[:, 3].any()
+            or (leaf.stroke_width and leaf.stroke_rgbas[:, 3].any())
+            or (leaf.background_stroke_width and leaf.background_stroke_rgbas[:, 3].any())
+        )
+    if isinstance(leaf, ImageMobject):
+        return not leaf.pixel_array[..., 3].any()
+    if isinstance(leaf, PMobject):
+        return not leaf.rgbas[:, 3].any()
+    return False
+
+
+def take_census(scene):
+    gc.collect()
+    live = [obj for obj in gc.get_objects() if isinstance(obj, Mobject)]
+    on_screen = extract_mobject_family_members(scene.mobjects)
+    on_screen_ids = {id(mob) for mob in on_screen}
+    off_screen = [mob for mob in live if id(mob) not in on_screen_ids]
+    transparent = []
+    for mob in scene.mobjects:
+        leaves = [leaf for leaf in mob.get_family() if len(leaf.points)]
+        if leaves and all(is_invisible(leaf) for leaf in leaves):
+            transparent.append(mob)
+    return {
+        "live_mobjects": len(live),
+        "on_screen_mobjects": len(on_screen),
+        "point_bytes": point_bytes(live),
+        "off_screen_point_bytes": point_bytes(off_screen),
+        "transparent_mobjects": len(transparent),
+        "transparent_point_bytes": point_bytes(extract_mobject_family_members(transparent)),
+        "rss_mb": current_rss_mb(),
+    }, off_screen, transparent
+
+
+def by_type(mobjects):
+    """[(type name, count, point bytes)] largest first."""
+    groups = {}
+    for mob in mobjects:
+        groups.setdefault(type(mob).__name__, []).append(mob)
+    rows = [(name, len(mobs), point_bytes(mobs)) for name, mobs in groups.items()]
+    return sorted(rows, key=lambda row: -row[2])
+
+
+class MemoryCensusMixin:
+    """
+    Put first in the bases so that, with MEMORY_CENSUS=1, a memory census is
+    taken after every play/wait and a leak report is logged at the end.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.memory_timeline = [] if MEMORY_CENSUS else None
+
+    def play(self, *args, **kwargs):
+        result = super().play(*args, **kwargs)
+        if self.memory_timeline is not None:
+            census, _, _ = take_census(self)
+            census["play"] = len(self.memory_timeline)
+            census["label"] = play_name(self, *args)
+            census["time"] = self.renderer.time
+            self.memory_timeline.append(census)
+        return result
+
+    def tear_down(self):
+        super().tear_down()
+        if self.memory_timeline:
+            self.write_memory_report()
+
+    def write_memory_report(self):
+        name = type(self).__name__
+        path = memory_dir() / f"{name}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.memory_timeline, f, indent=1)
+
+        census, off_screen, transparent = take_census(self)
+        first, last = self.memory_timeline[0], self.memory_timeline[-1]
+        lines = [f"Memory report for {name} ({len(self.memory_timeline)} plays, timeline in '{path}')"]
+        if first["rss_mb"] is not None and len(self.memory_timeline) > 1:
+            rss = [entry["rss_mb"] for entry in self.memory_timeline]
+            slope = np.polyfit(np.arange(len(rss)), rss, 1)[0]
+            lines.append(f"  RSS {first['rss_mb']:.0f} -> {last['rss_mb']:.0f} MB, trend {slope:+.2f} MB per play")
+        lines.append(
+            f"  Live mobjects {first['live_mobjects']} -> {census['live_mobjects']}, "
+            f"point arrays {first['point_bytes'] / 2**20:.1f} -> {census['point_bytes'] / 2**20:.1f} MB"
+        )
+        lines.append(
+            f"  Off screen but alive: {len(off_screen)} mobjects, {census['off_screen_point_bytes'] / 2**20:.1f} MB "
+            "(held by construct() locals, animations or updaters)"
+        )
+        for type_name, count, size in by_type(off_screen)[:REPORT_TOP]:
+            lines.append(f"    {type_name:<24} {count:>6} {size / 2**20:>8.2f} MB")
+        lines.append(
+            f"  Fully transparent in self.mobjects: {len(transparent)}, "
+            f"{census['transparent_point_bytes'] / 2**20:.1f} MB (remove them instead of fading to 0)"
+        )
+        for type_name, count, size in by_type(transparent)[:REPORT_TOP]:
+            lines.append(f"    {type_name:<24} {count:>6} {size / 2**20:>8.2f} MB")
+        growth = [
+            (entry["label"], entry["point_bytes"] - previous["point_bytes"])
+            for previous, entry in zip(self.memory_timeline, self.memory_timeline[1:])
+        ]
+        growth = sorted((item for item in growth if item[1] > 0), key=lambda item: -item[1])[:REPORT_TOP]
+        if growth:
+            lines.append("  Largest point-array growth by play:")
+            for label, size in growth:
+                lines.append(f"    {size / 2**20:>+8.2f} MB  {label}")
+        logger.info("\n".join(lines))
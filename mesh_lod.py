@@ -0,0 +1,102 @@
+from manim import *
+import numpy as np
+
+# ==========================================
+# LEVEL OF DETAIL FOR 3D MESHES
+# ==========================================
+# Sphere, Dot3D, Surface and Arrow3D are tessellated into VMobject faces at a
+# fixed resolution. At -ql a 0.1-unit Dot3D is ~12 px wide, so most of those
+# faces are sub-pixel. These factories pick the resolution from the on-screen
+# size at the active quality, snap it to a small set of tiers, and tessellate
+# each (shape, tier) once; every further instance is a copy of that mesh.
+
+PIXELS_PER_SEGMENT = 6        # Target arc length of one sphere/cylinder segment
+PIXELS_PER_FACET = 24         # Target edge length of one Surface facet
+LOD_TIERS = (4, 6, 8, 10, 12, 16, 20, 24, 32, 48, 64)
+
+_MESH_CACHE = {}
+
+
+def pixels_per_unit():
+    """Screen pixels covered by one scene unit at the active quality preset."""
+    return config.pixel_height / config.frame_height
+
+
+def snap_to_tier(segments, minimum=LOD_TIERS[0], maximum=LOD_TIERS[-1]):
+    """Round up to the next LOD tier so nearby sizes share one cached mesh."""
+    segments = max(minimum, min(maximum, int(np.ceil(segments))))
+    for tier in LOD_TIERS:
+        if tier >= segments:
+            return min(tier, maximum)
+    return maximum
+
+
+def pick_resolution(world_size, authored, pixels_per_segment, zoom=1.0):
+    """
+    Scale the authored resolution down to what `world_size` needs on screen.
+    Never exceeds the authored value, so 4K output matches the original mesh.
+    """
+    authored = (authored, authored) if np.isscalar(authored) else tuple(authored)
+    needed = world_size * zoom * pixels_per_unit() / pixels_per_segment
+    factor = min(1.0, needed / max(authored))
+    return tuple(snap_to_tier(r * factor, maximum=r) for r in authored)
+
+
+def clear_mesh_cache():
+    """Drop every cached prototype (e.g. between quality passes in one process)."""
+    _MESH_CACHE.clear()
+
+
+def _cached_mesh(key, build):
+    # Quality is part of the key so -ql and -qk renders never share meshes
+    key = (config.pixel_height,) + key
+    if key not in _MESH_CACHE:
+        _MESH_CACHE[key] = build()
+    return _MESH_CACHE[key].copy()
+
+
+def lod_sphere(center=ORIGIN, radius=1, resolution=(24, 12), color=None, zoom=1.0, **kwargs):
+    """Sphere whose (u, v) resolution follows its on-screen circumference."""
+    res = pick_resolution(TAU * radius, resolution, PIXELS_PER_SEGMENT, zoom)
+    style = tuple(sorted((k, str(v)) for k, v in kwargs.items()))
+
+    def build():
+        sphere = Sphere(radius=radius, resolution=res, **kwargs)
+        return sphere.set_color(color) if color is not None else sphere
+
+    return _cached_mesh(("sphere", radius, res, str(color), style), build).move_to(center)
+
+
+def lod_dot3d(point=ORIGIN, radius=DEFAULT_DOT_RADIUS, color=WHITE, resolution=(8, 8), zoom=1.0, **kwargs):
+    """Dot3D equivalent; dozens of identical dots share one tessellation."""
+    res = pick_resolution(TAU * radius, resolution, PIXELS_PER_SEGMENT, zoom)
+    style = tuple(sorted((k, str(v)) for k, v in kwargs.items()))
+    dot = _cached_mesh(
+        ("dot3d", radius, res, str(color), style),
+        lambda: Dot3D(radius=radius, color=color, resolution=res, **kwargs),
+    )
+    return dot.move_to(point)
+
+
+def lod_surface(func, u_range=(0, 1), v_range=(0, 1), resolution=32, world_size=None, cache_key=None, zoom=1.0, **kwargs):
+    """
+    Surface with facet count from its on-screen extent. `world_size` defaults
+    to the larger parameter span; pass `cache_key` to reuse the mesh when the
+    same surface is built more than once.
+    """
+    if world_size is None:
+        world_size = max(u_range[1] - u_range[0], v_range[1] - v_range[0])
+    res = pick_resolution(world_size, resolution, PIXELS_PER_FACET, zoom)
+
+    def build():
+        return Surface(func, u_range=u_range, v_range=v_range, resolution=res, **kwargs)
+
+    if cache_key is None:
+        return build()
+    return _cached_mesh(("surface", cache_key, res), build)
+
+
+def lod_arrow3d(start=LEFT, end=RIGHT, thickness=0.02, resolution=24, zoom=1.0, **kwargs):
+    """Arrow3D whose shaft resolution follows the shaft's on-screen girth."""
+    res = pick_resolution(TAU * thickness, resolution, PIXELS_PER_SEGMENT / 4, zoom)
+    return Arrow3D(start=start, end=end, thickness=thickness, resolution=res[0], **kwargs)
@@ -0,0 +1,136 @@
+from manim import *
+from manim.scene.scene_file_writer import SceneFileWriter, to_av_frame_rate
+from manim.utils.file_ops import write_to_movie
+import os
+import av
+from pipelined_writer import install_file_writer
+from shared_frame_ring import partial_movie_codec
+
+# ==========================================
+# SINGLE-PASS MULTI-RESOLUTION OUTPUT
+# ==========================================
+# Rendering -ql for review, -qh for upload and -qk for archive runs construct()
+# and rasterizes every frame three times. MultiResolutionFileWriter rasterizes
+# once at the command-line quality and, on the writer thread, downscales each
+# frame (libswscale, area filter) into one extra encoder per requested height.
+# Every output keeps the render's frame rate, and lands next to the usual
+# output as <module>/<height>p<fps>/<Scene>.mp4.
+#
+#   EXTRA_RESOLUTIONS=480,1080 manim -qk script.py Scene
+#
+# produces 2160p60, 1080p60 and 480p60 files from a single run.
+
+EXTRA_RESOLUTIONS = tuple(int(h) for h in os.environ.get("EXTRA_RESOLUTIONS", "").split(",") if h.strip())
+DOWNSCALE_INTERPOLATION = "AREA"   # Box filter: sharp, alias-free downscaling
+
+
+class ExtraOutput:
+    """One downscaled rendition: its frame size, directories and the open encoder."""
+    def __init__(self, writer, height):
+        self.height = height
+        # Keep the aspect ratio; H.264 with yuv420p needs even dimensions
+        self.width = 2 * round(height * config.pixel_width / config.pixel_height / 2)
+        resolution_dir = writer.movie_file_path.parent
+        target_dir = resolution_dir.parent / f"{height}p{config['frame_rate']}"  # As get_resolution_directory
+        self.partial_movie_directory = target_dir / writer.partial_movie_directory.relative_to(resolution_dir)
+        self.partial_movie_directory.mkdir(parents=True, exist_ok=True)
+        self.movie_file_path = target_dir / writer.movie_file_path.name
+        self.container = None
+        self.stream = None
+
+    def partial_path(self, partial_movie_file):
+        return self.partial_movie_directory / os.path.basename(partial_movie_file)
+
+    def open(self, partial_movie_file, codec=None):
+        codec, pix_fmt, options = codec or partial_movie_codec()
+        self.container = av.open(str(self.partial_path(partial_movie_file)), mode="w")
+        self.stream = self.container.add_stream(codec, rate=to_av_frame_rate(config.frame_rate), options=options)
+        self.stream.pix_fmt = pix_fmt
+        self.stream.width = self.width
+        self.stream.height = self.height
+
+    def encode(self, frame, num_frames):
+        for _ in range(num_frames):
+            # A fresh VideoFrame per repeat, as in SceneFileWriter.encode_and_write_frame
+            av_frame = av.VideoFrame.from_ndarray(frame, format="rgba").reformat(
+                width=self.width,
+                height=self.height,
+                format=self.stream.pix_fmt,
+                interpolation=DOWNSCALE_INTERPOLATION,
+            )
+            for packet in self.stream.encode(av_frame):
+                self.container.mux(packet)
+
+    def close(self):
+        for packet in self.stream.encode():
+            self.container.mux(packet)
+        self.container.close()
+        self.container = self.stream = None
+
+
+class MultiResolutionFileWriter(SceneFileWriter):
+    """
+    SceneFileWriter that also writes downscaled copies of every partial movie
+    and combines them into one movie per extra height. Heights at or above the
+    render's own are ignored: frames are only ever scaled down.
+    """
+    def __init__(self, renderer, scene_name, **kwargs):
+        self.extra_outputs = []
+        super().__init__(renderer, scene_name, **kwargs)
+
+    def set_extra_resolutions(self, heights):
+        if not write_to_movie() or not hasattr(self, "movie_file_path"):
+            return
+        heights = sorted({h for h in heights if h < config.pixel_height}, reverse=True)
+        self.extra_outputs = [ExtraOutput(self, height) for height in heights]
+
+    def is_already_cached(self, hash_invocation):
+        # A cached animation is only reusable if every rendition has it
+        if not super().is_already_cached(hash_invocation):
+            return False
+        name = f"{hash_invocation}{config['movie_file_extension']}"
+        return all(output.partial_path(name).exists() for output in self.extra_outputs)
+
+    def open_partial_movie_stream(self, file_path=None):
+        super().open_partial_movie_stream(file_path)
+        for output in self.extra_outputs:
+            output.open(self.partial_movie_file_path)
+
+    def encode_and_write_frame(self, frame, num_frames):
+        super().encode_and_write_frame(frame, num_frames)
+        for output in self.extra_outputs:
+            output.encode(frame, num_frames)
+
+    def close_partial_movie_stream(self):
+        # The writer thread is joined inside; only then close the extra encoders
+        super().close_partial_movie_stream()
+        for output in self.extra_outputs:
+            output.close()
+
+    def combine_to_movie(self):
+        super().combine_to_movie()
+        partial_movie_files = [f for f in self.partial_movie_files if f is not None]
+        if not partial_movie_files:
+            return
+        for output in self.extra_outputs:
+            output.movie_file_path.parent.mkdir(parents=True, exist_ok=True)
+            self.combine_files(
+                [str(output.partial_path(f)) for f in partial_movie_files],
+                output.movie_file_path,
+            )
+            self.print_file_ready_message(output.movie_file_path)
+
+
+class MultiResolutionMixin:
+    """
+    Put first in the bases to write `extra_resolutions` (default: the
+    EXTRA_RESOLUTIONS environment variable) alongside the normal output.
+    """
+    extra_resolutions = EXTRA_RESOLUTIONS
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        install_file_writer(self, MultiResolutionFileWriter)
+        file_writer = self.renderer.file_writer
+        if isinstance(file_writer, MultiResolutionFileWriter):
+            file_writer.set_extra_resolutions(self.extra_resolutions)
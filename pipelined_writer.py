@@ -0,0 +1,107 @@
+from manim import *
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from queue import Queue
+import time
+
+# ==========================================
+# PIPELINED FRAME WRITER
+# ==========================================
+# SceneFileWriter hands frames to a PyAV writer thread through an unbounded
+# Queue. When the encoder falls behind (4K, slow presets) every rasterized
+# frame piles up in memory, and nothing tells us which side is the
+# bottleneck. PipelinedFileWriter bounds that queue so the rasterizer blocks
+# (back-pressure) once FRAME_QUEUE_SIZE frames are waiting, and times both
+# sides: how long the rasterizer stalled on a full queue, how long the writer
+# spent encoding, and how long it sat idle waiting for frames.
+
+FRAME_QUEUE_SIZE = 8     # Frames in flight; 8 x 33 MB at 4K
+
+
+class TimedFrameQueue(Queue):
+    """Bounded queue that records producer stalls, consumer waits and peak depth."""
+    def __init__(self, maxsize, stats):
+        super().__init__(maxsize)
+        self.stats = stats
+
+    def put(self, item, block=True, timeout=None):
+        start = time.perf_counter()
+        super().put(item, block, timeout)
+        self.stats["raster_stall"] += time.perf_counter() - start
+        self.stats["peak_depth"] = max(self.stats["peak_depth"], self.qsize())
+
+    def get(self, block=True, timeout=None):
+        start = time.perf_counter()
+        item = super().get(block, timeout)
+        self.stats["writer_idle"] += time.perf_counter() - start
+        return item
+
+
+class PipelinedFileWriter(SceneFileWriter):
+    """
+    SceneFileWriter with a bounded, instrumented frame queue. `stats` holds
+    totals for the scene; one summary line is logged per partial movie.
+    """
+    def __init__(self, renderer, scene_name, **kwargs):
+        self.stats = self.empty_stats()
+        self.movie_stats = self.empty_stats()
+        super().__init__(renderer, scene_name, **kwargs)
+
+    @staticmethod
+    def empty_stats():
+        return {"frames": 0, "raster_stall": 0.0, "writer_idle": 0.0, "encode": 0.0, "peak_depth": 0}
+
+    # SceneFileWriter.open_partial_movie_stream assigns a fresh unbounded Queue
+    # to self.queue before starting its writer thread; swap in a bounded one.
+    @property
+    def queue(self):
+        return self._frame_queue
+
+    @queue.setter
+    def queue(self, _unbounded):
+        self.movie_stats = self.empty_stats()
+        self._frame_queue = TimedFrameQueue(FRAME_QUEUE_SIZE, self.movie_stats)
+
+    def encode_and_write_frame(self, frame, num_frames):
+        start = time.perf_counter()
+        super().encode_and_write_frame(frame, num_frames)
+        self.movie_stats["encode"] += time.perf_counter() - start
+        self.movie_stats["frames"] += num_frames
+
+    def close_partial_movie_stream(self):
+        super().close_partial_movie_stream()
+        stats = self.movie_stats
+        for key, value in stats.items():
+            self.stats[key] = max(self.stats[key], value) if key == "peak_depth" else self.stats[key] + value
+        logger.info(
+            "Animation %(n)s : %(frames)d frames, encode %(encode).2fs, "
+            "rasterizer stalled %(stall).2fs, writer idle %(idle).2fs, peak queue %(depth)d/%(size)d",
+            {
+                "n": self.renderer.num_plays,
+                "frames": stats["frames"],
+                "encode": stats["encode"],
+                "stall": stats["raster_stall"],
+                "idle": stats["writer_idle"],
+                "depth": stats["peak_depth"],
+                "size": FRAME_QUEUE_SIZE,
+            },
+        )
+
+
+def install_file_writer(scene, writer_class):
+    """Swap the plain SceneFileWriter Scene.__init__ built for `writer_class`."""
+    renderer = scene.renderer
+    if isinstance(renderer, CairoRenderer) and type(renderer.file_writer) is SceneFileWriter:
+        # Nothing has been written yet, so rebuilding the writer is safe
+        renderer._file_writer_class = writer_class
+        renderer.init_scene(scene)
+
+
+class PipelinedWriterMixin:
+    """
+    Put first in the bases (class MyScene(PipelinedWriterMixin, ThreeDScene))
+    to write through PipelinedFileWriter with any camera or scene type.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        install_file_writer(self, PipelinedFileWriter)
@@ -0,0 +1,155 @@
+from manim import *
+import numpy as np
+
+# ==========================================
+# REACTIVE MOBJECTS (IN-PLACE always_redraw)
+# ==========================================
+# always_redraw(lambda: Dot(...)) builds a brand-new mobject every frame and
+# `become`s it. For a dot or a line driven by a ValueTracker only a handful of
+# point coordinates actually change, so these classes keep one mobject alive
+# and rewrite its point array in place whenever a tracker value moves.
+
+
+class ReactiveBinding:
+    """
+    Ties a mobject to the trackers it depends on.
+
+    `recompute(*values)` receives the current tracker values and must update
+    the mobject's points in place. It only runs when a value changed since
+    the last refresh, so a paused tracker costs one comparison per frame.
+    """
+    def __init__(self, mobject, trackers, recompute):
+        self.mobject = mobject
+        self.trackers = list(trackers)
+        self.recompute = recompute
+        self.last_values = None
+
+    def read_values(self, cache=None):
+        # A shared cache lets a BindingBatch read each tracker once per frame
+        if cache is None:
+            return tuple(tracker.get_value() for tracker in self.trackers)
+        values = []
+        for tracker in self.trackers:
+            key = id(tracker)
+            if key not in cache:
+                cache[key] = tracker.get_value()
+            values.append(cache[key])
+        return tuple(values)
+
+    def refresh(self, force=False, cache=None):
+        values = self.read_values(cache)
+        if not force and values == self.last_values:
+            return False
+        self.recompute(*values)
+        self.last_values = values
+        return True
+
+
+class ReactiveMixin:
+    """Shared plumbing: owns a ReactiveBinding and keeps it fresh with one updater."""
+    def bind(self, trackers, recompute):
+        self.binding = ReactiveBinding(self, trackers, recompute)
+        self.binding.refresh(force=True)
+        self.add_updater(ReactiveMixin._refresh_binding)
+        return self
+
+    def _refresh_binding(self):
+        self.binding.refresh()
+
+    def unbind_updater(self):
+        """Detach the per-mobject updater (used when a BindingBatch takes over)."""
+        self.remove_updater(ReactiveMixin._refresh_binding)
+        return self
+
+
+class ReactiveDot(ReactiveMixin, Dot):
+    """
+    Dot whose position is `position_func(*tracker_values)`.
+    Moving it translates the existing points; nothing is rebuilt.
+    """
+    def __init__(self, position_func, trackers, **kwargs):
+        super().__init__(**kwargs)
+        self.position_func = position_func
+        self.bind(trackers, self._place)
+
+    def _place(self, *values):
+        delta = np.asarray(self.position_func(*values)) - self.get_center()
+        for mob in self.family_members_with_points():
+            mob.points += delta
+
+
+class ReactiveLine(ReactiveMixin, Line):
+    """
+    Straight line whose ends are `endpoints_func(*tracker_values) -> (start, end)`.
+    A plain Line is one cubic segment, so its four points are written directly.
+    """
+    def __init__(self, endpoints_func, trackers, **kwargs):
+        start, end = (np.asarray(p, dtype=np.float64) for p in endpoints_func(*[t.get_value() for t in trackers]))
+        super().__init__(start, end, **kwargs)
+        self.endpoints_func = endpoints_func
+        # Anchor/handle positions along the segment: start, 1/3, 2/3, end
+        self._weights = np.linspace(0, 1, 4)[:, None]
+        self.bind(trackers, self._place)
+
+    def _place(self, *values):
+        start, end = (np.asarray(p, dtype=np.float64) for p in self.endpoints_func(*values))
+        if self.points.shape != (4, 3):
+            # Points were restructured (tips, Create, Transform): use the generic path
+            self.put_start_and_end_on(start, end)
+            return
+        np.multiply(self._weights, end - start, out=self.points)
+        self.points += start
+
+
+class ReactiveTangentLine(ReactiveLine):
+    """
+    Tangent of y = func(x) on `axes` at x = tracker value, `length` units long.
+    Replaces always_redraw around a tangent-line helper.
+    """
+    def __init__(self, axes, func, tracker, length=3, dx=1e-4, **kwargs):
+        self.axes = axes
+        self.func = func
+        self.length = length
+        self.dx = dx
+        super().__init__(self._tangent_endpoints, [tracker], **kwargs)
+
+    def _tangent_endpoints(self, x):
+        center = self.axes.coords_to_point(x, self.func(x))
+        ahead = self.axes.coords_to_point(x + self.dx, self.func(x + self.dx))
+        behind = self.axes.coords_to_point(x - self.dx, self.func(x - self.dx))
+        direction = normalize(np.asarray(ahead) - np.asarray(behind))
+        half = direction * self.length / 2
+        return center - half, center + half
+
+
+class BindingBatch(Mobject):
+    """
+    Refreshes many reactive mobjects from one updater per frame.
+
+    Each tracker is read once per frame however many bindings use it, and
+    `before_refresh` / `after_refresh` hooks receive the list of bindings
+    that actually changed, e.g. to recompute a shared quantity once.
+    Add the batch to the scene (it has no points and is never drawn).
+    """
+    def __init__(self, *reactive_mobjects, **kwargs):
+        super().__init__(**kwargs)
+        self.bindings = []
+        self.before_refresh = []
+        self.after_refresh = []
+        for mob in reactive_mobjects:
+            self.adopt(mob)
+        self.add_updater(lambda batch: batch.refresh_all())
+
+    def adopt(self, reactive_mobject):
+        reactive_mobject.unbind_updater()
+        self.bindings.append(reactive_mobject.binding)
+        return self
+
+    def refresh_all(self, force=False):
+        cache = {}
+        for hook in self.before_refresh:
+            hook(self.bindings)
+        changed = [b for b in self.bindings if b.refresh(force=force, cache=cache)]
+        for hook in self.after_refresh:
+            hook(changed)
+        return changed
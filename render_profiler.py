@@ -0,0 +1,175 @@
+from manim import *
+from contextlib import contextmanager
+from pathlib import Path
+import functools
+import json
+import os
+import threading
+import time
+
+# ==========================================
+# PER-PLAY RENDER PROFILER
+# ==========================================
+# Where does a slow scene spend its time: building mobjects in construct(),
+# setting animations up, interpolating, running updaters, rasterizing with
+# Cairo, or encoding? With RENDER_PROFILE=1, ProfilerMixin wraps those phases
+# of the scene, renderer and file writer and records one span per call:
+#
+#   construct        the whole construct(); its self time is mobject building
+#   play / wait      one span per self.play / self.wait, named by animation
+#   anim setup       compile_animation_data + begin_animations
+#   interpolate      Scene.update_to_time (animations and updaters)
+#   updaters         Scene.update_mobjects, nested in interpolate
+#   rasterize        renderer.update_frame (clear + Cairo capture)
+#   frame copy       renderer.get_frame
+#   write            file_writer.write_frame (hand-off, stalls included)
+#   encode           PyAV encoding, on the writer thread
+#   combine          partial movies -> scene movie
+#
+# The spans are written as a Chrome trace (open in chrome://tracing or
+# https://ui.perfetto.dev) to media/profiles/<Scene>.trace.json, and a table
+# of total / self time per phase is logged when the scene finishes.
+#
+#   RENDER_PROFILE=1 manim -ql 5_Understanding_The_Vector_Databases.py OrganizationalMemoryScene
+
+RENDER_PROFILE = os.environ.get("RENDER_PROFILE") == "1"
+
+
+def profile_dir():
+    return Path(config.media_dir) / "profiles"
+
+
+class RenderProfiler:
+    """Collects complete ("X") trace events; thread-safe, microsecond timestamps."""
+    def __init__(self, scene_name):
+        self.scene_name = scene_name
+        self.origin = time.perf_counter()
+        self.events = []
+        self.lock = threading.Lock()
+
+    def now(self):
+        return (time.perf_counter() - self.origin) * 1e6
+
+    @contextmanager
+    def span(self, name, phase, **args):
+        start = self.now()
+        try:
+            yield
+        finally:
+            event = {
+                "name": name,
+                "cat": phase,
+                "ph": "X",
+                "ts": start,
+                "dur": self.now() - start,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+            }
+            if args:
+                event["args"] = args
+            with self.lock:
+                self.events.append(event)
+
+    def wrap(self, owner, method_name, phase, name_func=None):
+        """Replace owner.method_name (on the instance) with a version that records a span."""
+        method = getattr(owner, method_name)
+
+        @functools.wraps(method)
+        def profiled(*args, **kwargs):
+            name = name_func(*args, **kwargs) if name_func else phase
+            with self.span(name, phase):
+                return method(*args, **kwargs)
+
+        setattr(owner, method_name, profiled)
+
+    # --- Output ---
+    def export_chrome_trace(self, path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        threads = {event["tid"] for event in self.events}
+        main_thread = threading.main_thread().ident
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid,
+             "args": {"name": "render" if tid == main_thread else "writer"}}
+            for tid in threads
+        ]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": metadata + self.events, "displayTimeUnit": "ms"}, f)
+
+    def phase_totals(self):
+        """{phase: [count, total_us, self_us]}; self time excludes nested spans on the same thread."""
+        totals = {}
+        by_thread = {}
+        for event in self.events:
+            by_thread.setdefault(event["tid"], []).append(event)
+        for events in by_thread.values():
+            events.sort(key=lambda e: (e["ts"], -e["dur"]))
+            stack = []
+            for event in events:
+                while stack and stack[-1]["ts"] + stack[-1]["dur"] <= event["ts"]:
+                    stack.pop()
+                entry = totals.setdefault(event["cat"], [0, 0.0, 0.0])
+                entry[0] += 1
+                entry[1] += event["dur"]
+                entry[2] += event["dur"]
+                if stack:
+                    totals[stack[-1]["cat"]][2] -= event["dur"]
+                stack.append(event)
+        return totals
+
+    def summary_table(self):
+        totals = self.phase_totals()
+        wall = max((e["ts"] + e["dur"] for e in self.events), default=0.0)
+        lines = [f"{'phase':<12} {'calls':>7} {'total s':>9} {'self s':>9} {'self %':>7}"]
+        for phase, (count, total, self_time) in sorted(totals.items(), key=lambda item: -item[1][2]):
+            lines.append(
+                f"{phase:<12} {count:>7} {total / 1e6:>9.3f} {self_time / 1e6:>9.3f} {100 * self_time / max(wall, 1):>6.1f}%"
+            )
+        return "\n".join(lines)
+
+
+def play_name(scene, *args, **kwargs):
+    names = [type(arg).__name__.replace("_AnimationBuilder", "animate") for arg in args]
+    if names == ["Wait"]:
+        return "wait"
+    return "play " + ", ".join(names)
+
+
+def install_profiler(scene):
+    """Wrap the scene's phases; returns the RenderProfiler collecting them."""
+    profiler = RenderProfiler(type(scene).__name__)
+    renderer = scene.renderer
+    profiler.wrap(scene, "construct", "construct")
+    profiler.wrap(renderer, "play", "play", play_name)
+    profiler.wrap(scene, "compile_animation_data", "anim setup")
+    profiler.wrap(scene, "begin_animations", "anim setup")
+    profiler.wrap(scene, "update_to_time", "interpolate")
+    profiler.wrap(scene, "update_mobjects", "updaters")
+    profiler.wrap(renderer, "update_frame", "rasterize")
+    profiler.wrap(renderer, "get_frame", "frame copy")
+    file_writer = getattr(renderer, "file_writer", None)
+    if file_writer is not None:
+        profiler.wrap(file_writer, "write_frame", "write")
+        profiler.wrap(file_writer, "encode_and_write_frame", "encode")
+        profiler.wrap(file_writer, "combine_to_movie", "combine")
+    return profiler
+
+
+class ProfilerMixin:
+    """
+    Put first in the bases so that, with RENDER_PROFILE=1, the render is
+    profiled after every other mixin has set up its renderer and writer.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.profiler = install_profiler(self) if RENDER_PROFILE else None
+
+    def render(self, preview=False):
+        if self.profiler is None:
+            return super().render(preview)
+        with self.profiler.span(self.profiler.scene_name, "scene"):
+            result = super().render(preview)
+        path = profile_dir() / f"{self.profiler.scene_name}.trace.json"
+        self.profiler.export_chrome_trace(path)
+        logger.info(f"Render profile of {self.profiler.scene_name}:\n{self.profiler.summary_table()}")
+        logger.info("Chrome trace written to %(path)s", {"path": f"'{path}'"})
+        return result
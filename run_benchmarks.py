@@ -0,0 +1,215 @@
+from pathlib import Path
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+
+# ==========================================
+# BENCHMARK SUITE WITH REGRESSION THRESHOLDS
+# ==========================================
+# A fixed set of scenes that each stress one part of the pipeline, rendered
+# at -ql with caching off and a fixed random seed, one fresh process per
+# scene so peak RSS is that scene's own. Per scene we record:
+#
+#   fps            frames written / wall time of Scene.render
+#   construct_s    time in construct() outside play/wait (mobject building)
+#   peak_rss_mb    peak resident memory of the process or of any child it
+#                  waited on (LaTeX, dvisvgm, ffmpeg), whichever is larger
+#
+# Results are compared against benchmark_baseline.json and the run fails
+# (exit code 1) if any metric is worse than its threshold allows, or if a
+# scene has no baseline at all. Baselines are machine-specific, so none is
+# checked in: record one on the machine that runs the suite. The file stores
+# that machine next to the numbers, and a run elsewhere warns first.
+#
+#   python run_benchmarks.py                     # compare against the baseline
+#   python run_benchmarks.py --update-baseline   # record a new baseline
+#   python run_benchmarks.py --allow-missing     # report scenes without a baseline
+#   python run_benchmarks.py Scene12AttentionMatrix
+
+ROOT = Path(__file__).resolve().parent
+BASELINE = ROOT / "benchmark_baseline.json"
+SEED = 42
+
+BENCHMARKS = {
+    "Scene28and29FinalSummary": "3_How_Chatgpt_Works_2.py",         # 800 dots
+    "MultiColumnVocabularyScroll": "3_How_Chatgpt_Works_1.py",      # 230+ Text mobjects
+    "Scene12AttentionMatrix": "3_How_Chatgpt_Works_2.py",           # Custom attention cells
+    "SemanticSearchScene": "5_Understanding_The_Vector_Databases.py",  # 3D spheres
+    "MultiIntentSimilarity": "2_Semantic_Search.py",                # MobjectTable
+    "Scene02_LearningAsGraph": "1_Fine_Tuning.py",                  # always_redraw
+}
+
+# Allowed change relative to the baseline before a metric counts as a regression
+THRESHOLDS = {
+    "fps": -0.15,          # 15% fewer frames per second
+    "construct_s": 0.25,   # 25% slower construct
+    "peak_rss_mb": 0.15,   # 15% more memory
+}
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def machine_info():
+    """What a baseline was measured on; numbers only compare within one machine."""
+    try:
+        from manim import __version__ as manim_version
+    except ImportError:
+        manim_version = None
+    return {
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor() or None,
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "manim": manim_version,
+    }
+
+
+def load_from_script(script, name):
+    """Attribute `name` (a scene class or component) of a numbered script, imported as a module."""
+    sys.path.insert(0, str(ROOT))
+    spec = importlib.util.spec_from_file_location(Path(script).stem.replace("-", "_"), ROOT / script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, name)
+
+
+def run_one(scene_name, script):
+    """Render one scene in this process and return its metrics."""
+    from manim import tempconfig
+    from render_profiler import install_profiler
+
+    with tempfile.TemporaryDirectory() as media_dir, tempconfig({
+        "quality": "low_quality",
+        "disable_caching": True,
+        "media_dir": media_dir,
+        "input_file": str(ROOT / script),
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+    }):
+        random.seed(SEED)
+        np.random.seed(SEED)
+        scene = load_from_script(script, scene_name)()
+        profiler = install_profiler(scene)
+        frames = [0]
+        add_frame = scene.renderer.add_frame
+
+        def counted_add_frame(frame, num_frames=1):
+            frames[0] += num_frames
+            return add_frame(frame, num_frames)
+
+        scene.renderer.add_frame = counted_add_frame
+        start = time.perf_counter()
+        scene.render()
+        wall = time.perf_counter() - start
+
+    totals = profiler.phase_totals()
+    return {
+        "fps": frames[0] / wall,
+        "frames": frames[0],
+        "wall_s": wall,
+        "construct_s": totals.get("construct", [0, 0.0, 0.0])[2] / 1e6,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_isolated(scene_name, script, env=None):
+    """Run a scene in a fresh interpreter; its metrics are the last line of stdout."""
+    result = subprocess.run(
+        [sys.executable, str(ROOT / "run_benchmarks.py"), "--run-one", scene_name, "--script", script],
+        cwd=ROOT, capture_output=True, text=True, env=env,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{scene_name} failed:\n{result.stderr[-4000:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def regressions(scene_name, metrics, baseline):
+    """Messages for every metric past its threshold."""
+    found = []
+    for metric, allowed in THRESHOLDS.items():
+        old, new = baseline.get(metric), metrics.get(metric)
+        if not old or new is None:
+            continue
+        change = (new - old) / old
+        if (allowed < 0 and change < allowed) or (allowed > 0 and change > allowed):
+            found.append(f"{scene_name}: {metric} {old:.3f} -> {new:.3f} ({100 * change:+.1f}%, limit {100 * allowed:+.0f}%)")
+    return found
+
+
+def format_metric(value):
+    return "-" if value is None else f"{value:.2f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the benchmark scenes and check for regressions.")
+    parser.add_argument("scenes", nargs="*", help="Subset of benchmark scenes (default: all)")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--baseline", default=BASELINE, type=Path)
+    parser.add_argument("--allow-missing", action="store_true",
+                        help="Don't fail on scenes that have no baseline yet")
+    parser.add_argument("--run-one", help=argparse.SUPPRESS)
+    parser.add_argument("--script", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_one:
+        print(json.dumps(run_one(args.run_one, args.script or BENCHMARKS[args.run_one])))
+        return
+
+    scene_names = args.scenes or list(BENCHMARKS)
+    unknown = [name for name in scene_names if name not in BENCHMARKS]
+    if unknown:
+        sys.exit(f"Unknown benchmark scenes: {', '.join(unknown)}")
+    recorded = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    baseline = recorded.get("scenes", {})
+    machine = machine_info()
+    if baseline and recorded.get("machine") != machine:
+        print(f"Warning: baseline was recorded on {recorded.get('machine')}, this is {machine}")
+    missing = [name for name in scene_names if name not in baseline]
+    if missing and not (args.update_baseline or args.allow_missing):
+        # Without a baseline nothing can regress, so a silent pass would mean nothing
+        sys.exit(f"No baseline for {', '.join(missing)} in {args.baseline}; "
+                 "record one with --update-baseline (or pass --allow-missing)")
+
+    results = {}
+    failures = []
+    print(f"{'scene':<30} {'fps':>8} {'construct s':>12} {'peak RSS MB':>12}")
+    for scene_name in scene_names:
+        metrics = results[scene_name] = run_isolated(scene_name, BENCHMARKS[scene_name])
+        print(f"{scene_name:<30} {format_metric(metrics['fps']):>8} "
+              f"{format_metric(metrics['construct_s']):>12} {format_metric(metrics['peak_rss_mb']):>12}")
+        if scene_name in baseline:
+            failures += regressions(scene_name, metrics, baseline[scene_name])
+
+    if args.update_baseline:
+        # Scenes measured on another machine are dropped rather than mixed in
+        kept = baseline if recorded.get("machine") == machine else {}
+        args.baseline.write_text(json.dumps({"machine": machine, "scenes": {**kept, **results}}, indent=4) + "\n")
+        print(f"Baseline written to {args.baseline}")
+        return
+    if missing:
+        print(f"No baseline yet for {', '.join(missing)}; record one with --update-baseline")
+    if failures:
+        print("Regressions:\n  " + "\n  ".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+from manim import *
+from manim.scene.scene_file_writer import SceneFileWriter, to_av_frame_rate
+from manim.utils.file_ops import write_to_movie
+from multiprocessing import shared_memory
+import multiprocessing as mp
+from queue import Empty
+import numpy as np
+import atexit
+import os
+import time
+import av
+from pipelined_writer import install_file_writer
+
+# ==========================================
+# SHARED-MEMORY FRAME RING FOR A SEPARATE ENCODER PROCESS
+# ==========================================
+# The in-process writer thread shares the GIL with the rasterizer, and any
+# hand-off through a multiprocessing pipe pickles every 33 MB 4K frame. Here
+# the encoder is its own process: frames are copied once into a preallocated
+# ring of shared-memory slots, and only (slot, repeat count) messages cross
+# the pipe. The encoder wraps each slot as a NumPy view with no copy, hands it
+# to PyAV, and frees the slot; a semaphore of free slots gives back-pressure.
+#
+# Off by default: with FRAME_RING=1, SharedRingWriterMixin swaps in the ring
+# writer; otherwise the scene renders with manim's own writer. Set
+# FRAME_RING_SLOTS to change the ring size (default 4 frames).
+#
+#   FRAME_RING=1 manim -qk 3_How_Chatgpt_Works_1.py MultiColumnVocabularyScroll
+
+FRAME_RING = os.environ.get("FRAME_RING") == "1"
+FRAME_RING_SLOTS = int(os.environ.get("FRAME_RING_SLOTS", 4))
+ENCODER_POLL_SECONDS = 1.0   # How often a blocked rasterizer checks the encoder is alive
+
+
+class FrameRing:
+    """`slots` RGBA frames of `shape` in one shared-memory block, exposed as `frames[slot]`."""
+    def __init__(self, shape, slots, name=None):
+        self.shape = tuple(shape)
+        self.slots = slots
+        size = int(np.prod(self.shape)) * slots
+        self.shm = shared_memory.SharedMemory(name=name, create=name is None, size=size)
+        self.frames = np.ndarray((slots,) + self.shape, dtype=np.uint8, buffer=self.shm.buf)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def close(self, unlink=False):
+        self.frames = None  # Release the view before closing the mapping
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+def partial_movie_codec():
+    """Codec, pixel format and options SceneFileWriter uses for partial movies."""
+    codec, pix_fmt = "libx264", "yuv420p"
+    options = {"an": "1", "crf": "23"}
+    if config.movie_file_extension == ".webm":
+        codec = "libvpx-vp9"
+        options["-auto-alt-ref"] = "1"
+        if config.transparent:
+            pix_fmt = "yuva420p"
+    elif config.transparent:
+        codec, pix_fmt = "qtrle", "argb"
+    return codec, pix_fmt, options
+
+
+def run_encoder(ring_name, shape, slots, commands, free_slots, results):
+    """Encoder process: reads frames straight out of the ring and muxes them with PyAV."""
+    ring = FrameRing(shape, slots, name=ring_name)
+    container = stream = None
+    try:
+        while True:
+            command = commands.get()
+            kind = command[0]
+            if kind == "frame":
+                _, slot, num_frames = command
+                for _ in range(num_frames):
+                    av_frame = av.VideoFrame.from_ndarray(ring.frames[slot], format="rgba")
+                    for packet in stream.encode(av_frame):
+                        container.mux(packet)
+                free_slots.release()
+            elif kind == "open":
+                _, path, fps, width, height, codec, pix_fmt, options = command
+                container = av.open(path, mode="w")
+                stream = container.add_stream(codec, rate=fps, options=options)
+                stream.pix_fmt = pix_fmt
+                stream.width = width
+                stream.height = height
+            elif kind == "close":
+                for packet in stream.encode():
+                    container.mux(packet)
+                container.close()
+                results.put(command[1])
+            elif kind == "stop":
+                break
+    finally:
+        ring.close()
+
+
+class SharedRingFileWriter(SceneFileWriter):
+    """
+    SceneFileWriter whose partial movies are encoded by a separate process fed
+    through a FrameRing. One encoder process serves every animation of the scene.
+    """
+    def __init__(self, renderer, scene_name, **kwargs):
+        self.encoder = None
+        self.ring = None
+        self.ring_stats = {"frames": 0, "raster_stall": 0.0}
+        super().__init__(renderer, scene_name, **kwargs)
+
+    # --- Encoder process ---
+    def start_encoder(self):
+        shape = (config.pixel_height, config.pixel_width, 4)
+        self.ring = FrameRing(shape, FRAME_RING_SLOTS)
+        self.next_slot = 0
+        self.commands = mp.Queue()
+        self.results = mp.Queue()
+        self.free_slots = mp.Semaphore(FRAME_RING_SLOTS)
+        self.encoder = mp.Process(
+            target=run_encoder,
+            args=(self.ring.name, shape, FRAME_RING_SLOTS, self.commands, self.free_slots, self.results),
+            daemon=True,
+        )
+        self.encoder.start()
+        atexit.register(self.stop_encoder)
+
+    def stop_encoder(self):
+        if self.encoder is None:
+            return
+        if self.encoder.is_alive():
+            self.commands.put(("stop",))
+            self.encoder.join()
+        self.ring.close(unlink=True)
+        self.encoder = None
+
+    def check_encoder(self):
+        if not self.encoder.is_alive():
+            raise RuntimeError(f"Frame encoder process exited with code {self.encoder.exitcode}")
+
+    # --- Partial movies ---
+    def open_partial_movie_stream(self, file_path=None):
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.partial_movie_file_path = file_path
+        if self.encoder is None:
+            self.start_encoder()
+        fps = to_av_frame_rate(config.frame_rate)
+        self.commands.put(("open", str(file_path), fps, config.pixel_width, config.pixel_height, *self.partial_codec()))
+
+    def partial_codec(self):
+        """(codec, pix_fmt, options) for partial movies; LosslessPartials overrides it."""
+        return partial_movie_codec()
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        if not write_to_movie() or config.renderer != RendererType.CAIRO:
+            return super().write_frame(frame_or_renderer, num_frames)
+        start = time.perf_counter()
+        while not self.free_slots.acquire(timeout=ENCODER_POLL_SECONDS):
+            self.check_encoder()
+        self.ring_stats["raster_stall"] += time.perf_counter() - start
+        slot = self.next_slot
+        self.next_slot = (slot + 1) % FRAME_RING_SLOTS
+        np.copyto(self.ring.frames[slot], frame_or_renderer)
+        self.commands.put(("frame", slot, num_frames))
+        self.ring_stats["frames"] += num_frames
+
+    def close_partial_movie_stream(self):
+        self.commands.put(("close", str(self.partial_movie_file_path)))
+        while True:
+            try:
+                self.results.get(timeout=ENCODER_POLL_SECONDS)
+                break
+            except Empty:
+                self.check_encoder()
+        logger.info(
+            f"Animation {self.renderer.num_plays} : Partial movie file written in %(path)s",
+            {"path": f"'{self.partial_movie_file_path}'"},
+        )
+
+    def finish(self):
+        self.stop_encoder()
+        logger.info(
+            "Frame ring: %(frames)d frames, rasterizer waited %(stall).2fs for free slots",
+            {"frames": self.ring_stats["frames"], "stall": self.ring_stats["raster_stall"]},
+        )
+        super().finish()
+
+
+class SharedRingWriterMixin:
+    """
+    Put first in the bases (class MyScene(SharedRingWriterMixin, Scene)) so
+    that, with FRAME_RING=1, the scene encodes in a separate process through a
+    shared-memory frame ring.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if FRAME_RING:
+            install_file_writer(self, SharedRingFileWriter)
@@ -0,0 +1,95 @@
+import hashlib
+import re
+import unicodedata
+import numpy as np
+
+# ==========================================
+# SIMILARITY ENGINE: HASHED N-GRAMS + BATCHED COSINE
+# ==========================================
+# The similarity tables (SemanticTextSimilarity, MultiIntentSimilarity,
+# SemanticAgentRouting) show query x option cosine scores. They are computed
+# here, offline and deterministically, instead of being typed in as strings.
+# NumericalSimilarityMapping keeps illustrative scores: bare place names share
+# no wording, so this stand-in can't rank them.
+#
+# The embedding model is a stand-in: a hashed bag of word unigrams, word
+# bigrams and character 3-5-grams (stemming-like overlap such as
+# "climb" / "climbing"), sublinear term frequency and L2 normalisation.
+# Hashing uses blake2b, so vectors are identical across runs and machines.
+# Vectors are cached per process by text hash, and the full query x option
+# matrix is one matrix product. Scores are lexical, not semantic: they rank
+# options by shared wording, not by meaning.
+
+DIM = 2**14             # Hashed feature space; collisions are rare at this size
+CHAR_NGRAMS = (3, 4, 5)
+WORD_WEIGHT = 2.0       # Whole-word matches count more than shared fragments
+DTYPE = np.float32
+STOP_WORDS = {
+    "a", "an", "and", "are", "but", "can", "did", "do", "for", "how", "i", "in", "is", "it",
+    "of", "on", "or", "our", "the", "to", "we", "why", "would", "my", "they", "be", "very",
+}
+
+_VECTORS = {}  # Text hash -> embedding, per process
+
+
+def text_hash(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def tokenize(text):
+    """Lowercase, accent-stripped words without stop words."""
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii").lower()
+    return [word for word in re.findall(r"[a-z0-9]+", text) if word not in STOP_WORDS]
+
+
+def features(text):
+    """{feature: weight} for one text: words, word bigrams and padded character n-grams."""
+    words = tokenize(text)
+    counts = {}
+    for word in words:
+        counts[f"w:{word}"] = counts.get(f"w:{word}", 0) + WORD_WEIGHT
+        padded = f"<{word}>"
+        for n in CHAR_NGRAMS:
+            for start in range(len(padded) - n + 1):
+                gram = f"c:{padded[start:start + n]}"
+                counts[gram] = counts.get(gram, 0) + 1
+    for first, second in zip(words, words[1:]):
+        counts[f"b:{first} {second}"] = counts.get(f"b:{first} {second}", 0) + WORD_WEIGHT
+    return counts
+
+
+def embed_one(text):
+    vector = np.zeros(DIM, dtype=DTYPE)
+    for feature, count in features(text).items():
+        digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+        index = int.from_bytes(digest[:4], "little") % DIM
+        sign = 1 if digest[4] & 1 else -1  # Signed hashing: collisions cancel instead of adding up
+        vector[index] += sign * (1 + np.log(count))
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def embed(texts):
+    """(len(texts), DIM) matrix of unit vectors, cached by text hash."""
+    rows = []
+    for text in texts:
+        key = text_hash(text)
+        if key not in _VECTORS:
+            _VECTORS[key] = embed_one(text)
+        rows.append(_VECTORS[key])
+    return np.stack(rows)
+
+
+def cosine_matrix(queries, options):
+    """Cosine similarity of every query against every option, (len(queries), len(options))."""
+    return np.clip(embed(queries) @ embed(options).T, -1.0, 1.0)
+
+
+def score_options(query, options):
+    """(scores, winner index) for one query."""
+    scores = cosine_matrix([query], options)[0]
+    return scores, int(scores.argmax())
+
+
+def format_score(score):
+    return f"{score:.2f}"
@@ -0,0 +1,201 @@
+from manim import *
+from pathlib import Path
+import argparse
+import json
+import os
+import random
+import numpy as np
+from decimated_updater import add_decimated_updater, drift_updater
+from lagged_map import LaggedMap
+from mesh_lod import lod_sphere
+from run_benchmarks import load_from_script, run_isolated
+
+# ==========================================
+# PARAMETRIC STRESS SCENES AND SCALING SWEEP
+# ==========================================
+# Every production scene has a fixed size (5x5 attention, 8 chunks, 12
+# spheres, 800 dots), so they can't tell us how render cost grows with
+# content. These scenes rebuild the same components at a size N taken from
+# STRESS_N, with the same fixed ~4 s of animation at every N:
+#
+#   StressAttentionGrid   N x N AttentionCell grid, one row highlighted
+#   StressRetrievalTable  N-row MobjectTable of chunks and similarity scores
+#   StressParticles       N drifting background particles
+#   StressSpheres         N 3D spheres under a rotating camera
+#   StressVocabulary      N vocabulary words scrolling past
+#
+# Running this file sweeps N for each scene (one process per run, through
+# run_benchmarks.py), fits time and peak memory against N on a log-log scale
+# and flags exponents above SUPERLINEAR_EXPONENT. Results go to
+# media/stress/scaling.json, plus scaling.png when matplotlib is installed.
+#
+#   python stress_scenes.py
+#   python stress_scenes.py StressAttentionGrid --sizes 4,8,16,32,64
+#   STRESS_N=32 manim -ql stress_scenes.py StressAttentionGrid
+
+STRESS_N = int(os.environ.get("STRESS_N", 8))
+SUPERLINEAR_EXPONENT = 1.2
+
+DEFAULT_SIZES = {
+    "StressAttentionGrid": (4, 8, 16, 32),
+    "StressRetrievalTable": (5, 10, 20, 40),
+    "StressParticles": (100, 400, 1600, 6400),
+    "StressSpheres": (6, 12, 24, 48, 96),
+    "StressVocabulary": (50, 100, 200, 400, 800),
+}
+
+PRIMARY_COLOR = "#db2777"
+TEXT_COLOR = "#1f2937"
+GRID_COLOR = "#e5e7eb"
+FILLERS = ["apple", "book", "cloud", "desk", "echo", "forest", "gate", "hill", "ice", "jump", "kite", "lamp"]
+
+# Loaded once at import, so executing the script is not part of the measured render
+AttentionCell = load_from_script("3_How_Chatgpt_Works_2.py", "AttentionCell")
+
+
+class StressAttentionGrid(Scene):
+    def construct(self):
+        self.camera.background_color = WHITE
+        size = 6.5 / STRESS_N
+        cells = [[AttentionCell(round(random.random(), 2), size=size) for _ in range(STRESS_N)] for _ in range(STRESS_N)]
+        grid = VGroup(*[cell for row in cells for cell in row]).arrange_in_grid(rows=STRESS_N, buff=0)
+        # Text scales with the cell so the label stays inside it
+        for cell in grid:
+            cell.label.scale_to_fit_height(size * 0.3)
+
+        self.play(LaggedMap(FadeIn, grid, lag_ratio=0.01), run_time=1.5)
+        row = STRESS_N // 2
+        self.play(*[cell.get_highlight_animation() for cell in cells[row]], run_time=1)
+        self.play(*[cell.get_text_highlight() for cell in cells[row]], run_time=0.5)
+        self.wait(1)
+
+
+class StressRetrievalTable(Scene):
+    def construct(self):
+        self.camera.background_color = WHITE
+        rows = [
+            [Text(f"Chunk {i:03}: " + " ".join(random.choices(FILLERS, k=4)), color=TEXT_COLOR, font_size=24),
+             Text(f"{random.random():.2f}", color=PRIMARY_COLOR, font_size=24)]
+            for i in range(STRESS_N)
+        ]
+        table = MobjectTable(
+            rows,
+            col_labels=[Text("Retrieved Chunk", color=TEXT_COLOR, font_size=28),
+                        Text("Score", color=TEXT_COLOR, font_size=28)],
+            include_outer_lines=True,
+            line_config={"color": GRID_COLOR, "stroke_width": 2},
+            h_buff=0.7, v_buff=0.3,
+        )
+        table.scale_to_fit_height(min(7.5, table.height))
+
+        self.play(Create(table.get_horizontal_lines()), Create(table.get_vertical_lines()), run_time=1)
+        self.play(FadeIn(table.get_entries()), run_time=1)
+        best = table.get_rows()[1 + STRESS_N // 2]
+        self.play(best.animate.set_color(PRIMARY_COLOR), run_time=1)
+        self.wait(1)
+
+
+class StressParticles(Scene):
+    def construct(self):
+        self.camera.background_color = WHITE
+        particles = VGroup(*[
+            Circle(radius=random.uniform(0.05, 0.2), fill_color=PRIMARY_COLOR,
+                   fill_opacity=random.uniform(0.05, 0.15), stroke_width=0)
+            .move_to([random.uniform(-7, 7), random.uniform(-4, 4), 0])
+            for _ in range(STRESS_N)
+        ])
+        velocities = np.random.uniform(-0.15, 0.15, (STRESS_N, 3)) * [1, 1, 0]
+        add_decimated_updater(particles, drift_updater(velocities))
+        self.add(particles)
+        title = Text("Ambient particles", color=TEXT_COLOR, font_size=36)
+        self.play(Write(title), run_time=1)
+        self.wait(3)
+
+
+class StressSpheres(ThreeDScene):
+    def construct(self):
+        self.set_camera_orientation(phi=65 * DEGREES, theta=-45 * DEGREES)
+        spheres = Group(*[
+            lod_sphere(center=np.random.uniform(-3, 3, 3), radius=0.1, resolution=(10, 10), color=PRIMARY_COLOR)
+            for _ in range(STRESS_N)
+        ])
+        self.play(FadeIn(spheres), run_time=1)
+        self.move_camera(theta=45 * DEGREES, run_time=3)
+
+
+class StressVocabulary(Scene):
+    def construct(self):
+        self.camera.background_color = WHITE
+        words = VGroup(*[
+            Text(random.choice(FILLERS), font_size=16, color=TEXT_COLOR, fill_opacity=0.5)
+            for _ in range(STRESS_N)
+        ])
+        columns = max(1, round(np.sqrt(STRESS_N / 8)))  # Columns grow as sqrt(N), so the scroll stays tall
+        words.arrange_in_grid(cols=columns, buff=(0.6, 0.35))
+        words.next_to(config.bottom, DOWN)
+        self.add(words)
+        self.play(words.animate.next_to(config.top, UP), run_time=4, rate_func=linear)
+
+
+# --- Sweep ---
+def fit_exponent(sizes, values):
+    """Slope of log(value) against log(N): 1 is linear, 2 quadratic."""
+    return float(np.polyfit(np.log(sizes), np.log(values), 1)[0])
+
+
+def plot_scaling(results, path):
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        return False
+    fig, (time_axis, memory_axis) = plt.subplots(1, 2, figsize=(12, 5))
+    for scene_name, runs in results.items():
+        sizes = [run["n"] for run in runs]
+        time_axis.loglog(sizes, [run["wall_s"] for run in runs], "o-", label=scene_name)
+        if all(run["peak_rss_mb"] for run in runs):
+            memory_axis.loglog(sizes, [run["peak_rss_mb"] for run in runs], "o-", label=scene_name)
+    time_axis.set(xlabel="N", ylabel="render time (s)", title="Time vs size")
+    memory_axis.set(xlabel="N", ylabel="peak RSS (MB)", title="Memory vs size")
+    time_axis.legend()
+    fig.tight_layout()
+    fig.savefig(path)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep the stress scenes over N and fit scaling exponents.")
+    parser.add_argument("scenes", nargs="*", help="Subset of stress scenes (default: all)")
+    parser.add_argument("--sizes", help="Comma-separated N values (default: per scene)")
+    parser.add_argument("--media_dir", default="media")
+    args = parser.parse_args()
+
+    results = {}
+    for scene_name in args.scenes or list(DEFAULT_SIZES):
+        sizes = [int(n) for n in args.sizes.split(",")] if args.sizes else DEFAULT_SIZES[scene_name]
+        runs = results[scene_name] = []
+        for n in sizes:
+            metrics = run_isolated(scene_name, "stress_scenes.py", env=dict(os.environ, STRESS_N=str(n)))
+            runs.append({"n": n, **metrics})
+            print(f"{scene_name:<22} N={n:<6} {metrics['wall_s']:>8.2f}s "
+                  f"construct {metrics['construct_s']:>7.2f}s  peak {metrics['peak_rss_mb'] or 0:>7.0f} MB")
+        time_exponent = fit_exponent(sizes, [run["wall_s"] for run in runs])
+        line = f"{scene_name}: time ~ N^{time_exponent:.2f}"
+        if all(run["peak_rss_mb"] for run in runs):
+            line += f", memory ~ N^{fit_exponent(sizes, [run['peak_rss_mb'] for run in runs]):.2f}"
+        if time_exponent > SUPERLINEAR_EXPONENT:
+            line += "  <-- superlinear"
+        print(line)
+
+    out_dir = Path(args.media_dir) / "stress"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / "scaling.json").write_text(json.dumps(results, indent=2) + "\n")
+    if plot_scaling(results, out_dir / "scaling.png"):
+        print(f"Plot written to {out_dir / 'scaling.png'}")
+    else:
+        print("Install matplotlib for scaling.png; raw numbers are in scaling.json")
+
+
+if __name__ == "__main__":
+    main()